@@ -0,0 +1,138 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+# Where answers are persisted, how long they stay valid and how many are kept
+CACHE_DIR = os.getenv("PALESTINE_AI_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+ANSWER_CACHE_PATH = os.getenv("ANSWER_CACHE_PATH", os.path.join(CACHE_DIR, "answers.sqlite3"))
+ANSWER_CACHE_TTL = int(os.getenv("ANSWER_CACHE_TTL", 7 * 24 * 3600))
+ANSWER_CACHE_MEMORY_ENTRIES = int(os.getenv("ANSWER_CACHE_MEMORY_ENTRIES", 256))
+ANSWER_CACHE_DISK_ENTRIES = int(os.getenv("ANSWER_CACHE_DISK_ENTRIES", 5000))
+
+# Arabic harakat, Quranic annotation marks, superscript alef and tatweel
+ARABIC_DIACRITICS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]")
+PUNCTUATION = re.compile(r"[^\w\s]|_")
+
+
+# Function to reduce a question to the form used as cache key
+def normalize_question(question):
+    text = unicodedata.normalize("NFKC", question).casefold()
+    text = ARABIC_DIACRITICS.sub("", text)
+    text = PUNCTUATION.sub(" ", text)
+    return " ".join(text.split())
+
+
+# Function to derive a namespace from whatever shapes the answer (model, prompt template)
+def cache_namespace(*parts):
+    digest = hashlib.sha1("\0".join(str(part) for part in parts).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+# Answer cache with an in-memory LRU in front of an on-disk SQLite store
+class AnswerCache:
+    def __init__(self, path=ANSWER_CACHE_PATH, ttl=ANSWER_CACHE_TTL,
+                 memory_entries=ANSWER_CACHE_MEMORY_ENTRIES, disk_entries=ANSWER_CACHE_DISK_ENTRIES):
+        self.ttl = ttl
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "key TEXT PRIMARY KEY, answer TEXT NOT NULL, "
+                "created REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS answers_last_access ON answers (last_access)")
+            self._db.commit()
+        except sqlite3.Error:
+            # Keep serving from memory if the disk store is unavailable
+            self._db = None
+
+    def _key(self, question, namespace):
+        return f"{namespace}:{normalize_question(question)}"
+
+    def get(self, question, namespace=""):
+        key = self._key(question, namespace)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                answer, created = entry
+                if now - created < self.ttl:
+                    self._memory.move_to_end(key)
+                    return answer
+                del self._memory[key]
+
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute(
+                    "SELECT answer, created FROM answers WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                answer, created = row
+                if now - created >= self.ttl:
+                    self._db.execute("DELETE FROM answers WHERE key = ?", (key,))
+                    self._db.commit()
+                    return None
+                self._db.execute("UPDATE answers SET last_access = ? WHERE key = ?", (now, key))
+                self._db.commit()
+            except sqlite3.Error:
+                return None
+
+            self._remember(key, answer, created)
+            return answer
+
+    def put(self, question, answer, namespace=""):
+        key = self._key(question, namespace)
+        now = time.time()
+        with self._lock:
+            self._remember(key, answer, now)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO answers (key, answer, created, last_access) VALUES (?, ?, ?, ?)",
+                    (key, answer, now, now)
+                )
+                # Drop expired rows, then the least recently used ones above the cap
+                self._db.execute("DELETE FROM answers WHERE created <= ?", (now - self.ttl,))
+                self._db.execute(
+                    "DELETE FROM answers WHERE key IN ("
+                    "SELECT key FROM answers ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.disk_entries,)
+                )
+                self._db.commit()
+            except sqlite3.Error:
+                pass
+
+    def _remember(self, key, answer, created):
+        self._memory[key] = (answer, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+
+_answer_cache = None
+_answer_cache_lock = threading.Lock()
+
+
+# Function to get the process-wide answer cache shared by every session
+def get_answer_cache():
+    global _answer_cache
+    if _answer_cache is None:
+        with _answer_cache_lock:
+            if _answer_cache is None:
+                _answer_cache = AnswerCache()
+    return _answer_cache
@@ -0,0 +1,162 @@
+import csv
+import io
+import re
+import unicodedata
+from bisect import bisect_right
+from itertools import accumulate
+
+from brand_graph import ALIAS_SEPARATORS, get_brand_graph
+from datasets import cached_per_version, get_dataset
+from topic_gate import normalize_text, trie_regex
+
+# Combining accents left by NFKD (including the Arabic hamza marks) and the punctuation dropped
+# inside names; every other non-word character becomes a space, newlines are kept
+COMBINING_MARKS = re.compile("[\u0300-\u036f\u0654\u0655]")
+NAME_PUNCTUATION = re.compile("['’&]")
+TEXT_SEPARATORS = re.compile(r"[^\w\n]+|_")
+WHITESPACE = re.compile(r"\s+")
+
+# EAN-13 barcodes whose GS1 prefix is 729 were issued to companies registered in Israel
+ISRAELI_GS1_PREFIX = "729"
+
+STATUS_BOYCOTT = "Boycott"
+STATUS_ISRAELI_BARCODE = "Israeli barcode (GS1 729)"
+STATUS_NOT_LISTED = "Not on the list"
+RESULT_COLUMNS = ["Line", "Item", "Status", "Company", "Owned via", "Category", "Alternatives"]
+
+# Names that are also everyday words ("apple juice", "cos lettuce"): they only count when the line
+# is the name alone or also has one of the words that place it in the brand's line of business
+GENERIC_NAMES = {
+    "apple": {"iphone", "ipad", "ipod", "imac", "mac", "macbook", "airpods", "airtag", "watch", "tv", "music",
+              "pencil", "charger", "cable", "icloud", "store"},
+    "beats": {"headphones", "headphone", "earbuds", "earphones", "speaker", "studio", "solo", "pill", "flex"},
+    "bing": {"search", "microsoft"},
+    "caterpillar": {"boots", "boot", "shoes", "workwear", "machinery", "excavator", "bulldozer", "cat"},
+    "cos": {"clothing", "clothes", "dress", "shirt", "top", "trousers", "coat", "jacket", "knit", "sweater",
+            "jumper", "store"},
+    "hp": {"laptop", "printer", "ink", "toner", "computer", "notebook", "pavilion", "envy", "omen"},
+    "other stories": {"clothing", "clothes", "dress", "shirt", "top", "skirt", "store"},
+    "puma": {"shoes", "sneakers", "trainers", "shirt", "tshirt", "shorts", "hoodie", "jacket", "socks",
+             "sportswear", "football", "boots"},
+    "weekday": {"jeans", "denim", "clothing", "clothes", "shirt", "jacket", "store"},
+}
+
+
+# Function to fold free text the same way names are folded, keeping word boundaries and line breaks
+def fold_text(text):
+    text = unicodedata.normalize("NFKD", normalize_text(text))
+    text = COMBINING_MARKS.sub("", text)
+    return TEXT_SEPARATORS.sub(" ", NAME_PUNCTUATION.sub("", text))
+
+
+# Function to check the GS1 check digit of an EAN-13 barcode
+def valid_ean13(digits):
+    total = sum(int(digit) * (3 if position % 2 else 1) for position, digit in enumerate(digits[:12]))
+    return (10 - total % 10) % 10 == int(digits[12])
+
+
+# Matcher for whole shopping lists: every company name, alias and owned brand of a boycott dataset
+# compiled into one regex together with an EAN-13 branch, run once over the folded text
+class BatchMatcher:
+    def __init__(self, boycott_data, brands, brand_graph):
+        # Folded names with their spaces, and the same names written together
+        self._targets = {}
+        self._compact_targets = {}
+        for category, data in boycott_data.items():
+            for company in data["companies"]:
+                names = [company["name"], *ALIAS_SEPARATORS.split(company["name"]), *company.get("aliases", ())]
+                for name in names:
+                    self._add(name, (company, [company["name"]], category))
+        for brand in brands:
+            ownership = brand_graph.lookup(brand["name"])
+            if ownership and ownership["company"] is not None:
+                for name in [brand["name"], *brand.get("aliases", ())]:
+                    self._add(name, (ownership["company"], ownership["path"], ownership["category"]))
+        # Tokens may be written apart or together ("coca cola", "cocacola")
+        names = trie_regex((key.split(" ") for key in self._targets), r"\s*")
+        self._pattern = re.compile(rf"(?<!\w)(?:(?P<barcode>\d{{13}})|(?P<name>{names}))(?!\w)")
+
+    def _add(self, name, target):
+        tokens = fold_text(name).split()
+        if tokens:
+            # The company's own names were added first and win over brand names
+            self._targets.setdefault(" ".join(tokens), target)
+            self._compact_targets.setdefault("".join(tokens), target)
+
+    def _target(self, matched, line_words):
+        key = " ".join(matched.split())
+        context = GENERIC_NAMES.get(key)
+        if context is not None:
+            other_words = line_words.difference(key.split())
+            if other_words and other_words.isdisjoint(context):
+                return None
+        return self._targets.get(key) or self._compact_targets.get(WHITESPACE.sub("", matched))
+
+    # Function to check every line of a text; returns one result row (a dict keyed by RESULT_COLUMNS) per non-empty line
+    def check(self, text):
+        lines = text.splitlines()
+        folded = fold_text("\n".join(lines))
+        folded_lines = folded.split("\n")
+        line_starts = list(accumulate((len(line) + 1 for line in folded_lines), initial=0))
+
+        found = {}
+        line_words = {}
+        for match in self._pattern.finditer(folded):
+            line_number = bisect_right(line_starts, match.start()) - 1
+            hits = found.setdefault(line_number, [])
+            barcode = match.group("barcode")
+            if barcode is not None:
+                if barcode.startswith(ISRAELI_GS1_PREFIX) and valid_ean13(barcode):
+                    hits.append(None)
+            else:
+                if line_number not in line_words:
+                    line_words[line_number] = set(folded_lines[line_number].split())
+                target = self._target(match.group("name"), line_words[line_number])
+                if target is not None:
+                    hits.append(target)
+
+        rows = []
+        for line_number, line in enumerate(lines):
+            item = line.strip()
+            if not item:
+                continue
+            hits = found.get(line_number, ())
+            # Every brand the line names, once per ownership path ("Doritos, Lay's": both PepsiCo brands)
+            targets = list({(id(target[0]), tuple(target[1])): target for target in hits if target is not None}.values())
+            companies = list({id(company): company for company, _, _ in targets}.values())
+            if targets:
+                status = STATUS_BOYCOTT
+            elif hits:
+                status = STATUS_ISRAELI_BARCODE
+            else:
+                status = STATUS_NOT_LISTED
+            rows.append({
+                "Line": line_number + 1,
+                "Item": item,
+                "Status": status,
+                "Company": "; ".join(company["name"] for company in companies),
+                "Owned via": "; ".join(" → ".join(path) for _, path, _ in targets if len(path) > 1),
+                "Category": "; ".join(dict.fromkeys(category for _, _, category in targets)),
+                "Alternatives": "; ".join(", ".join(company["alternatives"]) for company in companies),
+            })
+        return rows
+
+
+# Function to get the batch matcher of a boycott dataset, rebuilt only when the data changes
+@cached_per_version
+def get_batch_matcher(dataset_name):
+    return BatchMatcher(get_dataset(dataset_name), get_dataset("brands")["brands"], get_brand_graph(dataset_name))
+
+
+# Function to check a shopping list, or the rows of a CSV of product names or barcodes, against a boycott dataset
+def check_shopping_list(dataset_name, text):
+    return get_batch_matcher(dataset_name).check(text)
+
+
+# Function to write result rows as CSV bytes (UTF-8 with BOM so spreadsheet apps show Arabic correctly)
+def results_to_csv(rows):
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=RESULT_COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue().encode("utf-8-sig")
@@ -0,0 +1,131 @@
+import timeit
+
+from topic_gate import is_palestine_related, match_palestine_keywords
+
+# Keyword list used by the original substring loop
+LEGACY_KEYWORDS = [
+    "palestine", "palestinian", "gaza", "west bank", "jerusalem", "al-quds",
+    "israel", "israeli", "occupation", "intifada", "nakba", "hamas", "fatah",
+    "plo", "bds", "boycott", "settlement", "settler", "zionism", "zionist",
+    "al-aqsa", "dome of rock", "hebron", "ramallah", "bethlehem", "nablus",
+    "jenin", "rafah", "khan younis", "unrwa", "refugee", "right of return",
+    "oslo", "two-state", "one-state", "apartheid", "wall", "barrier",
+    "checkpoint", "blockade", "olive", "resistance", "martyr", "shahid",
+    "idf", "arab", "middle east", "levant", "holy land", "balfour",
+    "1948", "1967", "intifada", "uprising", "protest", "demonstration",
+    "solidarity", "human rights", "international law", "un resolution",
+    "occupation", "colonization", "annexation", "displacement", "demolition",
+    "prisoner", "detention", "administrative detention", "hunger strike",
+    "flotilla", "aid", "humanitarian", "ceasefire", "peace process",
+    "negotiation", "mediation", "conflict", "war", "attack", "bombing",
+    "airstrike", "rocket", "tunnel", "border", "crossing", "siege",
+    "sanction", "embargo", "economy", "water", "electricity", "infrastructure",
+    "education", "health", "culture", "heritage", "identity", "diaspora",
+    "return", "citizenship", "stateless", "nationality", "flag", "keffiyeh",
+    "olive tree", "key", "map", "border", "1948", "1967", "partition",
+    "resolution", "un", "unesco", "icj", "icc", "amnesty", "hrw", "btselem",
+    "pchr", "al haq", "adalah", "badil", "passia", "miftah", "pngo",
+    "pflp", "dflp", "jihad", "islamic", "christian", "muslim", "jew",
+    "holy site", "temple mount", "haram al-sharif", "church of nativity",
+    "ibrahimi mosque", "cave of patriarchs", "rachel's tomb", "joseph's tomb",
+    "from the river to the sea", "free palestine", "save palestine"
+]
+
+# Queries covering an early hit, a late hit, an Arabic query and off-topic ones
+QUERIES = {
+    "early hit": "What happened in Gaza during the 2014 war?",
+    "late hit": "I would like to read a long and careful explanation of the events around the Balfour declaration",
+    "arabic": "ما هو حق العودة للاجئين الفلسطينيين؟",
+    "off-topic": "He said the keyboard was under the desk, what an award-winning fun setup",
+    "long miss": "What is the best fertilizer for tomatoes and cucumbers in a small vegetable garden? " * 3,
+}
+
+
+# Real questions the gate must let through, and everyday ones it must turn away
+ON_TOPIC = [
+    "What were the Oslo Accords?",
+    "settler violence in the occupied territories",
+    "history of the refugees in Lebanon camps",
+    "What do Gazans eat?",
+    "How long does it take to cross a checkpoint near Qalandia?",
+    "Is Israel an apartheid state?",
+    "Why are settlements illegal under international law?",
+    "What is life like under military occupation?",
+    "Tell me about the Nakba",
+    "Which companies should I boycott?",
+    "What is the right of return?",
+    "Explain the Balfour Declaration",
+    "What happened in Jenin camp in 2002?",
+    "Who are the Jerusalemites and what is their residency status?",
+    "ما هو حق العودة للاجئين الفلسطينيين؟",
+    "ماذا حدث في مخيم جنين؟",
+    "ما هي اتفاقية أوسلو؟",
+    "لماذا يعيش اللاجئون في المخيمات؟",
+    "When was the Dome of the Rock built?",
+    "Can I visit the Church of the Nativity at Christmas?",
+    "What happened at the Cave of the Patriarchs in 1994?",
+    "Who was Yasser Arafat?",
+    "Why are families being evicted in Sheikh Jarrah?",
+    "What has Netanyahu said about a ceasefire?",
+    "من هو ياسر عرفات؟",
+    "ماذا يحدث في حي الشيخ جراح؟",
+]
+OFF_TOPIC = [
+    "He said the keyboard was under the desk, what an award-winning fun setup",
+    "What is the best fertilizer for tomatoes?",
+    "How do I bake sourdough bread?",
+    "Explain how a car engine works",
+    "Who won the football world cup in 2018?",
+    "Write a poem about autumn leaves",
+    "ما هي أفضل طريقة لتعلم البرمجة؟",
+]
+
+# Original implementation: one substring check per keyword
+def legacy_is_palestine_related(query):
+    query_lower = query.lower()
+    for keyword in LEGACY_KEYWORDS:
+        if keyword in query_lower:
+            return True
+    return False
+
+
+# Collecting every match with the loop means scanning the query once per keyword
+def legacy_match_keywords(query):
+    query_lower = query.lower()
+    return [keyword for keyword in dict.fromkeys(LEGACY_KEYWORDS) if keyword in query_lower]
+
+
+def bench(func, query, number=20000):
+    best = min(timeit.repeat(lambda: func(query), number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main():
+    print(f"{'query':<10} {'loop gate':>10} {'new gate':>10} {'loop match':>11} {'new match':>10}  (microseconds per call)")
+    for name, query in QUERIES.items():
+        print(
+            f"{name:<10} "
+            f"{bench(legacy_is_palestine_related, query):>10.2f} "
+            f"{bench(is_palestine_related, query):>10.2f} "
+            f"{bench(legacy_match_keywords, query):>11.2f} "
+            f"{bench(match_palestine_keywords, query):>10.2f}"
+        )
+
+    print()
+    print(f"{'query':<10} {'loop says':>10} {'new says':>10}  loop keywords -> new keywords")
+    for name, query in QUERIES.items():
+        print(
+            f"{name:<10} {str(legacy_is_palestine_related(query)):>10} {str(is_palestine_related(query)):>10}  "
+            f"{legacy_match_keywords(query)} -> {match_palestine_keywords(query)}"
+        )
+
+    print()
+    for label, queries, expected in (("on-topic", ON_TOPIC, True), ("off-topic", OFF_TOPIC, False)):
+        wrong = [query for query in queries if is_palestine_related(query) != expected]
+        print(f"{label}: {len(queries) - len(wrong)}/{len(queries)} correct")
+        for query in wrong:
+            print(f"  wrong: {query} {match_palestine_keywords(query)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import re
+import unicodedata
+from array import array
+from collections import deque
+
+from datasets import cached_per_version, get_dataset
+from topic_gate import normalize_text
+
+# Characters dropped inside names (McDonald's, H&M) and the separators between alternative names
+NAME_PUNCTUATION = re.compile("['’&]")
+NAME_SEPARATORS = re.compile(r"\W+|_")
+ALIAS_SEPARATORS = re.compile(r"[/(),]")
+
+# Marks "no node" in the uint32 arrays below
+NO_NODE = 0xFFFFFFFF
+
+
+# Function to fold a company name to its lookup key: case, accents, Arabic letter forms,
+# punctuation and spaces removed, so "Nestlé", "nestle" and "NESTLE" share one key
+def fold_name(text):
+    text = unicodedata.normalize("NFKD", normalize_text(text))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return NAME_SEPARATORS.sub("", NAME_PUNCTUATION.sub("", text))
+
+
+# Function to list the lookup keys of a company or brand: its name, each part of a compound name and its aliases
+def name_keys(record):
+    names = [record["name"], *ALIAS_SEPARATORS.split(record["name"]), *record.get("aliases", ())]
+    return {key for key in map(fold_name, names) if key}
+
+
+# Function to pack (from, to) edges into compressed sparse rows: node v's targets are
+# targets[offsets[v]:offsets[v + 1]]
+def compressed_rows(edges, node_count):
+    offsets = array("I", bytes(4 * (node_count + 1)))
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+    targets = array("I", bytes(4 * len(edges)))
+    filled = array("I", offsets[:-1])
+    for source, target in edges:
+        targets[filled[source]] = target
+        filled[source] += 1
+    return offsets, targets
+
+
+# Ownership graph of brands and companies. Names are the only hash map; the edges
+# (brand -> parents, company -> subsidiaries) live in uint32 compressed sparse rows, and a
+# breadth-first pass from the boycotted companies down to everything they own stores, per node,
+# the nearest boycotted owner and the next hop towards it. A lookup is then a hash probe and two
+# array reads, plus one read per hop to spell out the path.
+class BrandGraph:
+    def __init__(self, boycott_data, brands):
+        self.names = []
+        self._ids = {}
+        # Boycotted companies, numbered in the order they appear in the boycott data
+        self.listed = []
+        listed_nodes = []
+        for category, data in boycott_data.items():
+            for company in data["companies"]:
+                self.listed.append((category, company))
+                listed_nodes.append(self._node(company))
+
+        edges = set()
+        for brand in brands:
+            node = self._node(brand)
+            for parent in brand.get("parents", ()):
+                parent_node = self._node({"name": parent})
+                if parent_node != node:
+                    edges.add((node, parent_node))
+        edges = sorted(edges)
+        node_count = len(self.names)
+        self._parent_offsets, self._parents = compressed_rows(edges, node_count)
+        self._child_offsets, self._children = compressed_rows([(parent, child) for child, parent in edges], node_count)
+
+        self._owner = array("I", [NO_NODE]) * node_count
+        self._next_hop = array("I", [NO_NODE]) * node_count
+        self._listed_number = array("I", [NO_NODE]) * node_count
+        queue = deque()
+        for number, node in enumerate(listed_nodes):
+            if self._owner[node] == NO_NODE:
+                self._listed_number[node] = number
+                self._owner[node] = node
+                queue.append(node)
+        while queue:
+            node = queue.popleft()
+            for child in self._children[self._child_offsets[node]:self._child_offsets[node + 1]]:
+                if self._owner[child] == NO_NODE:
+                    self._owner[child] = self._owner[node]
+                    self._next_hop[child] = node
+                    queue.append(child)
+
+    def _node(self, record):
+        keys = name_keys(record)
+        node = next((self._ids[key] for key in keys if key in self._ids), None)
+        if node is None:
+            node = len(self.names)
+            self.names.append(record["name"])
+        for key in keys:
+            self._ids.setdefault(key, node)
+        return node
+
+    # Function to resolve a brand or company name: None if unknown, otherwise a dict with the
+    # ownership path up to the nearest boycotted company ([name] alone if it is not boycotted)
+    # and that company with its category
+    def lookup(self, name):
+        node = self._ids.get(fold_name(name))
+        if node is None:
+            return None
+        owner = self._owner[node]
+        path = [self.names[node]]
+        if owner == NO_NODE:
+            return {"brand": self.names[node], "path": path, "category": None, "company": None}
+        while node != owner:
+            node = self._next_hop[node]
+            path.append(self.names[node])
+        category, company = self.listed[self._listed_number[owner]]
+        return {"brand": path[0], "path": path, "category": category, "company": company}
+
+    # Function to list the direct owners of a brand
+    def owners(self, name):
+        node = self._ids.get(fold_name(name))
+        if node is None:
+            return []
+        return [self.names[parent] for parent in self._parents[self._parent_offsets[node]:self._parent_offsets[node + 1]]]
+
+    # Function to list everything a company owns, directly or through its subsidiaries
+    def subsidiaries(self, name):
+        node = self._ids.get(fold_name(name))
+        if node is None:
+            return []
+        found = []
+        seen = {node}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for child in self._children[self._child_offsets[current]:self._child_offsets[current + 1]]:
+                if child not in seen:
+                    seen.add(child)
+                    found.append(self.names[child])
+                    stack.append(child)
+        return found
+
+    # Function to yield (listed company number, name key) for every name and alias of a brand
+    # owned by a boycotted company
+    def owned_brand_keys(self):
+        for key, node in self._ids.items():
+            owner = self._owner[node]
+            if owner != NO_NODE and owner != node:
+                yield self._listed_number[owner], key
+
+
+# Function to get the brand graph of a boycott dataset, rebuilt only when the data changes
+@cached_per_version
+def get_brand_graph(dataset_name):
+    return BrandGraph(get_dataset(dataset_name), get_dataset("brands")["brands"])
+
+
+# Function to look up a brand against a boycott dataset, e.g. lookup_brand("boycott_en", "Sprite")
+def lookup_brand(dataset_name, name):
+    return get_brand_graph(dataset_name).lookup(name)
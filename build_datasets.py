@@ -0,0 +1,18 @@
+import argparse
+
+from datasets import DATA_DIR, DATA_SNAPSHOT_PATH, compile_snapshot, write_snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the boycott and education JSON files into the snapshot the apps load.")
+    parser.add_argument("--data-dir", default=DATA_DIR, help=f"directory of dataset JSON files (default: {DATA_DIR})")
+    parser.add_argument("--output", default=DATA_SNAPSHOT_PATH, help=f"snapshot file to write (default: {DATA_SNAPSHOT_PATH})")
+    args = parser.parse_args(argv)
+
+    snapshot = compile_snapshot(args.data_dir)
+    write_snapshot(snapshot, args.output)
+    print(f"Compiled {len(snapshot['datasets'])} datasets (version {snapshot['version']}) into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+import zlib
+
+from answer_cache import CACHE_DIR
+from session_store import SessionStore
+
+# Where older chat messages are spilled, how many recent messages a session keeps in memory,
+# how many messages make up one spilled page (one "load earlier" step) and the cap on the whole store
+CHAT_DIR = os.getenv("CHAT_DIR", os.path.join(CACHE_DIR, "chats"))
+CHAT_WINDOW = int(os.getenv("CHAT_WINDOW", 20))
+CHAT_PAGE_SIZE = int(os.getenv("CHAT_PAGE_SIZE", 10))
+CHAT_MAX_TOTAL_BYTES = int(os.getenv("CHAT_MAX_TOTAL_BYTES", 256 * 1024 * 1024))
+CHAT_COMPRESSION_LEVEL = 6
+
+
+# On-disk store for spilled chat pages: one directory per session, one zlib-compressed JSON file per page
+class ChatStore(SessionStore):
+    kind = "chat"
+
+    def __init__(self, directory=CHAT_DIR, max_total_bytes=CHAT_MAX_TOTAL_BYTES):
+        super().__init__(directory, max_total_bytes)
+
+    def _path(self, session_id, number):
+        return os.path.join(self._session_dir(session_id), f"{number:08d}.z")
+
+    # Function to write one page of messages
+    def save_page(self, session_id, number, messages):
+        path = self._path(session_id, number)
+        data = zlib.compress(json.dumps(messages, ensure_ascii=False).encode("utf-8"), CHAT_COMPRESSION_LEVEL)
+        with self._lock:
+            self._write(path, data)
+            self._enforce_total(keep=session_id)
+
+    # Function to read one page of messages, or None once it has been evicted
+    def load_page(self, session_id, number):
+        try:
+            with open(self._path(session_id, number), "rb") as page_file:
+                return json.loads(zlib.decompress(page_file.read()))
+        except (OSError, ValueError, zlib.error):
+            return None
+
+
+_chat_store = None
+_chat_store_lock = threading.Lock()
+
+
+# Function to get the process-wide chat store
+def get_chat_store():
+    global _chat_store
+    if _chat_store is None:
+        with _chat_store_lock:
+            if _chat_store is None:
+                _chat_store = ChatStore()
+    return _chat_store
+
+
+# Chat history of one session. Only the most recent messages stay in memory; once there are more
+# than `window` of them, the oldest `page_size` are written to the chat store as one page, so memory
+# and the cost of showing the history stay bounded however long the conversation gets
+class ChatHistory:
+    def __init__(self, session_id, window=CHAT_WINDOW, page_size=CHAT_PAGE_SIZE, store=None):
+        self.session_id = session_id
+        self.window = max(1, window)
+        self.page_size = max(1, min(page_size, self.window))
+        self.store = store or get_chat_store()
+        self.messages = []
+        self.spilled_pages = 0
+
+    def __len__(self):
+        return self.spilled_pages * self.page_size + len(self.messages)
+
+    # Function to add a message, spilling the oldest page to disk when the window is full
+    def append(self, message):
+        self.messages.append(message)
+        while len(self.messages) > self.window:
+            page = self.messages[:self.page_size]
+            del self.messages[:self.page_size]
+            try:
+                self.store.save_page(self.session_id, self.spilled_pages, page)
+            except OSError:
+                # Disk full or read-only: the page is dropped rather than kept in memory
+                pass
+            self.spilled_pages += 1
+
+    # Function to read a spilled page (0 is the oldest); an evicted page comes back empty
+    def load_page(self, number):
+        return self.store.load_page(self.session_id, number) or []
+
+    def clear(self):
+        self.store.clear(self.session_id)
+        self.messages = []
+        self.spilled_pages = 0
@@ -0,0 +1,125 @@
+import heapq
+from array import array
+from collections import Counter
+
+from brand_graph import fold_name, get_brand_graph, name_keys
+from datasets import cached_per_version, get_dataset
+from source_index import analyze
+
+# How well each kind of name match ranks; full-text matches on the reasons come last
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+SUBSTRING_SCORE = 0.8
+FUZZY_WEIGHT = 0.75
+FUZZY_THRESHOLD = 0.4
+TEXT_SCORE = 0.3
+
+# Shortest query that matches name prefixes, and parts of names or misspellings; a single character
+# only matches a whole name. Shorter queries share fewer trigrams, so the fuzzy threshold rises by
+# FUZZY_SHORT_STEP for each character below FUZZY_FULL_LENGTH
+PREFIX_MIN_LENGTH = 2
+PARTIAL_MIN_LENGTH = 3
+FUZZY_FULL_LENGTH = 6
+FUZZY_SHORT_STEP = 0.1
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[start:start + 3] for start in range(len(padded) - 2)}
+
+
+# Function to gather the descriptive text of a company (reason, action, alternatives) for full-text search
+def company_text(company):
+    for field, value in company.items():
+        if field in ("name", "aliases"):
+            continue
+        if isinstance(value, str):
+            yield value
+        else:
+            yield from (item for item in value if isinstance(item, str))
+
+
+# Lookup index over one boycott dataset: folded names and aliases in a hash map, their trigrams
+# for partial and misspelled names, and the words of each company's text. With a brand graph,
+# the names of brands a company owns (Sprite for Coca-Cola) find that company too
+class CompanyIndex:
+    def __init__(self, boycott_data, brand_graph=None):
+        self.entries = []
+        self._names = {}
+        self._keys = []
+        self._trigrams = {}
+        self._terms = {}
+        for category, data in boycott_data.items():
+            for company in data["companies"]:
+                entry_id = len(self.entries)
+                self.entries.append((category, company))
+                for key in name_keys(company):
+                    self._add_key(key, entry_id)
+                for term in set(analyze(" ".join(company_text(company)))):
+                    self._terms.setdefault(term, array("I")).append(entry_id)
+        if brand_graph is not None:
+            for entry_id, key in brand_graph.owned_brand_keys():
+                self._add_key(key, entry_id)
+
+    def _add_key(self, key, entry_id):
+        self._names.setdefault(key, array("I")).append(entry_id)
+        grams = trigrams(key)
+        for gram in grams:
+            self._trigrams.setdefault(gram, array("I")).append(len(self._keys))
+        self._keys.append((key, entry_id, len(grams)))
+
+    # Function to find companies matching a query, best first, as (category, company) pairs
+    def search(self, query, limit=20):
+        scores = {}
+
+        def offer(entry_id, score):
+            if score > scores.get(entry_id, 0.0):
+                scores[entry_id] = score
+
+        key = fold_name(query)
+        if key:
+            for entry_id in self._names.get(key, ()):
+                offer(entry_id, EXACT_SCORE)
+        if len(key) >= PREFIX_MIN_LENGTH:
+            partial = len(key) >= PARTIAL_MIN_LENGTH
+            fuzzy_threshold = round(FUZZY_THRESHOLD + FUZZY_SHORT_STEP * max(0, FUZZY_FULL_LENGTH - len(key)), 2)
+            query_grams = trigrams(key)
+            shared = Counter()
+            for gram in query_grams:
+                shared.update(self._trigrams.get(gram, ()))
+            for key_number, count in shared.items():
+                name, entry_id, gram_count = self._keys[key_number]
+                if name.startswith(key):
+                    offer(entry_id, PREFIX_SCORE)
+                elif not partial:
+                    continue
+                elif key in name:
+                    offer(entry_id, SUBSTRING_SCORE)
+                else:
+                    similarity = 2 * count / (len(query_grams) + gram_count)
+                    if similarity >= fuzzy_threshold:
+                        offer(entry_id, FUZZY_WEIGHT * similarity)
+
+        # Every word of the query must appear in the company's text
+        terms = set(analyze(query))
+        if terms:
+            matching = None
+            for term in terms:
+                entry_ids = set(self._terms.get(term, ()))
+                matching = entry_ids if matching is None else matching & entry_ids
+            for entry_id in matching:
+                offer(entry_id, TEXT_SCORE)
+
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.entries[entry_id] for entry_id, _ in ranked]
+
+
+# Function to get the index of a boycott dataset, rebuilt only when the data changes
+@cached_per_version
+def get_company_index(dataset_name):
+    return CompanyIndex(get_dataset(dataset_name), get_brand_graph(dataset_name))
+
+
+# Function to search the companies of a boycott dataset, e.g. search_companies("boycott_en", "nestle")
+def search_companies(dataset_name, query, limit=20):
+    return get_company_index(dataset_name).search(query, limit)
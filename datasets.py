@@ -0,0 +1,216 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from types import MappingProxyType
+
+from answer_cache import CACHE_DIR
+
+# Editable JSON sources of the boycott and education content, one dataset per file
+DATA_DIR = os.getenv("PALESTINE_AI_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+# Compiled snapshot written by build_datasets.py and loaded by the apps
+DATA_SNAPSHOT_PATH = os.getenv("DATA_SNAPSHOT_PATH", os.path.join(CACHE_DIR, "datasets.pickle"))
+
+# Layout of the JSON sources ({"schema_version": ..., "data": ...}) and of the snapshot
+DATA_SCHEMA_VERSION = 1
+SNAPSHOT_FORMAT = 1
+
+# How often a running app looks for edited data files, in seconds
+DATA_RELOAD_SECONDS = float(os.getenv("DATA_RELOAD_SECONDS", 5))
+
+
+# Function to turn nested dicts and lists into read-only mappings and tuples,
+# so one copy of a dataset can be handed to every session without being changed by any of them
+def freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+# Function to map dataset names to their JSON source files
+def source_paths(data_dir=DATA_DIR):
+    return {
+        os.path.splitext(name)[0]: os.path.join(data_dir, name)
+        for name in sorted(os.listdir(data_dir)) if name.endswith(".json")
+    }
+
+
+# Function to summarize the JSON sources by name, modification time and size; it changes whenever one is edited
+def source_signature(data_dir=DATA_DIR):
+    signature = []
+    for name, path in source_paths(data_dir).items():
+        stat = os.stat(path)
+        signature.append((name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+# Function to compile the JSON sources into a snapshot; its version is a hash of the sources' content
+def compile_snapshot(data_dir=DATA_DIR):
+    digest = hashlib.sha256()
+    datasets = {}
+    for name, path in source_paths(data_dir).items():
+        with open(path, "rb") as source:
+            raw = source.read()
+        document = json.loads(raw)
+        if document.get("schema_version") != DATA_SCHEMA_VERSION:
+            raise ValueError(f"{path}: unsupported schema_version {document.get('schema_version')!r}")
+        digest.update(f"{name}\0{len(raw)}\0".encode("utf-8"))
+        digest.update(raw)
+        datasets[name] = document["data"]
+    return {"format": SNAPSHOT_FORMAT, "version": digest.hexdigest()[:16], "datasets": datasets}
+
+
+# Function to write a snapshot atomically
+def write_snapshot(snapshot, path=DATA_SNAPSHOT_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as snapshot_file:
+        pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def _snapshot_is_current(path, data_dir):
+    # Stale once any source file, or the directory listing itself, changed after it was written
+    try:
+        built_at = os.path.getmtime(path)
+    except OSError:
+        return False
+    sources = [data_dir] + list(source_paths(data_dir).values())
+    return all(os.path.getmtime(source) <= built_at for source in sources)
+
+
+# Function to load the compiled snapshot, rebuilding it from the JSON sources when it is missing or stale
+def load_snapshot(data_dir=DATA_DIR, path=DATA_SNAPSHOT_PATH):
+    if _snapshot_is_current(path, data_dir):
+        try:
+            with open(path, "rb") as snapshot_file:
+                snapshot = pickle.load(snapshot_file)
+            if snapshot.get("format") == SNAPSHOT_FORMAT:
+                return snapshot
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+    snapshot = compile_snapshot(data_dir)
+    try:
+        write_snapshot(snapshot, path)
+    except OSError:
+        # Read-only deployment: keep the compiled data in memory only
+        pass
+    return snapshot
+
+
+# Immutable view of one snapshot: every dataset frozen, plus the content version
+class Datasets:
+    def __init__(self, snapshot):
+        self.version = snapshot["version"]
+        self._datasets = {name: freeze(data) for name, data in snapshot["datasets"].items()}
+
+    def __getitem__(self, name):
+        return self._datasets[name]
+
+    def names(self):
+        return list(self._datasets)
+
+
+# Holder of the live datasets. The JSON sources are polled every few seconds; an edit is compiled
+# into a new Datasets object that replaces the old one in a single assignment, so a render that
+# already fetched a dataset keeps a consistent, unchanged copy until it finishes
+class DatasetStore:
+    def __init__(self, data_dir=DATA_DIR, snapshot_path=DATA_SNAPSHOT_PATH, reload_seconds=DATA_RELOAD_SECONDS):
+        self.data_dir = data_dir
+        self.snapshot_path = snapshot_path
+        self.reload_seconds = reload_seconds
+        self._signature = source_signature(data_dir)
+        self._current = Datasets(load_snapshot(data_dir, snapshot_path))
+        self._next_check = time.monotonic() + reload_seconds
+        self._lock = threading.Lock()
+
+    # Function to get the live datasets, reloading them first when a check is due and the sources changed
+    def current(self):
+        if time.monotonic() >= self._next_check and self._lock.acquire(blocking=False):
+            try:
+                self._reload_if_changed()
+            finally:
+                self._lock.release()
+        return self._current
+
+    def _reload_if_changed(self):
+        self._next_check = time.monotonic() + self.reload_seconds
+        try:
+            signature = source_signature(self.data_dir)
+            if signature == self._signature:
+                return
+            snapshot = compile_snapshot(self.data_dir)
+        except (OSError, ValueError):
+            # A file is half-written or not valid JSON yet; keep serving the last good version
+            return
+        try:
+            write_snapshot(snapshot, self.snapshot_path)
+        except OSError:
+            pass
+        self._signature = signature
+        self._current = Datasets(snapshot)
+
+
+_dataset_store = None
+_dataset_store_lock = threading.Lock()
+
+
+# Function to get the process-wide dataset store, loaded on first use
+def get_dataset_store():
+    global _dataset_store
+    if _dataset_store is None:
+        with _dataset_store_lock:
+            if _dataset_store is None:
+                _dataset_store = DatasetStore()
+    return _dataset_store
+
+
+# Function to get the live datasets
+def get_datasets():
+    return get_dataset_store().current()
+
+
+# Function to get one dataset by name, e.g. "boycott_en"
+def get_dataset(name):
+    return get_datasets()[name]
+
+
+# Function to get the content version of the loaded data, for keying caches derived from it
+def dataset_version():
+    return get_datasets().version
+
+
+# Decorator for per-process caches of values derived from the datasets (search indexes, rendered HTML):
+# results are kept per argument tuple and all dropped as soon as a new data version is loaded. The value
+# is computed outside the lock and only kept if no newer version was loaded meanwhile
+def cached_per_version(func):
+    results = {}
+    loaded_version = [None]
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        version = dataset_version()
+        with lock:
+            if loaded_version[0] != version:
+                results.clear()
+                loaded_version[0] = version
+            if args in results:
+                return results[args]
+        value = func(*args)
+        with lock:
+            if loaded_version[0] == version:
+                results[args] = value
+        return value
+
+    def cache_clear():
+        with lock:
+            results.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
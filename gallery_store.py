@@ -0,0 +1,85 @@
+import hashlib
+import os
+import threading
+
+from answer_cache import CACHE_DIR
+from session_store import SAFE_ID, SessionStore
+
+# Where saved gallery images live and how much each session and the whole store may keep
+GALLERY_DIR = os.getenv("GALLERY_DIR", os.path.join(CACHE_DIR, "gallery"))
+GALLERY_MAX_IMAGES_PER_SESSION = int(os.getenv("GALLERY_MAX_IMAGES_PER_SESSION", 30))
+GALLERY_MAX_BYTES_PER_SESSION = int(os.getenv("GALLERY_MAX_BYTES_PER_SESSION", 64 * 1024 * 1024))
+GALLERY_MAX_TOTAL_BYTES = int(os.getenv("GALLERY_MAX_TOTAL_BYTES", 1024 * 1024 * 1024))
+
+
+# On-disk store for full-size gallery images, one directory per session
+class GalleryStore(SessionStore):
+    kind = "gallery"
+
+    def __init__(self, directory=GALLERY_DIR, max_images_per_session=GALLERY_MAX_IMAGES_PER_SESSION,
+                 max_bytes_per_session=GALLERY_MAX_BYTES_PER_SESSION, max_total_bytes=GALLERY_MAX_TOTAL_BYTES):
+        super().__init__(directory, max_total_bytes)
+        self.max_images_per_session = max_images_per_session
+        self.max_bytes_per_session = max_bytes_per_session
+
+    def _path(self, session_id, image_id):
+        if not SAFE_ID.match(image_id):
+            raise ValueError(f"Invalid gallery image id: {image_id!r}")
+        return os.path.join(self._session_dir(session_id), image_id)
+
+    # Function to list a session's images as (image_id, size, saved_at), oldest first
+    def list_images(self, session_id):
+        return [image for image in self.session_files(session_id) if SAFE_ID.match(image[0])]
+
+    # Function to save an image; returns its id and the ids dropped to stay within the session quota,
+    # or None for the id when the disk refuses the write
+    def add(self, session_id, data):
+        image_id = hashlib.sha256(data).hexdigest()[:20]
+        path = self._path(session_id, image_id)
+        with self._lock:
+            try:
+                self._write(path, data)
+            except OSError:
+                return None, []
+
+            removed = []
+            images = self.list_images(session_id)
+            total = sum(size for _, size, _ in images)
+            for old_id, size, _ in images:
+                if len(images) - len(removed) <= self.max_images_per_session and total <= self.max_bytes_per_session:
+                    break
+                if old_id == image_id:
+                    continue
+                self.remove(session_id, old_id)
+                removed.append(old_id)
+                total -= size
+            self._enforce_total(keep=session_id)
+        return image_id, removed
+
+    # Function to read one full-size image, or None once it has been evicted
+    def load(self, session_id, image_id):
+        try:
+            with open(self._path(session_id, image_id), "rb") as image_file:
+                return image_file.read()
+        except (OSError, ValueError):
+            return None
+
+    def remove(self, session_id, image_id):
+        try:
+            os.remove(self._path(session_id, image_id))
+        except (OSError, ValueError):
+            pass
+
+
+_gallery_store = None
+_gallery_store_lock = threading.Lock()
+
+
+# Function to get the process-wide gallery store
+def get_gallery_store():
+    global _gallery_store
+    if _gallery_store is None:
+        with _gallery_store_lock:
+            if _gallery_store is None:
+                _gallery_store = GalleryStore()
+    return _gallery_store
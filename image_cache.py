@@ -0,0 +1,149 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from answer_cache import CACHE_DIR, normalize_question
+
+# Where generated images are kept and how much disk they may use
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", os.path.join(CACHE_DIR, "images"))
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+# Images kept in memory instead when the cache directory cannot be used
+IMAGE_CACHE_MEMORY_BYTES = int(os.getenv("IMAGE_CACHE_MEMORY_BYTES", 64 * 1024 * 1024))
+
+
+# Disk-backed image cache: prompt keys point at blobs named by the SHA-256 of their bytes,
+# so identical images are stored once and can be served to any session by digest
+class ImageCache:
+    def __init__(self, directory=IMAGE_CACHE_DIR, max_bytes=IMAGE_CACHE_MAX_BYTES, memory_bytes=IMAGE_CACHE_MEMORY_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self._lock = threading.Lock()
+        self._memory_keys = {}
+        self._memory_blobs = OrderedDict()
+        self._db = None
+        try:
+            os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+            self._db = sqlite3.connect(os.path.join(directory, "index.sqlite3"), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS images ("
+                "key TEXT PRIMARY KEY, digest TEXT NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS images_last_access ON images (last_access)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS images_digest ON images (digest)")
+            self._db.commit()
+        except (OSError, sqlite3.Error):
+            # Read-only or full disk: keep the most recent images in memory instead
+            self._db = None
+
+    # Function to build the cache key for a fully expanded prompt and output size
+    @staticmethod
+    def make_key(full_prompt, size):
+        return hashlib.sha256(f"{normalize_question(full_prompt)}\0{size}".encode("utf-8")).hexdigest()
+
+    def blob_path(self, digest):
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+    def get(self, key):
+        if self._db is None:
+            digest = self._memory_keys.get(key)
+            return self.load(digest) if digest else None
+        with self._lock:
+            row = self._db.execute("SELECT digest FROM images WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            data = self.load(row[0])
+            if data is None:
+                # Blob vanished from disk, forget the entry
+                self._db.execute("DELETE FROM images WHERE key = ?", (key,))
+            else:
+                self._db.execute("UPDATE images SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            return data
+
+    # Function to read a blob by content digest
+    def load(self, digest):
+        if self._db is None:
+            with self._lock:
+                data = self._memory_blobs.get(digest)
+                if data is not None:
+                    self._memory_blobs.move_to_end(digest)
+                return data
+        try:
+            with open(self.blob_path(digest), "rb") as blob:
+                return blob.read()
+        except OSError:
+            return None
+
+    def put(self, key, data):
+        digest = hashlib.sha256(data).hexdigest()
+        if self._db is None:
+            self._put_memory(key, digest, data)
+            return digest
+        path = self.blob_path(digest)
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as blob:
+                    blob.write(data)
+                os.replace(tmp_path, path)
+            self._db.execute(
+                "INSERT OR REPLACE INTO images (key, digest, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, digest, len(data), time.time())
+            )
+            self._db.commit()
+            self._evict()
+        return digest
+
+    def _put_memory(self, key, digest, data):
+        with self._lock:
+            self._memory_keys[key] = digest
+            self._memory_blobs[digest] = data
+            self._memory_blobs.move_to_end(digest)
+            # Drop least recently used blobs, and the keys pointing at them, past the memory cap
+            total = sum(len(blob) for blob in self._memory_blobs.values())
+            while total > self.memory_bytes and len(self._memory_blobs) > 1:
+                old_digest, old_data = self._memory_blobs.popitem(last=False)
+                total -= len(old_data)
+                for old_key in [k for k, d in self._memory_keys.items() if d == old_digest]:
+                    del self._memory_keys[old_key]
+
+    def _evict(self):
+        # Drop least recently used keys until the distinct blobs fit in the size cap
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM images)"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, digest, size FROM images ORDER BY last_access").fetchall()
+        for key, digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM images WHERE key = ?", (key,))
+            still_used = self._db.execute("SELECT 1 FROM images WHERE digest = ? LIMIT 1", (digest,)).fetchone()
+            if still_used is None:
+                try:
+                    os.remove(self.blob_path(digest))
+                except OSError:
+                    pass
+                total -= size
+        self._db.commit()
+
+
+_image_cache = None
+_image_cache_lock = threading.Lock()
+
+
+# Function to get the process-wide image cache shared by every session
+def get_image_cache():
+    global _image_cache
+    if _image_cache is None:
+        with _image_cache_lock:
+            if _image_cache is None:
+                _image_cache = ImageCache()
+    return _image_cache
@@ -0,0 +1,86 @@
+import hashlib
+import io
+import os
+
+from PIL import Image
+
+from image_cache import get_image_cache
+
+# Define dimensions based on size
+IMAGE_DIMENSIONS = {
+    "small": (512, 512),
+    "medium": (768, 768),
+    "large": (1024, 1024)
+}
+
+# Bounding box of gallery thumbnails
+THUMBNAIL_SIZE = (256, 256)
+
+# Encoding used for on-page display; the original bytes are kept for downloads. JPEG or PNG:
+# st.image passes those to the browser unchanged and re-encodes any other format on every rerun
+DISPLAY_FORMAT = os.getenv("IMAGE_DISPLAY_FORMAT", "JPEG").upper()
+DISPLAY_QUALITY = int(os.getenv("IMAGE_DISPLAY_QUALITY", 80))
+
+
+# File signatures of the formats Gemini may return, with their MIME type and extension
+IMAGE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png", "png"),
+    (b"\xff\xd8\xff", "image/jpeg", "jpg"),
+    (b"RIFF", "image/webp", "webp"),
+    (b"GIF8", "image/gif", "gif"),
+]
+
+
+# Function to get the pixel box for a size name
+def get_dimensions(size):
+    return IMAGE_DIMENSIONS.get(size, IMAGE_DIMENSIONS["medium"])
+
+
+# Function to downscale an image to fit a box and re-encode it compactly
+def encode_image(data, max_size, image_format=DISPLAY_FORMAT, quality=DISPLAY_QUALITY):
+    output = io.BytesIO()
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail(max_size, Image.LANCZOS)
+        if image_format == "PNG":
+            image.save(output, format="PNG", optimize=True)
+        else:
+            if image.mode not in ("RGB", "L"):
+                # JPEG has no alpha channel: flatten transparent areas onto white
+                rgba = image.convert("RGBA")
+                image = Image.new("RGB", rgba.size, (255, 255, 255))
+                image.paste(rgba, mask=rgba.getchannel("A"))
+            image.save(output, format="JPEG", quality=quality, optimize=True, progressive=True)
+    return output.getvalue()
+
+
+# Function to get the display version of an image, encoded once and kept in the image cache
+def make_display_image(data, size, cache=None):
+    cache = cache or get_image_cache()
+    source_digest = hashlib.sha256(data).hexdigest()
+    key = hashlib.sha256(f"display\0{source_digest}\0{size}\0{DISPLAY_FORMAT}\0{DISPLAY_QUALITY}".encode("utf-8")).hexdigest()
+    display = cache.get(key)
+    if display is not None:
+        return display
+    try:
+        display = encode_image(data, get_dimensions(size))
+    except (OSError, ValueError):
+        # Pillow cannot decode it, send the original rather than nothing
+        return data
+    cache.put(key, display)
+    return display
+
+
+# Function to make the small preview kept in session state for gallery grids
+def make_thumbnail(data):
+    try:
+        return encode_image(data, THUMBNAIL_SIZE)
+    except (OSError, ValueError):
+        return None
+
+
+# Function to detect the MIME type and file extension of image bytes
+def image_file_type(data):
+    for signature, mime_type, extension in IMAGE_SIGNATURES:
+        if data.startswith(signature) and (extension != "webp" or data[8:12] == b"WEBP"):
+            return mime_type, extension
+    return "image/png", "png"
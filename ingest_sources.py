@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import sys
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+
+from source_index import (
+    RELIABLE_DOMAINS, SEED_SOURCES, SOURCE_INDEX_DIR,
+    append_segment, merge_segments, read_manifest, replace_segments
+)
+
+# Display names for the reliable domains
+SOURCE_NAMES = {
+    "aljazeera.com": "Al Jazeera",
+    "middleeasteye.net": "Middle East Eye",
+    "metras.co": "Metras",
+    "aa.com.tr": "Anadolu Agency",
+    "palestinechronicle.com": "The Palestine Chronicle",
+    "electronicintifada.net": "The Electronic Intifada",
+    "btselem.org": "B'Tselem",
+    "amnesty.org": "Amnesty International",
+    "hrw.org": "Human Rights Watch",
+    "un.org": "United Nations",
+    "unrwa.org": "UNRWA",
+    "ochaopt.org": "OCHA oPt",
+    "palestinestudies.org": "Institute for Palestine Studies",
+    "mondoweiss.net": "Mondoweiss"
+}
+
+SNIPPET_LENGTH = 300
+# How many times a merge starts over when a running app changes the segments under it
+MERGE_ATTEMPTS = 3
+
+
+# Function to find which reliable domain a URL belongs to, if any
+def reliable_domain(url):
+    host = (urlparse(url).hostname or "").lower()
+    for domain in RELIABLE_DOMAINS:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return None
+
+
+# Function to cut text to a snippet at a word boundary
+def make_snippet(text, length=SNIPPET_LENGTH):
+    text = " ".join(text.split())
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(" ", 1)[0] + "..."
+
+
+# Collects title, description, canonical URL, date and paragraph text from an article page
+class ArticleParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta = {}
+        self.title = ""
+        self.paragraphs = []
+        self._in_title = False
+        self._paragraph = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            name = (attrs.get("property") or attrs.get("name") or "").lower()
+            if name and attrs.get("content"):
+                self.meta.setdefault(name, attrs["content"])
+        elif tag == "link" and (attrs.get("rel") or "").lower() == "canonical" and attrs.get("href"):
+            self.meta.setdefault("canonical", attrs["href"])
+        elif tag == "time" and attrs.get("datetime"):
+            self.meta.setdefault("time", attrs["datetime"])
+        elif tag == "p":
+            self._paragraph = []
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag == "p" and self._paragraph is not None:
+            self.paragraphs.append("".join(self._paragraph))
+            self._paragraph = None
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif self._paragraph is not None:
+            self._paragraph.append(data)
+
+
+# Function to extract a source document from an HTML article dump
+def parse_html(text, fallback_url=""):
+    parser = ArticleParser()
+    parser.feed(text)
+    meta = parser.meta
+    return {
+        "title": meta.get("og:title") or parser.title,
+        "url": meta.get("og:url") or meta.get("canonical") or fallback_url,
+        "snippet": meta.get("og:description") or meta.get("description") or " ".join(parser.paragraphs),
+        "date": meta.get("article:published_time") or meta.get("time") or "",
+        "source": meta.get("og:site_name") or ""
+    }
+
+
+# Function to get the first non-empty field of a record as text; numbers (a year as the date)
+# are converted, nested lists and objects are ignored
+def record_field(record, *names):
+    for name in names:
+        value = record.get(name)
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool) and str(value).strip():
+            return str(value)
+    return ""
+
+
+# Function to map a JSONL record onto a source document
+def parse_record(record):
+    return {
+        "title": record_field(record, "title"),
+        "url": record_field(record, "url", "link"),
+        "snippet": record_field(record, "snippet", "description", "text", "content"),
+        "date": record_field(record, "date", "published", "published_at"),
+        "source": record_field(record, "source")
+    }
+
+
+# Function to yield raw documents from JSONL and HTML dumps in files and directories
+def read_dumps(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                yield from read_dumps(sorted(os.path.join(root, name) for name in files))
+            continue
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".jsonl", ".ndjson"):
+            with open(path, encoding="utf-8") as dump:
+                for line_number, line in enumerate(dump, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield parse_record(json.loads(line))
+                    except (ValueError, AttributeError):
+                        print(f"Skipping malformed line {line_number} in {path}", file=sys.stderr)
+        elif extension in (".html", ".htm"):
+            with open(path, encoding="utf-8", errors="replace") as dump:
+                yield parse_html(dump.read())
+
+
+# Function to keep documents from reliable domains, tidy their fields and drop duplicate URLs
+def clean_documents(raw_documents):
+    seen_urls = set()
+    for document in raw_documents:
+        domain = reliable_domain(document["url"])
+        title = " ".join(document["title"].split())
+        if not domain or not title or document["url"] in seen_urls:
+            continue
+        seen_urls.add(document["url"])
+        yield {
+            "title": title,
+            "url": document["url"],
+            "snippet": make_snippet(document["snippet"]),
+            "date": document["date"][:10],
+            "source": document["source"] or SOURCE_NAMES.get(domain, domain)
+        }
+
+
+# Function to merge segments, starting over when a running app merged some of them away meanwhile
+def merge_retrying(directory, force=False, attempts=MERGE_ATTEMPTS):
+    for attempt in range(attempts):
+        try:
+            return merge_segments(directory, force=force)
+        except FileNotFoundError:
+            if attempt + 1 == attempts:
+                print(f"Segments in {directory} kept changing, merge skipped", file=sys.stderr)
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Add local article dumps (JSONL or HTML) to the source search index as a new segment."
+    )
+    parser.add_argument("dumps", nargs="*", help="JSONL/HTML files or directories containing them")
+    parser.add_argument("--index-dir", default=SOURCE_INDEX_DIR, help=f"segment directory (default: {SOURCE_INDEX_DIR})")
+    parser.add_argument("--no-seed", action="store_true", help="do not include the built-in sample sources in a new index")
+    parser.add_argument("--rebuild", action="store_true", help="replace every existing segment instead of appending")
+    parser.add_argument("--merge", action="store_true", help="merge all segments into one")
+    args = parser.parse_args(argv)
+    if not args.dumps and not args.merge:
+        parser.error("give dumps to ingest, or --merge")
+
+    if args.dumps:
+        raw_documents = list(read_dumps(args.dumps))
+        new_index = args.rebuild or not read_manifest(args.index_dir)["segments"]
+        seed_documents = [] if args.no_seed or not new_index else [dict(source, date=source.get("date", "")) for source in SEED_SOURCES]
+        documents = list(clean_documents(seed_documents + raw_documents))
+        if args.rebuild:
+            replace_segments(documents, args.index_dir)
+        else:
+            append_segment(documents, args.index_dir)
+        print(f"Read {len(raw_documents)} documents, indexed {len(documents)} from reliable domains into {args.index_dir}")
+
+    if args.merge:
+        merge_retrying(args.index_dir, force=True)
+    else:
+        # Keep the segment count bounded; a running app would otherwise do this in the background
+        while merge_retrying(args.index_dir):
+            pass
+    print(f"{len(read_manifest(args.index_dir)['segments'])} segment(s) live in {args.index_dir}")
+
+
+if __name__ == "__main__":
+    main()
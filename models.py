@@ -0,0 +1,75 @@
+import os
+import threading
+
+import google.generativeai as genai
+
+# Gemini models used by the apps
+TEXT_MODEL_NAME = "gemini-2.0-flash-thinking-exp-01-21"
+IMAGE_MODEL_NAME = "gemini-2.0-flash-exp-image-generation"
+
+TEXT_GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.95,
+    "top_k": 40,
+    "max_output_tokens": 4000  # Increased token limit for deeper, longer responses
+}
+
+# Models are built once per process and shared by every rerun and session
+_models = {}
+_models_lock = threading.Lock()
+_configured = False
+_warmed_up = False
+
+
+# Function to configure the Gemini client once with the API key from the environment
+def configure_gemini():
+    global _configured
+    if not _configured:
+        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+        _configured = True
+
+
+def _get_model(key, build):
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                configure_gemini()
+                model = _models[key] = build()
+    return model
+
+
+# Function to get the shared text model
+def get_text_model():
+    return _get_model("text", lambda: genai.GenerativeModel(
+        model_name=TEXT_MODEL_NAME,
+        generation_config=genai.types.GenerationConfig(**TEXT_GENERATION_CONFIG)
+    ))
+
+
+# Function to get the shared image generation model
+def get_image_model():
+    return _get_model("image", lambda: genai.GenerativeModel(model_name=IMAGE_MODEL_NAME))
+
+
+def _open_connection():
+    # count_tokens is free and forces the client and its connection to be created
+    try:
+        get_text_model().count_tokens("warm-up")
+    except Exception:
+        pass
+
+
+# Function to build all models at startup and open the API connection in the background,
+# so the first user request does not pay the client initialization cost
+def warm_up_models():
+    global _warmed_up
+    with _models_lock:
+        if _warmed_up:
+            return
+        _warmed_up = True
+    get_text_model()
+    get_image_model()
+    if os.getenv("GOOGLE_API_KEY"):
+        threading.Thread(target=_open_connection, name="gemini-warm-up", daemon=True).start()
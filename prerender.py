@@ -0,0 +1,127 @@
+from html import escape
+
+from datasets import cached_per_version, get_dataset
+
+# Prerendered HTML for the boycott views. Each category becomes one fragment, built once per data
+# version, so a rerun emits one markdown element per category instead of one per company. Fragments
+# are written without blank lines or indentation so markdown keeps them as a single HTML block.
+
+
+# Function to prerender one category of the simple view (companies to boycott and their alternatives)
+@cached_per_version
+def simple_category_html(dataset_name, category):
+    data = get_dataset(dataset_name)[category]
+    parts = [
+        f"<div class='boycott-category'>{escape(category)}</div>",
+        "<div style='margin-left: 15px;'><strong>Companies to Boycott:</strong></div>",
+    ]
+    parts.extend(f"<div class='boycott-company'>• {escape(company)}</div>" for company in data["Companies"])
+    parts.append("<div style='margin-left: 15px; margin-top: 10px; color: #2ca02c;'><strong>Alternatives:</strong></div>")
+    parts.extend(f"<div class='boycott-alternative'>✓ {escape(alternative)}</div>" for alternative in data["Alternatives"])
+    parts.append("<hr style='margin: 15px 0; border-color: #f0f0f0;'>")
+    return "".join(parts)
+
+
+# Function to prerender the card of one company in the detailed view
+def company_card_html(company):
+    return (
+        "<div class='company-card'>"
+        f"<div class='company-name'>{escape(company['name'])}</div>"
+        f"<div class='company-reason'>{escape(company['reason'])}</div>"
+        f"<div class='company-action'>Action: {escape(company['action'])}</div>"
+        f"<div class='company-alternatives'><strong>Alternatives:</strong> {escape(', '.join(company['alternatives']))}</div>"
+        "</div>"
+    )
+
+
+# Function to prerender one category of the detailed view: its heading and every company card
+@cached_per_version
+def detailed_category_html(dataset_name, category):
+    companies = get_dataset(dataset_name)[category]["companies"]
+    return f"<h3>{escape(category)}</h3>" + "".join(company_card_html(company) for company in companies)
+
+
+# Expander-like styling for the <details> blocks of the prerendered boycott and education sections
+DETAILS_STYLE = "border: 1px solid rgba(49, 51, 63, 0.2); border-radius: 0.5rem; padding: 0.5rem 1rem; margin-bottom: 0.5rem;"
+SUMMARY_STYLE = "cursor: pointer; font-weight: 600;"
+SECTION_STYLE = "font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;"
+HEADING_STYLE = "font-weight: 700; color: #1f77b4; margin-bottom: 15px;"
+SUBHEADING_STYLE = "font-weight: 600; color: #2ca02c; margin: 15px 0 10px 0;"
+LINK_STYLE = "color: #1f77b4; text-decoration: underline;"
+
+# Labels and data fields of the boycott and education sections in each language
+# (the Arabic data keeps its translated text under the "...1" fields)
+SECTION_LANGUAGES = {
+    "english": {
+        "dir": "ltr",
+        "reason": ("Reason for boycott:", "reason"),
+        "action": ("Recommended action:", "action"),
+        "alternatives": ("Alternatives:", "alternatives"),
+        "description": "description",
+        "key_facts": ("Key Facts:", "key_facts"),
+        "sources": "Sources:",
+    },
+    "arabic": {
+        "dir": "rtl",
+        "reason": ("سبب المقاطعة:", "reason1"),
+        "action": ("الإجراء الموصى به:", "action1"),
+        "alternatives": ("البدائل:", "alternatives1"),
+        "description": "description1",
+        "key_facts": ("حقائق رئيسية:", "key_facts1"),
+        "sources": "المصادر:",
+    },
+}
+
+
+# Function to wrap the body of one company or resource in a collapsed <details> block
+def details_html(title, body, direction):
+    return (
+        f"<details dir='{direction}' style=\"{DETAILS_STYLE}\">"
+        f"<summary style='{SUMMARY_STYLE}'>{escape(title)}</summary>"
+        f"<div style=\"{SECTION_STYLE}\">{body}</div>"
+        "</details>"
+    )
+
+
+# Function to prerender one category of the boycott page: its heading and a collapsed block per company
+@cached_per_version
+def boycott_category_html(dataset_name, category, language):
+    labels = SECTION_LANGUAGES[language]
+    reason_label, reason = labels["reason"]
+    action_label, action = labels["action"]
+    alternatives_label, alternatives = labels["alternatives"]
+    parts = [f"<h3 dir='{labels['dir']}' style='{HEADING_STYLE}'>{escape(category)}</h3>"]
+    for company in get_dataset(dataset_name)[category]["companies"]:
+        body = (
+            f"<p style='margin-bottom: 10px;'><strong style='color: #d62728; font-weight: 600;'>{reason_label}</strong> {escape(company[reason])}</p>"
+            f"<p style='margin-bottom: 10px;'><strong style='color: #2ca02c; font-weight: 600;'>{action_label}</strong> {escape(company[action])}</p>"
+            f"<p><strong style='color: #1f77b4; font-weight: 600;'>{alternatives_label}</strong> {escape(', '.join(company[alternatives]))}</p>"
+        )
+        parts.append(details_html(company["name"], body, labels["dir"]))
+    return "".join(parts)
+
+
+# Function to prerender one category of the education page: its heading and a collapsed block per resource
+@cached_per_version
+def education_category_html(dataset_name, category, language):
+    labels = SECTION_LANGUAGES[language]
+    key_facts_label, key_facts = labels["key_facts"]
+    parts = [f"<h3 dir='{labels['dir']}' style='{HEADING_STYLE}'>{escape(category)}</h3>"]
+    for resource in get_dataset(dataset_name)[category]:
+        # Some resources keep the untranslated field name or have no sources
+        description = resource.get(labels["description"]) or resource.get("description", "")
+        facts = resource.get(key_facts) or resource.get("key_facts", ())
+        body = [f"<p style='font-size: 1.05em; margin-bottom: 15px;'>{escape(description)}</p>"]
+        if facts:
+            body.append(f"<h4 style='{SUBHEADING_STYLE}'>{key_facts_label}</h4><ul>")
+            body.extend(f"<li style='margin-bottom: 8px;'>{escape(fact)}</li>" for fact in facts)
+            body.append("</ul>")
+        if resource.get("sources"):
+            body.append(f"<h4 style='{SUBHEADING_STYLE}'>{labels['sources']}</h4><ul>")
+            body.extend(
+                f"<li style='margin-bottom: 8px;'><a href=\"{escape(source['url'])}\" style='{LINK_STYLE}'>{escape(source['name'])}</a></li>"
+                for source in resource["sources"]
+            )
+            body.append("</ul>")
+        parts.append(details_html(resource["title"], "".join(body), labels["dir"]))
+    return "".join(parts)
@@ -0,0 +1,54 @@
+import io
+import math
+import os
+import re
+import time
+
+import streamlit as st
+
+# Frame rate and upper bound on placeholder updates for simulated typing
+RENDER_FPS = float(os.getenv("PALESTINE_AI_RENDER_FPS", 20))
+RENDER_MAX_FRAMES = int(os.getenv("PALESTINE_AI_RENDER_MAX_FRAMES", 40))
+
+# Words keep their trailing whitespace; sentences end on Latin or Arabic punctuation or a newline
+CHUNK_PATTERNS = {
+    "word": re.compile(r"\s*\S+\s*"),
+    "sentence": re.compile(r"[^.!?؟\n]*(?:[.!?؟\n]+\s*|$)"),
+}
+
+
+# Function to split text into word or sentence chunks
+def split_chunks(text, unit="word"):
+    return [chunk for chunk in CHUNK_PATTERNS[unit].findall(text) if chunk]
+
+
+# Function to reveal text in batches at a fixed frame rate with a bounded number of updates
+def render_chunked(text, placeholder=None, fps=RENDER_FPS, max_frames=RENDER_MAX_FRAMES, unit="word",
+                   template="<div style='line-height: 1.5;'>{}</div>"):
+    if placeholder is None:
+        placeholder = st.empty()
+
+    chunks = split_chunks(text, unit)
+    if not chunks:
+        placeholder.markdown(template.format(text), unsafe_allow_html=True)
+        return
+
+    chunks_per_frame = math.ceil(len(chunks) / max(1, min(max_frames, len(chunks))))
+    frame_interval = 1.0 / fps if fps > 0 else 0.0
+    output = io.StringIO()
+    next_frame = time.monotonic()
+    for start in range(0, len(chunks), chunks_per_frame):
+        output.write("".join(chunks[start:start + chunks_per_frame]))
+        placeholder.markdown(template.format(output.getvalue()), unsafe_allow_html=True)
+        next_frame += frame_interval
+        remaining = next_frame - time.monotonic()
+        if remaining > 0 and start + chunks_per_frame < len(chunks):
+            time.sleep(remaining)
+
+
+# Function to show a row of category tabs and return the selected one. Unlike st.tabs, which sends
+# the content of every tab on each rerun, the caller only renders the category that is returned
+def lazy_tabs(labels, key):
+    labels = list(labels)
+    return st.radio(key, labels, key=key, horizontal=True, label_visibility="collapsed")
+
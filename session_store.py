@@ -0,0 +1,78 @@
+import os
+import re
+import shutil
+import threading
+import time
+
+SAFE_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+# Base of the on-disk per-session stores (gallery images, spilled chat pages): one directory per session
+# under a shared root, atomic file writes, and a cap on the whole store that drops the least recently
+# written sessions first
+class SessionStore:
+    kind = "session"
+
+    def __init__(self, directory, max_total_bytes):
+        self.directory = directory
+        self.max_total_bytes = max_total_bytes
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            # Read-only or full disk: writes fail later and each store decides how to degrade
+            pass
+
+    def _session_dir(self, session_id):
+        if not SAFE_ID.match(session_id):
+            raise ValueError(f"Invalid {self.kind} session id: {session_id!r}")
+        return os.path.join(self.directory, session_id)
+
+    # Function to list the files of a session as (name, size, written_at), oldest first; files still
+    # being written are left out
+    def session_files(self, session_id):
+        try:
+            entries = [
+                entry for entry in os.scandir(self._session_dir(session_id))
+                if entry.is_file() and not entry.name.endswith(".tmp")
+            ]
+        except OSError:
+            return []
+        files = [(entry.name, entry.stat().st_size, entry.stat().st_mtime) for entry in entries]
+        return sorted(files, key=lambda file: file[2])
+
+    # Function to write a file of a session atomically; the caller holds the lock
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as output:
+            output.write(data)
+        os.replace(tmp_path, path)
+
+    def clear(self, session_id):
+        shutil.rmtree(self._session_dir(session_id), ignore_errors=True)
+
+    def _enforce_total(self, keep):
+        # Drop whole sessions, least recently written first, while the store is over its cap
+        sessions = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_dir() or not SAFE_ID.match(entry.name):
+                continue
+            files = self.session_files(entry.name)
+            size = sum(file[1] for file in files)
+            last_write = max((file[2] for file in files), default=0)
+            sessions.append((last_write, entry.name, size))
+            total += size
+        for _, session_id, size in sorted(sessions):
+            if total <= self.max_total_bytes:
+                break
+            if session_id == keep:
+                continue
+            self.clear(session_id)
+            total -= size
+
+
+# Function to stamp an id with the current time, used for new session ids
+def new_session_id():
+    return f"{int(time.time())}-{os.urandom(8).hex()}"
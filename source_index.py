@@ -0,0 +1,711 @@
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+
+from answer_cache import CACHE_DIR
+from topic_gate import canonical_token, is_arabic, tokenize
+
+# Corpus written by ingest_sources.py: immutable segment files plus a manifest naming the live ones
+SOURCE_INDEX_DIR = os.getenv("SOURCE_INDEX_DIR", os.path.join(CACHE_DIR, "sources"))
+MANIFEST_NAME = "MANIFEST.json"
+MANIFEST_LOCK_NAME = "MANIFEST.lock"
+
+# Merge once there are more than this many segments, this many neighbours at a time
+SEGMENT_MERGE_FACTOR = int(os.getenv("SOURCE_SEGMENT_MERGE_FACTOR", 8))
+# How often a running app looks for new segments, in seconds
+SEGMENT_REFRESH_SECONDS = float(os.getenv("SOURCE_SEGMENT_REFRESH_SECONDS", 5))
+# Segment files no longer in the manifest are deleted once they are this old, in seconds
+SEGMENT_GRACE_SECONDS = 60
+# A manifest lock older than this is assumed to belong to a dead process, in seconds
+MANIFEST_LOCK_TIMEOUT = 30
+
+# List of reliable domains
+RELIABLE_DOMAINS = [
+    "aljazeera.com", "middleeasteye.net", "metras.co",
+    "aa.com.tr", "palestinechronicle.com", "electronicintifada.net",
+    "btselem.org", "amnesty.org", "hrw.org", "un.org", "unrwa.org",
+    "ochaopt.org", "palestinestudies.org", "mondoweiss.net"
+]
+
+# Built-in sources, indexed when no larger corpus is available
+SEED_SOURCES = [
+    {
+        "title": "The history of Palestine: A chronology of key events",
+        "url": "https://www.aljazeera.com/news/2023/5/15/the-history-of-palestine-a-chronology-of-key-events",
+        "snippet": "A look at the major events that have shaped Palestinian history...",
+        "source": "Al Jazeera"
+    },
+    {
+        "title": "Palestine and Israel: Mapping an annexation",
+        "url": "https://www.aljazeera.com/news/2020/7/2/palestine-and-israel-mapping-an-annexation",
+        "snippet": "Interactive map of Palestine showing the effects of Israel's annexation plans...",
+        "source": "Al Jazeera"
+    },
+    {
+        "title": "What's the history of the Israel-Palestinian conflict?",
+        "url": "https://www.middleeasteye.net/news/israel-palestine-conflict-history-explained",
+        "snippet": "The roots of the Israel-Palestinian conflict explained...",
+        "source": "Middle East Eye"
+    },
+    {
+        "title": "Timeline: Israel's attacks on Gaza and the Palestinian resistance",
+        "url": "https://www.aa.com.tr/en/middle-east/timeline-israels-attacks-on-gaza-and-the-palestinian-resistance/2866227",
+        "snippet": "A comprehensive timeline of the recent events in Gaza...",
+        "source": "Anadolu Agency"
+    }
+]
+
+# BM25 parameters and how many times title terms count compared to snippet terms
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_BOOST = 2
+# Postings a search reads from one list before it checks again whether it can stop
+SEARCH_BLOCK_SIZE = 16
+# Once the documents a search has not seen must contain several terms, it scores the rest of their
+# intersection at once when at most this many documents are left in it
+SEARCH_INTERSECTION_SIZE = 256
+
+# Common English and Arabic words that carry no search meaning
+STOPWORDS = frozenset(token for word in """
+    a about after all also an and any are as at be been before being between both but by can could did do does
+    during each for from had has have how i if in into is it its me more most my no not of on or other our out
+    over s so some such than that the their them then there these they this those through to under up was we
+    were what when where which while who whom why will with would you your
+    في من على إلى الى عن ما ماذا هل هو هي هم أن ان إن التي الذي الذين مع كان كانت هذا هذه ذلك تلك أو او ثم قد لا لم لن كيف متى أين
+""".split() for token in tokenize(word))
+
+
+# Function to reduce a token to the form stored in the index
+def stem(token):
+    if is_arabic(token):
+        return canonical_token(token)
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+# Function to turn text into index terms
+def analyze(text):
+    return [stem(token) for token in tokenize(text) if token not in STOPWORDS]
+
+
+# Function to get the BM25 term frequency factor of a posting, without idf and the (k1 + 1) factor
+def term_impact(frequency, doc_length, average_length):
+    return frequency / (frequency + BM25_K1 * (1 - BM25_B + BM25_B * doc_length / average_length))
+
+
+# Function to list the positions of a term's postings by descending impact within their segment
+def impact_order(doc_ids, frequencies, doc_lengths, average_length):
+    impacts = [term_impact(frequency, doc_lengths[doc_id], average_length) for doc_id, frequency in zip(doc_ids, frequencies)]
+    return array("I", sorted(range(len(impacts)), key=lambda position: -impacts[position]))
+
+
+# Function to hash a URL into the 64-bit key stored for every document
+def url_hash(url):
+    return int.from_bytes(hashlib.blake2b((url or "").encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def average_doc_length(index):
+    return index.total_length / index.doc_count if index.doc_count else 1.0
+
+
+EMPTY_POSTINGS = (array("I"), array("I"), array("I"))
+
+
+# In-memory inverted index: term -> parallel arrays of document ids and term frequencies, in id order,
+# plus the positions of those postings from the highest BM25 impact to the lowest
+class MemoryIndex:
+    def __init__(self, documents):
+        self.documents = list(documents)
+        self.doc_lengths = array("I")
+        self.url_hashes = array("Q", (url_hash(document.get("url")) for document in self.documents))
+        self._postings = {}
+        for doc_id, document in enumerate(self.documents):
+            terms = analyze(document["title"]) * TITLE_BOOST + analyze(document.get("snippet", ""))
+            self.doc_lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                doc_ids, frequencies = self._postings.setdefault(term, (array("I"), array("I")))
+                doc_ids.append(doc_id)
+                frequencies.append(frequency)
+        self.total_length = sum(self.doc_lengths)
+        average_length = average_doc_length(self)
+        self._postings = {
+            term: (doc_ids, frequencies, impact_order(doc_ids, frequencies, self.doc_lengths, average_length))
+            for term, (doc_ids, frequencies) in self._postings.items()
+        }
+
+    @property
+    def doc_count(self):
+        return len(self.documents)
+
+    def postings(self, term):
+        return self._postings.get(term, EMPTY_POSTINGS)
+
+    def document(self, doc_id):
+        return self.documents[doc_id]
+
+
+# On-disk layout: a fixed header followed by 8-byte aligned sections
+#   doc_lengths     uint32[doc_count]
+#   url_hashes      uint64[doc_count]       url_hash of each document's URL
+#   doc_offsets     uint64[doc_count + 1]   byte offsets into doc_data
+#   doc_data        compact UTF-8 JSON documents, back to back
+#   term_offsets    uint64[term_count + 1]  byte offsets into term_data
+#   term_data       UTF-8 terms sorted bytewise, back to back
+#   post_offsets    uint64[term_count + 1]  entry offsets into the two postings arrays
+#   post_doc_ids    uint32[entries]
+#   post_freqs      uint32[entries]
+#   post_order      uint32[entries]         per term, positions of its postings by descending impact
+INDEX_MAGIC = b"PALIDX02"
+INDEX_HEADER = struct.Struct("<8sIIQ10Q")
+
+
+def _aligned(blob):
+    return blob + b"\0" * (-len(blob) % 8)
+
+
+# Function to serialize an in-memory index into the compact on-disk format
+def index_to_bytes(index):
+    encoded_docs = [json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8") for doc in index.documents]
+    doc_offsets = array("Q", [0])
+    for blob in encoded_docs:
+        doc_offsets.append(doc_offsets[-1] + len(blob))
+
+    terms = sorted(index._postings, key=lambda term: term.encode("utf-8"))
+    encoded_terms = [term.encode("utf-8") for term in terms]
+    term_offsets = array("Q", [0])
+    post_offsets = array("Q", [0])
+    post_doc_ids = array("I")
+    post_freqs = array("I")
+    post_order = array("I")
+    for term, blob in zip(terms, encoded_terms):
+        term_offsets.append(term_offsets[-1] + len(blob))
+        doc_ids, frequencies, order = index.postings(term)
+        post_doc_ids.extend(doc_ids)
+        post_freqs.extend(frequencies)
+        post_order.extend(order)
+        post_offsets.append(len(post_doc_ids))
+
+    sections = [
+        index.doc_lengths.tobytes(), index.url_hashes.tobytes(), doc_offsets.tobytes(), b"".join(encoded_docs),
+        term_offsets.tobytes(), b"".join(encoded_terms),
+        post_offsets.tobytes(), post_doc_ids.tobytes(), post_freqs.tobytes(), post_order.tobytes(),
+    ]
+    positions = []
+    position = INDEX_HEADER.size
+    for section in sections:
+        positions.append(position)
+        position += len(_aligned(section))
+    header = INDEX_HEADER.pack(INDEX_MAGIC, index.doc_count, len(terms), index.total_length, *positions)
+    return header + b"".join(_aligned(section) for section in sections)
+
+
+# Function to write an index file atomically, so readers never see a partial file
+def write_index(path, index):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as index_file:
+        index_file.write(index_to_bytes(index))
+    os.replace(tmp_path, path)
+
+
+# Read-only index over a memory-mapped (or in-memory) buffer in the on-disk format;
+# terms are found by binary search, nothing is decoded until it is needed
+class MappedIndex:
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, doc_count, term_count, total_length, *positions = INDEX_HEADER.unpack_from(view)
+        if magic != INDEX_MAGIC:
+            # Includes files of the older layout without impact order; rebuild with ingest_sources.py --rebuild
+            raise ValueError("Not a source index file of this version")
+        self._doc_count = doc_count
+        self.term_count = term_count
+        self.total_length = total_length
+        (doc_lengths_at, url_hashes_at, doc_offsets_at, doc_data_at, term_offsets_at, term_data_at,
+         post_offsets_at, doc_ids_at, freqs_at, order_at) = positions
+
+        def section(start, size, item_format=None):
+            part = view[start:start + size]
+            return part.cast(item_format) if item_format else part
+
+        self.doc_lengths = section(doc_lengths_at, doc_count * 4, "I")
+        self.url_hashes = section(url_hashes_at, doc_count * 8, "Q")
+        self._doc_offsets = section(doc_offsets_at, (doc_count + 1) * 8, "Q")
+        self._doc_data = section(doc_data_at, self._doc_offsets[-1])
+        self._term_offsets = section(term_offsets_at, (term_count + 1) * 8, "Q")
+        self._term_data = section(term_data_at, self._term_offsets[-1])
+        self._post_offsets = section(post_offsets_at, (term_count + 1) * 8, "Q")
+        entries = self._post_offsets[-1]
+        self._post_doc_ids = section(doc_ids_at, entries * 4, "I")
+        self._post_freqs = section(freqs_at, entries * 4, "I")
+        self._post_order = section(order_at, entries * 4, "I")
+
+    @property
+    def doc_count(self):
+        return self._doc_count
+
+    def _term_at(self, number):
+        return self._term_data[self._term_offsets[number]:self._term_offsets[number + 1]].tobytes()
+
+    def postings(self, term):
+        target = term.encode("utf-8")
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term_at(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.term_count or self._term_at(low) != target:
+            return EMPTY_POSTINGS
+        start, end = self._post_offsets[low], self._post_offsets[low + 1]
+        return self._post_doc_ids[start:end], self._post_freqs[start:end], self._post_order[start:end]
+
+    def document(self, doc_id):
+        return json.loads(self._doc_data[self._doc_offsets[doc_id]:self._doc_offsets[doc_id + 1]].tobytes())
+
+
+# Function to memory-map an index file written by write_index
+def open_index(path):
+    with open(path, "rb") as index_file:
+        return MappedIndex(mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+# Function to yield every document of an index in id order
+def iter_documents(index):
+    for doc_id in range(index.doc_count):
+        yield index.document(doc_id)
+
+
+# Function to find the documents superseded by a newer copy of their URL (indexes are listed oldest
+# first, a later document wins within a segment too); returns one set of doc ids per index. Only the
+# stored URL hashes are read, no document is decoded
+def stale_documents(indexes):
+    stale = []
+    newer = set()
+    for index in reversed(indexes):
+        hashes = index.url_hashes.tolist()
+        # URL hash -> its last doc id; any earlier doc id with the same URL is superseded
+        last = dict(zip(hashes, range(len(hashes))))
+        superseded = set(range(len(hashes))).difference(last.values()) if len(last) < len(hashes) else set()
+        superseded.update(last[key] for key in newer.intersection(last))
+        newer.update(last)
+        stale.append(superseded)
+    return tuple(reversed(stale))
+
+
+# Function to rank documents of one or more indexes with BM25 and return the top k. Each term's postings
+# are read from the highest impact down, and every new document is scored in full at once by looking it
+# up in the other terms' id-ordered postings. A segment is finished when the k-th best score reaches the
+# most a document not yet seen there could score, or, once every such document must contain two or more
+# given terms, by scoring what is left of their intersection; usually only the head of each list is read
+def bm25_search(indexes, query, k=10, stale=None):
+    terms = list(dict.fromkeys(analyze(query)))
+    doc_count = sum(index.doc_count for index in indexes)
+    if not terms or not doc_count or k <= 0:
+        return []
+    average_length = sum(index.total_length for index in indexes) / doc_count or 1.0
+    if stale is None:
+        stale = stale_documents(indexes)
+
+    # term_postings[term_number][index_number] = (doc_ids, frequencies, order)
+    term_postings = [[index.postings(term) for index in indexes] for term in terms]
+    weights = []
+    for postings in term_postings:
+        document_frequency = sum(len(doc_ids) for doc_ids, _, _ in postings)
+        idf = math.log(1 + (doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+        weights.append(idf * (BM25_K1 + 1))
+
+    # Impact order uses the segment's own average length and scores use the corpus-wide one; with
+    # ratio = min(1, local / corpus average) a local impact l bounds the corpus-wide one by l / (l + ratio * (1 - l))
+    bound_ratios = [min(1.0, average_doc_length(index) / average_length) for index in indexes]
+
+    def bound(term_number, index_number, position):
+        doc_ids, frequencies, order = term_postings[term_number][index_number]
+        posting = order[position]
+        index = indexes[index_number]
+        impact = term_impact(frequencies[posting], index.doc_lengths[doc_ids[posting]], average_doc_length(index))
+        # Rounding slack, so a bound never falls below the score it stands for
+        return weights[term_number] * impact / (impact + bound_ratios[index_number] * (1 - impact)) * (1 + 1e-9)
+
+    # Per segment: term number -> [bound, position] of the next unread posting, and the terms every
+    # document of the segment not yet seen must contain to still reach the top k
+    cursors = [
+        {term_number: [bound(term_number, index_number, 0), 0]
+         for term_number, postings in enumerate(term_postings) if len(postings[index_number][0])}
+        for index_number in range(len(indexes))
+    ]
+    required = [set() for _ in indexes]
+
+    # Per segment, the postings of every query term found there, for scoring a document in full
+    segment_postings = [
+        [(weights[term_number], term_postings[term_number][index_number][0], term_postings[term_number][index_number][1])
+         for term_number in segment_cursors]
+        for index_number, segment_cursors in enumerate(cursors)
+    ]
+
+    def score(index_number, doc_id):
+        doc_length = indexes[index_number].doc_lengths[doc_id]
+        total = 0.0
+        for weight, doc_ids, frequencies in segment_postings[index_number]:
+            position = bisect_left(doc_ids, doc_id)
+            if position < len(doc_ids) and doc_ids[position] == doc_id:
+                total += weight * term_impact(frequencies[position], doc_length, average_length)
+        return total
+
+    # Min-heap of the k best (score, -index_number, -doc_id): equal scores rank the older segment and the
+    # lower id first, though which of several documents tied at the cut-off makes the list is arbitrary
+    top = []
+    # Per segment: the documents scored or ruled out, and once there are two or more required terms,
+    # the documents holding all of them with a count of those still unseen
+    seen = [set() for _ in indexes]
+    allowed = [None for _ in indexes]
+    allowed_unseen = [0 for _ in indexes]
+
+    def offer(index_number, doc_id):
+        entry = (score(index_number, doc_id), -index_number, -doc_id)
+        if len(top) < k:
+            heapq.heappush(top, entry)
+        elif entry > top[0]:
+            heapq.heapreplace(top, entry)
+
+    while True:
+        threshold = top[0][0] if len(top) == k else None
+        candidates = []
+        for index_number, segment_cursors in enumerate(cursors):
+            if not segment_cursors:
+                continue
+            total = sum(cursor[0] for cursor in segment_cursors.values())
+            segment_required = required[index_number]
+            if threshold is not None:
+                if total <= threshold:
+                    segment_cursors.clear()
+                    continue
+                grown = len(segment_required)
+                segment_required.update(
+                    term_number for term_number, cursor in segment_cursors.items() if total - cursor[0] <= threshold
+                )
+                if len(segment_required) >= 2 and len(segment_required) > grown:
+                    # Intersect the required terms' postings, smallest first, with plain set operations
+                    by_length = sorted((term_postings[term_number][index_number][0] for term_number in segment_required), key=len)
+                    left = set(by_length[0].tolist())
+                    for doc_ids in by_length[1:]:
+                        left.intersection_update(doc_ids.tolist())
+                    left -= stale[index_number]
+                    left -= seen[index_number]
+                    allowed[index_number] = left
+                    allowed_unseen[index_number] = len(left)
+            if allowed[index_number] is not None and allowed_unseen[index_number] <= SEARCH_INTERSECTION_SIZE:
+                # Few enough documents can still make it to score them all and finish the segment
+                for doc_id in allowed[index_number] - seen[index_number]:
+                    offer(index_number, doc_id)
+                segment_cursors.clear()
+                continue
+            candidates.extend(
+                (cursor[0], term_number, index_number) for term_number, cursor in segment_cursors.items()
+                if not segment_required or term_number in segment_required
+            )
+        if not candidates:
+            break
+
+        # Read a block from the list with the highest bound
+        _, term_number, index_number = max(candidates)
+        segment_cursors = cursors[index_number]
+        cursor = segment_cursors[term_number]
+        # A document first met here gets at most the current bounds of its segment's other lists
+        others = sum(other[0] for other_term, other in segment_cursors.items() if other_term != term_number)
+        weight = weights[term_number]
+        doc_ids, frequencies, order = term_postings[term_number][index_number]
+        doc_lengths = indexes[index_number].doc_lengths
+        segment_stale = stale[index_number]
+        segment_seen = seen[index_number]
+        segment_allowed = allowed[index_number]
+        position = cursor[1]
+        end = min(position + SEARCH_BLOCK_SIZE, len(order))
+        for posting in order[position:end]:
+            doc_id = doc_ids[posting]
+            if doc_id in segment_seen or doc_id in segment_stale:
+                continue
+            if segment_allowed is not None:
+                if doc_id not in segment_allowed:
+                    continue
+                allowed_unseen[index_number] -= 1
+            segment_seen.add(doc_id)
+            if len(top) == k:
+                # No lookups when even the best case cannot enter the top k
+                contribution = weight * term_impact(frequencies[posting], doc_lengths[doc_id], average_length)
+                if contribution + others <= top[0][0]:
+                    continue
+            offer(index_number, doc_id)
+        if end < len(order):
+            cursor[:] = [bound(term_number, index_number, end), end]
+        elif term_number in required[index_number]:
+            # Every document that could still make it contains this term and has now been read
+            segment_cursors.clear()
+        else:
+            del segment_cursors[term_number]
+
+    return [indexes[-index_number].document(-doc_id) for _, index_number, doc_id in sorted(top, reverse=True)]
+
+
+# Function to read the list of live segments; an index that was never written has none
+def read_manifest(directory=SOURCE_INDEX_DIR):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except FileNotFoundError:
+        return {"generation": 0, "segments": []}
+
+
+def _lock_expired(path):
+    return time.time() - os.path.getmtime(path) > MANIFEST_LOCK_TIMEOUT
+
+
+def _break_expired_lock(path):
+    # Waiters that find an expired lock take turns through a second lock file and check the lock
+    # again while holding it, so a lock another waiter has just created is never removed
+    break_path = f"{path}.break"
+    try:
+        break_fd = os.open(break_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            # Left behind by a process that died while breaking a lock
+            if _lock_expired(break_path):
+                os.remove(break_path)
+        except OSError:
+            pass
+        return False
+    try:
+        if _lock_expired(path):
+            os.remove(path)
+            return True
+        return False
+    except OSError:
+        return True
+    finally:
+        os.close(break_fd)
+        os.remove(break_path)
+
+
+# Lock file held by whichever process is editing the manifest
+@contextmanager
+def _manifest_lock(directory):
+    path = os.path.join(directory, MANIFEST_LOCK_NAME)
+    while True:
+        try:
+            lock_fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                expired = _lock_expired(path)
+            except OSError:
+                # Released in the meantime
+                continue
+            if expired and _break_expired_lock(path):
+                continue
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(lock_fd)
+        os.remove(path)
+
+
+# Function to change the live segment list; update gets the current list and returns the new one,
+# or None to leave it alone. The manifest is replaced in one rename, so readers see either list
+def _update_manifest(directory, update):
+    os.makedirs(directory, exist_ok=True)
+    with _manifest_lock(directory):
+        manifest = read_manifest(directory)
+        segments = update(list(manifest["segments"]))
+        if segments is None:
+            return False
+        # Dropped segments get their grace period from now, not from when they were written
+        for name in set(manifest["segments"]) - set(segments):
+            try:
+                os.utime(os.path.join(directory, name))
+            except OSError:
+                pass
+        path = os.path.join(directory, MANIFEST_NAME)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump({"generation": manifest["generation"] + 1, "segments": segments}, manifest_file)
+        os.replace(tmp_path, path)
+    _remove_unused_segments(directory, segments)
+    return True
+
+
+def _remove_unused_segments(directory, live_segments):
+    # Old segments stay for a while after they leave the manifest (_update_manifest touches them then) so
+    # readers that just read the previous manifest can still open them, and a segment that was written
+    # but not yet committed is not mistaken for garbage
+    live_segments = set(live_segments)
+    now = time.time()
+    for entry in os.scandir(directory):
+        if not (entry.name.startswith("seg-") and entry.name.endswith(".idx")) or entry.name in live_segments:
+            continue
+        try:
+            if now - entry.stat().st_mtime > SEGMENT_GRACE_SECONDS:
+                os.remove(entry.path)
+        except OSError:
+            # Still mapped by a reader on platforms that forbid it; try again on a later update
+            pass
+
+
+# Function to write documents into a new segment file that is not yet live
+def _write_segment(directory, documents):
+    name = f"seg-{time.time_ns()}-{os.urandom(4).hex()}.idx"
+    write_index(os.path.join(directory, name), MemoryIndex(documents))
+    return name
+
+
+# Function to add documents to the index as a new segment; returns its name
+def append_segment(documents, directory=SOURCE_INDEX_DIR):
+    documents = list(documents)
+    if not documents:
+        return None
+    name = _write_segment(directory, documents)
+    _update_manifest(directory, lambda segments: segments + [name])
+    return name
+
+
+# Function to replace the whole index with a single segment holding documents
+def replace_segments(documents, directory=SOURCE_INDEX_DIR):
+    name = _write_segment(directory, list(documents))
+    _update_manifest(directory, lambda segments: [name])
+    return name
+
+
+# Function to merge neighbouring segments into one. Without force it only runs when there are more than
+# factor segments and merges the run of factor neighbours with the fewest bytes; with force it merges
+# them all. Where a URL is in several segments the newest copy wins. Returns True if a merge was committed
+def merge_segments(directory=SOURCE_INDEX_DIR, factor=SEGMENT_MERGE_FACTOR, force=False):
+    segments = read_manifest(directory)["segments"]
+    if force:
+        window = segments
+    elif len(segments) > factor:
+        sizes = [os.path.getsize(os.path.join(directory, name)) for name in segments]
+        start = min(range(len(segments) - factor + 1), key=lambda start: sum(sizes[start:start + factor]))
+        window = segments[start:start + factor]
+    else:
+        return False
+    if len(window) < 2:
+        return False
+
+    documents = {}
+    for name in window:
+        for document in iter_documents(open_index(os.path.join(directory, name))):
+            documents[document["url"]] = document
+    merged = _write_segment(directory, documents.values())
+
+    def replace_window(segments):
+        # Appends may have landed meanwhile; only the merged run itself must be unchanged
+        if window[0] not in segments:
+            return None
+        start = segments.index(window[0])
+        if segments[start:start + len(window)] != window:
+            return None
+        return segments[:start] + [merged] + segments[start + len(window):]
+
+    if _update_manifest(directory, replace_window):
+        return True
+    os.remove(os.path.join(directory, merged))
+    return False
+
+
+_merge_thread = None
+_merge_lock = threading.Lock()
+
+
+def _merge_until_small(directory):
+    # A failed merge leaves the manifest untouched; it is retried after the next refresh
+    try:
+        while merge_segments(directory):
+            pass
+    except (OSError, ValueError):
+        pass
+
+
+# Function to merge segments on a background thread, at most one per process
+def merge_in_background(directory=SOURCE_INDEX_DIR):
+    global _merge_thread
+    with _merge_lock:
+        if _merge_thread is None or not _merge_thread.is_alive():
+            _merge_thread = threading.Thread(target=_merge_until_small, args=(directory,), name="source-index-merge", daemon=True)
+            _merge_thread.start()
+
+
+# Searcher over the segmented source corpus. The manifest is checked every few seconds; new segments
+# are opened and swapped in together with their superseded documents as one tuple, so each
+# search runs on a consistent snapshot even while segments are being appended or merged
+class SourceSearch:
+    def __init__(self, directory=SOURCE_INDEX_DIR, fallback=None, refresh_seconds=SEGMENT_REFRESH_SECONDS):
+        self.directory = directory
+        self.fallback = fallback or (MemoryIndex(SEED_SOURCES),)
+        self.refresh_seconds = refresh_seconds
+        self._snapshot = (self.fallback, stale_documents(self.fallback))
+        self._segments = {}
+        self._generation = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    # Function to get the current indexes and their superseded documents, checking for new segments when a refresh is due
+    def snapshot(self):
+        if time.monotonic() >= self._next_check and self._lock.acquire(blocking=False):
+            try:
+                self._refresh()
+            finally:
+                self._lock.release()
+        return self._snapshot
+
+    def _refresh(self):
+        self._next_check = time.monotonic() + self.refresh_seconds
+        try:
+            manifest = read_manifest(self.directory)
+            if manifest["generation"] == self._generation:
+                return
+            # Segments are immutable, so the ones already mapped are reused as they are
+            segments = {
+                name: self._segments.get(name) or open_index(os.path.join(self.directory, name))
+                for name in manifest["segments"]
+            }
+        except (OSError, ValueError):
+            # Caught the manifest mid-change or a segment was just merged away; keep the old snapshot
+            return
+        indexes = tuple(segments[name] for name in manifest["segments"]) or self.fallback
+        self._segments = segments
+        self._snapshot = (indexes, stale_documents(indexes))
+        self._generation = manifest["generation"]
+        if len(segments) > SEGMENT_MERGE_FACTOR:
+            merge_in_background(self.directory)
+
+    def search(self, query, k=10):
+        indexes, stale = self.snapshot()
+        return bm25_search(indexes, query, k, stale)
+
+
+_source_search = None
+_source_search_lock = threading.Lock()
+
+
+# Function to get the process-wide source searcher
+def get_source_search():
+    global _source_search
+    if _source_search is None:
+        with _source_search_lock:
+            if _source_search is None:
+                _source_search = SourceSearch()
+    return _source_search
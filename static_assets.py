@@ -0,0 +1,47 @@
+import os
+import re
+import threading
+
+# Stylesheets and static HTML (hero text, quote box, team lists) shared by the apps
+STATIC_DIR = os.getenv("PALESTINE_AI_STATIC_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "static"))
+
+CSS_COMMENTS = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_SPACES = re.compile(r"\s*([{}:;,>])\s*")
+WHITESPACE = re.compile(r"\s+")
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+# Function to minify a stylesheet: comments, indentation and the spaces around punctuation removed
+def minify_css(css):
+    css = WHITESPACE.sub(" ", CSS_COMMENTS.sub("", css))
+    return CSS_SPACES.sub(r"\1", css).replace(";}", "}").strip()
+
+
+# Function to collapse an HTML fragment onto one line, so markdown keeps it as a single HTML block
+def minify_html(html):
+    return WHITESPACE.sub(" ", html).strip()
+
+
+def _compile(name, build):
+    # Compiled once per file version; editing a file in static/ takes effect on the next rerun
+    path = os.path.join(STATIC_DIR, name)
+    modified = os.stat(path).st_mtime_ns
+    entry = _compiled.get(name)
+    if entry is None or entry[0] != modified:
+        with open(path, encoding="utf-8") as static_file:
+            compiled = build(static_file.read())
+        with _compiled_lock:
+            _compiled[name] = entry = (modified, compiled)
+    return entry[1]
+
+
+# Function to get a stylesheet from static/ as one minified <style> block, e.g. stylesheet("version3.css")
+def stylesheet(name):
+    return _compile(name, lambda css: f"<style>{minify_css(css)}</style>")
+
+
+# Function to get an HTML fragment from static/, minified, e.g. static_html("version3_quote.html")
+def static_html(name):
+    return _compile(name, minify_html)
@@ -0,0 +1,204 @@
+import re
+import unicodedata
+
+# Keywords that identify a Palestine question on their own, including terms that only make
+# sense in this topic (settler, checkpoint, Oslo) and the demonyms of its places
+STRONG_KEYWORDS = [
+    "palestine", "palestinian", "gaza", "west bank", "jerusalem", "east jerusalem", "al-quds",
+    "israel", "israeli", "intifada", "nakba", "naksa", "hamas", "fatah",
+    "plo", "bds", "boycott", "zionism", "zionist",
+    "al-aqsa", "dome of the rock", "hebron", "ramallah", "bethlehem", "nablus",
+    "jenin", "rafah", "khan younis", "unrwa", "right of return",
+    "two-state", "one-state", "apartheid wall", "separation wall", "shahid",
+    "idf", "holy land", "balfour", "1948", "1967", "six-day war", "deir yassin",
+    "sabra and shatila", "golan", "un resolution", "administrative detention",
+    "keffiyeh", "btselem", "pchr", "al haq", "adalah", "badil", "passia", "miftah", "pngo",
+    "pflp", "dflp", "temple mount", "haram al-sharif", "church of the nativity",
+    "ibrahimi mosque", "cave of the patriarchs", "rachel's tomb", "joseph's tomb",
+    "from the river to the sea", "free palestine", "save palestine",
+    "gazan", "jerusalemite", "hebronite", "west banker", "occupied territories", "occupied territory",
+    "occupation", "settlement", "settler", "refugee", "oslo", "apartheid", "checkpoint",
+    "yasser arafat", "arafat", "mahmoud abbas", "marwan barghouti", "shireen abu akleh",
+    "netanyahu", "ben-gvir", "smotrich", "knesset", "sheikh jarrah", "silwan", "masafer yatta",
+    "huwara", "jabalia", "nuseirat", "deir al-balah", "tulkarm", "qalqilya", "jericho", "qalandia",
+    "فلسطين", "فلسطيني", "غزة", "الضفة الغربية", "القدس", "الأقصى", "قبة الصخرة",
+    "إسرائيل", "إسرائيلي", "الاحتلال", "الانتفاضة", "النكبة", "النكسة", "حماس",
+    "منظمة التحرير", "المقاطعة", "الاستيطان", "مستوطنة", "مستوطن", "الصهيونية", "صهيوني",
+    "الخليل", "رام الله", "بيت لحم", "نابلس", "جنين", "رفح", "خان يونس", "الأونروا",
+    "حق العودة", "أوسلو", "لاجئ", "حاجز", "غزاوي", "الفصل العنصري", "جدار الفصل", "بلفور", "الكوفية",
+    "طوفان الأقصى", "دير ياسين", "صبرا وشاتيلا", "من النهر إلى البحر",
+    "ياسر عرفات", "عرفات", "محمود عباس", "مروان البرغوثي", "شيرين أبو عاقلة", "نتنياهو", "الكنيست",
+    "الشيخ جراح", "سلوان", "مسافر يطا", "حوارة", "جباليا", "النصيرات", "دير البلح", "طولكرم", "قلقيلية",
+    "أريحا", "قلنديا",
+]
+
+# Generic keywords that only count towards the topic together with another keyword
+CONTEXT_KEYWORDS = [
+    "wall", "barrier", "blockade", "olive", "olive tree", "resistance", "martyr",
+    "arab", "middle east", "levant", "uprising", "protest", "demonstration",
+    "solidarity", "human rights", "international law", "colonization", "annexation",
+    "displacement", "demolition", "prisoner", "detention", "hunger strike",
+    "flotilla", "aid", "humanitarian", "ceasefire", "peace process",
+    "negotiation", "mediation", "conflict", "war", "attack", "bombing",
+    "airstrike", "rocket", "tunnel", "border", "crossing", "siege",
+    "sanction", "embargo", "economy", "water", "electricity", "infrastructure",
+    "education", "health", "culture", "heritage", "identity", "diaspora",
+    "return", "citizenship", "stateless", "nationality", "flag", "key", "map", "partition",
+    "resolution", "un", "unesco", "icj", "icc", "amnesty", "hrw",
+    "jihad", "islamic", "christian", "muslim", "jew", "holy site",
+    "الحصار", "المقاومة", "شهيد", "الأسرى", "أسير", "الجدار", "العودة",
+]
+
+STRONG_WEIGHT = 2
+CONTEXT_WEIGHT = 1
+TOPIC_THRESHOLD = 2
+
+# Arabic harakat, Quranic annotation marks, superscript alef and tatweel
+ARABIC_DIACRITICS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]")
+ARABIC_LETTER_FORMS = str.maketrans({"\u0623": "\u0627", "\u0625": "\u0627", "\u0622": "\u0627", "\u0671": "\u0627", "\u0649": "\u064a", "\u0629": "\u0647"})
+TOKEN = re.compile(r"\w+")
+
+# Clitics attached to Arabic words: conjunction/preposition + article, and common endings
+ARABIC_ARTICLE_PREFIXES = ("وبال", "وال", "بال", "فال", "كال", "لل", "ال")
+ARABIC_LETTER_PREFIXES = ("و", "ف", "ب", "ل", "ك")
+ARABIC_SUFFIXES = ("يين", "ون", "ين", "ات", "ها", "هم", "ه")
+
+
+# Function to fold case, Arabic diacritics and letter variants
+def normalize_text(text):
+    if text.isascii():
+        # Nothing to fold beyond case
+        return text.lower()
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = ARABIC_DIACRITICS.sub("", text)
+    return text.translate(ARABIC_LETTER_FORMS)
+
+
+def is_arabic(token):
+    return "\u0600" <= token[0] <= "\u06ff"
+
+
+# Function to reduce a keyword token to its canonical form (Arabic article removed)
+def canonical_token(token):
+    if is_arabic(token):
+        for prefix in ARABIC_ARTICLE_PREFIXES:
+            if token.startswith(prefix) and len(token) - len(prefix) >= 3:
+                return token[len(prefix):]
+    return token
+
+
+def tokenize(text):
+    return TOKEN.findall(normalize_text(text))
+
+
+# Function to compile token sequences into a prefix-trie regex, so the engine never retries a shared
+# prefix; separator is the regex placed between the tokens of a sequence
+def trie_regex(token_sequences, separator=r"\W+"):
+    trie = {}
+    for tokens in token_sequences:
+        node = trie
+        for number, token in enumerate(tokens):
+            if number:
+                node = node.setdefault(" ", {})
+            for char in token:
+                node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node):
+        branches = [
+            (separator if char == " " else re.escape(char)) + render(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Optional continuation: the engine tries the longer sequence first
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+# Function to compile keywords into a trie regex over their canonical tokens, so one pass of the regex
+# engine over the query tests every keyword. A word may carry an Arabic clitic in front (the article
+# inside a phrase) and a plural or Arabic ending after the last word
+def build_trie_pattern(token_sequences, arabic=True):
+    inner_prefix = "(?:" + "|".join(map(re.escape, ARABIC_ARTICLE_PREFIXES)) + ")?" if arabic else ""
+    prefixes = ARABIC_ARTICLE_PREFIXES + ARABIC_LETTER_PREFIXES if arabic else ()
+    suffixes = ARABIC_SUFFIXES + ("es", "s") if arabic else ("es", "s")
+    prefix = "(?:" + "|".join(sorted(prefixes, key=len, reverse=True)) + ")?" if prefixes else ""
+    body = trie_regex(token_sequences, r"\W+" + inner_prefix)
+    return (
+        rf"(?<!\w){prefix}"
+        f"(?P<term>{body})"
+        "(?:" + "|".join(sorted(suffixes, key=len, reverse=True)) + r")?(?!\w)"
+    )
+
+
+# Function to key a keyword, or the words a match covered, by its canonical tokens
+def keyword_key(tokens):
+    return " ".join(tokens[:1] + [canonical_token(token) for token in tokens[1:]])
+
+
+# Build the keyword table (canonical tokens -> keyword and weight) once at import
+def build_keyword_table(weighted_keywords):
+    keywords = {}
+    for keyword, weight in weighted_keywords:
+        tokens = [canonical_token(token) for token in tokenize(keyword)]
+        if tokens:
+            keywords.setdefault(keyword_key(tokens), (keyword, weight))
+    return keywords
+
+
+KEYWORDS = build_keyword_table(
+    [(keyword, STRONG_WEIGHT) for keyword in STRONG_KEYWORDS]
+    + [(keyword, CONTEXT_WEIGHT) for keyword in CONTEXT_KEYWORDS]
+)
+# Every keyword with Arabic clitics, and the Latin-script keywords alone for ASCII queries
+KEYWORD_PATTERN = re.compile(build_trie_pattern(key.split(" ") for key in KEYWORDS))
+ASCII_KEYWORD_PATTERN = re.compile(build_trie_pattern((key.split(" ") for key in KEYWORDS if key.isascii()), arabic=False))
+# Single-word strong keywords with their plurals: one set intersection settles most on-topic ASCII queries
+STRONG_WORDS = frozenset(
+    form
+    for key, (_, weight) in KEYWORDS.items() if weight >= TOPIC_THRESHOLD and key.isascii() and " " not in key
+    for form in (key, key + "s", key + "es")
+)
+
+
+# Function to yield the keywords of a normalized text with their weights, in order of appearance
+def iter_keywords(text):
+    pattern = ASCII_KEYWORD_PATTERN if text.isascii() else KEYWORD_PATTERN
+    for match in pattern.finditer(text):
+        found = KEYWORDS.get(keyword_key(TOKEN.findall(match.group("term"))))
+        if found is not None:
+            yield found
+
+
+# Function to find the keywords in a query, with their weights, in order of appearance
+def find_keywords(query):
+    found = {}
+    for keyword, weight in iter_keywords(normalize_text(query)):
+        found.setdefault(keyword, weight)
+    return found
+
+
+# Function to list the keywords found in a query
+def match_palestine_keywords(query):
+    return list(find_keywords(query))
+
+
+# Function to check if query is related to Palestine: one strong keyword or two generic ones.
+# An ASCII query containing a strong single word is settled by a set lookup; otherwise the regex
+# scan stops as soon as the threshold is reached
+def is_palestine_related(query):
+    text = normalize_text(query)
+    if text.isascii() and not STRONG_WORDS.isdisjoint(TOKEN.findall(text)):
+        return True
+    seen = set()
+    score = 0
+    for keyword, weight in iter_keywords(text):
+        if keyword not in seen:
+            seen.add(keyword)
+            score += weight
+            if score >= TOPIC_THRESHOLD:
+                return True
+    return False
@@ -1,26 +1,24 @@
 import streamlit as st
-import google.generativeai as genai
-import time
 import os
 import requests
 from PIL import Image
 import io
 import base64
+from answer_cache import get_answer_cache, cache_namespace
+from rendering import render_chunked, lazy_tabs, RENDER_FPS
+from topic_gate import is_palestine_related
+from models import get_text_model, warm_up_models
+from datasets import get_dataset
+from company_search import search_companies
+from brand_graph import lookup_brand
+from batch_check import STATUS_NOT_LISTED, check_shopping_list, results_to_csv
+from prerender import boycott_category_html, education_category_html
 
-# Configure Gemini with your API key
+# Gemini API key (the client itself is configured once by the model registry)
 google_api_key = os.getenv("GOOGLE_API_KEY")
-genai.configure(api_key=google_api_key)
 
-# Load Gemini models
-model_text = genai.GenerativeModel(
-    model_name="gemini-2.0-flash-thinking-exp-01-21",
-    generation_config=genai.types.GenerationConfig(
-        temperature=0.7,
-        top_p=0.95,
-        top_k=40,
-        max_output_tokens=4000  # Increased token limit for deeper, longer responses
-    )
-)
+# Shared Gemini text model, built once per process
+model_text = get_text_model()
 
 # Enhanced prompt template for Palestine-related questions with more reliable sources
 def build_palestine_prompt(user_question):
@@ -69,284 +67,73 @@ User question:
 Your answer (detailed, accurate, context-aware):
 """
 
+# Stream answers token by token (set PALESTINE_AI_STREAM=0 to fall back to blocking calls)
+STREAM_ANSWERS = os.getenv("PALESTINE_AI_STREAM", "1") != "0"
+
+# Process-wide answer cache, invalidated whenever the model or prompt template changes
+answer_cache = get_answer_cache()
+ANSWER_CACHE_NAMESPACE = cache_namespace(model_text.model_name, build_palestine_prompt(""))
+
 # Ask Gemini Pro for an in-depth response with improved error handling
 def ask_about_palestine(user_question):
+    # Serve repeated questions from the shared answer cache
+    cached_answer = answer_cache.get(user_question, namespace=ANSWER_CACHE_NAMESPACE)
+    if cached_answer is not None:
+        return cached_answer
+
     prompt = build_palestine_prompt(user_question)
     try:
         response = model_text.generate_content(prompt)
+        answer_cache.put(user_question, response.text, namespace=ANSWER_CACHE_NAMESPACE)
         return response.text
     except Exception as e:
-        error_message = str(e)
-        # Handle specific error types
-        if "quota" in error_message.lower():
-            return "❌ API quota exceeded. Please try again later or contact the administrator."
-        elif "blocked" in error_message.lower() or "safety" in error_message.lower():
-            return "❌ The response was blocked due to safety concerns. Please rephrase your question or try a different topic related to Palestine."
-        elif "timeout" in error_message.lower():
-            return "❌ The request timed out. Please try again with a more specific question."
-        else:
-            return f"❌ Error getting response: {error_message}. Please try again or contact support."
+        return describe_gemini_error(e)
 
-# Function to simulate typing effect with improved performance
-def typing_effect(text, delay=0.003):
-    # For very long responses, reduce the typing effect to improve performance
-    if len(text) > 1000:
-        delay = 0.001
-    
-    output = ""
-    placeholder = st.empty()
-    for char in text:
-        output += char
-        placeholder.markdown(f"<div style='line-height: 1.5;'>{output}</div>", unsafe_allow_html=True)
-        time.sleep(delay)
+# Stream the answer chunk by chunk as Gemini generates it
+def ask_about_palestine_stream(user_question):
+    cached_answer = answer_cache.get(user_question, namespace=ANSWER_CACHE_NAMESPACE)
+    if cached_answer is not None:
+        yield cached_answer
+        return
+
+    prompt = build_palestine_prompt(user_question)
+    chunks = []
+    try:
+        for chunk in model_text.generate_content(prompt, stream=True):
+            chunks.append(chunk.text)
+            yield chunk.text
+    except Exception as e:
+        yield ("\n\n" if chunks else "") + describe_gemini_error(e)
+        return
+
+    # Only complete answers are cached
+    answer_cache.put(user_question, "".join(chunks), namespace=ANSWER_CACHE_NAMESPACE)
+
+# Turn a Gemini exception into a user-facing message
+def describe_gemini_error(e):
+    error_message = str(e)
+    # Handle specific error types
+    if "quota" in error_message.lower():
+        return "❌ API quota exceeded. Please try again later or contact the administrator."
+    elif "blocked" in error_message.lower() or "safety" in error_message.lower():
+        return "❌ The response was blocked due to safety concerns. Please rephrase your question or try a different topic related to Palestine."
+    elif "timeout" in error_message.lower():
+        return "❌ The request timed out. Please try again with a more specific question."
+    else:
+        return f"❌ Error getting response: {error_message}. Please try again or contact support."
+
+# Function to simulate typing effect, batched into a bounded number of frames
+def typing_effect(text, fps=RENDER_FPS):
+    render_chunked(text, fps=fps)
 
 
 # Function to get detailed boycott data
 def get_boycott_data_EN():
-    # Predefined boycott data based on research
-    boycott_data = {
-        "Food & Beverages": {
-            "companies": [
-                {
-                    "name": "Starbucks",
-                    "reason": "Howard Schultz, founder and major shareholder of Starbucks, is a staunch supporter of Israel who invests heavily in Israel's economy, including a recent $1.7 billion investment in cybersecurity startup Wiz.",
-                    "action": "Don't buy Starbucks products. Don't sell Starbucks products. Don't work for Starbucks.",
-                    "alternatives": ["Caffe Nero", "Local independent cafes", "Local Arab cafes"]
-                },
-                {
-                    "name": "Coca-Cola",
-                    "reason": "Coca-Cola has a bottling plant in the Atarot Industrial Zone, an illegal Israeli settlement in occupied East Jerusalem. The company continues to support Israel's economy despite human rights violations.",
-                    "action": "Boycott all Coca-Cola products, including Sprite, Fanta, and other associated brands.",
-                    "alternatives": ["Local beverage brands", "Homemade sparkling water", "Natural juices"]
-                },
-                {
-                    "name": "McDonald's",
-                    "reason": "McDonald's Israel provided thousands of free meals to Israeli soldiers during military operations in Gaza. The Israeli franchise has openly supported military actions against Palestinians.",
-                    "action": "Don't eat at McDonald's.",
-                    "alternatives": ["Local restaurants", "Local fast food chains"]
-                },
-                {
-                    "name": "Nestlé",
-                    "reason": "Nestlé has been operating in Israel since 1995 and has production facilities in contested areas. The company has been criticized for exploiting Palestinian water resources.",
-                    "action": "Avoid Nestlé products, including bottled water, cereals, and dairy products.",
-                    "alternatives": ["Local brands", "Artisanal products", "Filtered tap water"]
-                },
-                {
-                    "name": "PepsiCo",
-                    "reason": "PepsiCo operates in Israel and has facilities in contested territories. The company continues its activities despite calls for boycott.",
-                    "action": "Avoid all PepsiCo products, including Lay's chips, Doritos, and Pepsi beverages.",
-                    "alternatives": ["Local beverages", "Locally manufactured snacks"]
-                },
-                {
-                    "name": "Sabra Hummus",
-                    "reason": "Sabra is a joint venture between PepsiCo and the Strauss Group, an Israeli company that provides support to elite units of the Israeli military involved in human rights violations.",
-                    "action": "Don't buy Sabra hummus.",
-                    "alternatives": ["Homemade hummus", "Local Arab hummus brands"]
-                }
-            ]
-        },
-        "Technology": {
-            "companies": [
-                {
-                    "name": "HP (Hewlett-Packard)",
-                    "reason": "HP provides technologies used in Israel's control and surveillance system, including for military checkpoints. Its technologies are used to maintain the apartheid and segregation system.",
-                    "action": "Don't buy HP products, including computers, printers, and supplies.",
-                    "alternatives": ["Lenovo", "Brother", "Epson", "Asian brands"]
-                },
-                {
-                    "name": "Microsoft",
-                    "reason": "Microsoft invested $1.5 billion in an Israeli AI company and has a major R&D center in Israel. The company works closely with the Israeli military to develop military technologies.",
-                    "action": "Use open source alternatives when possible.",
-                    "alternatives": ["Linux", "LibreOffice", "Open source alternatives"]
-                },
-                {
-                    "name": "Google",
-                    "reason": "Google signed a $1.2 billion cloud computing contract with the Israeli government (Project Nimbus). This technology is used for surveillance and targeting of Palestinians.",
-                    "action": "Use alternative search engines and services.",
-                    "alternatives": ["DuckDuckGo", "ProtonMail", "Firefox"]
-                },
-                {
-                    "name": "Apple",
-                    "reason": "Apple has significant investments in Israel and collaborates with Israeli companies involved in surveillance and military technology.",
-                    "action": "Consider alternatives to Apple products.",
-                    "alternatives": ["Samsung", "Xiaomi", "Huawei", "Android phones"]
-                },
-                {
-                    "name": "Intel",
-                    "reason": "Intel is one of the largest employers in the Israeli tech sector with several plants and R&D centers. The company contributes significantly to Israel's economy.",
-                    "action": "Prefer AMD processors when possible.",
-                    "alternatives": ["AMD", "ARM", "Other processor manufacturers"]
-                }
-            ]
-        },
-        "Fashion & Clothing": {
-            "companies": [
-                {
-                    "name": "Puma",
-                    "reason": "Puma sponsors the Israel Football Association, which includes teams in illegal settlements. This support legitimizes the occupation and violations of international law.",
-                    "action": "Don't buy Puma products.",
-                    "alternatives": ["Adidas", "New Balance", "Local brands", "Li-Ning"]
-                },
-                {
-                    "name": "Skechers",
-                    "reason": "Skechers has stores in illegal Israeli settlements and maintains business partnerships in Israel, contributing to the occupation economy.",
-                    "action": "Boycott Skechers shoes and clothing.",
-                    "alternatives": ["Brooks", "ASICS", "Ethical brands"]
-                },
-                {
-                    "name": "H&M",
-                    "reason": "H&M operates stores in Israel, including in contested areas. The company has ignored calls to cease operations in occupied territories.",
-                    "action": "Don't shop at H&M.",
-                    "alternatives": ["Ethical fashion brands", "Second-hand clothing"]
-                },
-                {
-                    "name": "Zara",
-                    "reason": "Zara has stores in Israel and sources from Israeli suppliers. The brand has been criticized for its lack of ethical stance regarding the occupation.",
-                    "action": "Avoid shopping at Zara.",
-                    "alternatives": ["Local brands", "Independent boutiques"]
-                },
-                {
-                    "name": "Victoria's Secret",
-                    "reason": "Victoria's Secret is owned by L Brands, which has significant investments in Israel and stores in contested areas.",
-                    "action": "Boycott Victoria's Secret products.",
-                    "alternatives": ["Ethical lingerie brands", "Local brands"]
-                }
-            ]
-        },
-        "Cosmetics": {
-            "companies": [
-                {
-                    "name": "L'Oréal",
-                    "reason": "L'Oréal operates in Israel and has acquired Israeli cosmetics companies. The company has facilities in contested territories and benefits from the occupation.",
-                    "action": "Boycott L'Oréal products and its associated brands.",
-                    "alternatives": ["The Body Shop", "Lush", "Natural brands", "Halal cosmetics"]
-                },
-                {
-                    "name": "Estée Lauder",
-                    "reason": "Estée Lauder chairman, Ronald Lauder, is a strong supporter of Israel and funds pro-Israel organizations. He has publicly defended Israeli military actions against Palestinians.",
-                    "action": "Don't buy Estée Lauder products and its associated brands.",
-                    "alternatives": ["Ethical cosmetics brands", "Natural products"]
-                },
-                {
-                    "name": "Yves Saint Laurent Beauty / YSL Beauty",
-                    "reason": "YSL Beauty is owned by L'Oréal Group, which operates in Israel and has ties to Israeli companies involved in the occupation.",
-                    "action": "Avoid YSL Beauty products.",
-                    "alternatives": ["Ethical cosmetics brands", "Natural products"]
-                },
-                {
-                    "name": "Garnier",
-                    "reason": "Garnier is a subsidiary of L'Oréal that provided free products to Israeli soldiers during military operations in Gaza.",
-                    "action": "Don't buy Garnier products.",
-                    "alternatives": ["Natural hair products", "Local brands"]
-                }
-            ]
-        },
-        "Finance": {
-            "companies": [
-                {
-                    "name": "eToro",
-                    "reason": "eToro is an Israeli online trading company that supports Israel's economy and contributes to taxes that fund the occupation.",
-                    "action": "Use other trading and investment platforms.",
-                    "alternatives": ["Alternative trading platforms", "Ethical banks"]
-                },
-                {
-                    "name": "PayPal",
-                    "reason": "PayPal operates in Israel but refuses to provide its services to Palestinians in the occupied territories, creating blatant economic discrimination.",
-                    "action": "Use alternatives to PayPal when possible.",
-                    "alternatives": ["Wise", "Local banking services", "Bank transfers"]
-                },
-                {
-                    "name": "Citibank",
-                    "reason": "Citibank has significant investments in Israel and finances projects in occupied territories, contributing to the expansion of illegal settlements.",
-                    "action": "Avoid using Citibank services.",
-                    "alternatives": ["Local banks", "Credit unions", "Ethical banks"]
-                }
-            ]
-        },
-        "Other": {
-            "companies": [
-                {
-                    "name": "SodaStream",
-                    "reason": "SodaStream operated a factory in an illegal Israeli settlement in the occupied West Bank before relocating due to pressure. The company continues to benefit from discriminatory policies.",
-                    "action": "Don't buy SodaStream products.",
-                    "alternatives": ["Bottled sparkling water", "Other carbonation systems"]
-                },
-                {
-                    "name": "Volvo Heavy Machinery",
-                    "reason": "Volvo heavy equipment is used for demolishing Palestinian homes and building illegal settlements. These machines are essential tools of the occupation.",
-                    "action": "Raise awareness about the use of Volvo equipment in occupied territories.",
-                    "alternatives": ["Other heavy equipment manufacturers"]
-                },
-                {
-                    "name": "Caterpillar",
-                    "reason": "Caterpillar bulldozers are used to demolish Palestinian homes and build the illegal separation wall. These machines are specially modified for military demolitions.",
-                    "action": "Boycott Caterpillar products and raise awareness about their use.",
-                    "alternatives": ["Other construction equipment manufacturers"]
-                },
-                {
-                    "name": "Airbnb",
-                    "reason": "Airbnb lists properties in illegal Israeli settlements in occupied Palestinian territory, thus legitimizing the occupation and profiting from stolen land.",
-                    "action": "Don't use Airbnb for your travel bookings.",
-                    "alternatives": ["Booking.com (with vigilance)", "Local hotels", "Independent hostels"]
-                },
-                {
-                    "name": "TripAdvisor",
-                    "reason": "TripAdvisor promotes tourist attractions in illegal settlements without mentioning their illegal status under international law.",
-                    "action": "Avoid using TripAdvisor, particularly for Middle East travel.",
-                    "alternatives": ["Independent travel guides", "Local recommendations"]
-                }
-            ]
-        }
-    }
-    
-    return boycott_data
+    return get_dataset("boycott_en")
 
 
 def get_boycott_data_AR():
-    boycott_data = {
-        "Food & Beverages": {
-            "companies": [
-                {
-                    "name": "Starbucks",
-                    "reason1": "هاورد شولتز، مؤسس شركة ستاربكس والمساهم الأكبر فيها، يُعدّ من أبرز الداعمين للكيان الصهيوني، حيث يضخّ استثمارات بمليارات الدولارات في الاقتصاد الإسرائيلي، من بينها استثمار حديث بقيمة 1.7 مليار دولار في شركة أمن سيبراني إسرائيلية تُدعى 'Wiz'.",
-                    "action1": "لا تشتري منتجات ستاربكس. لا تبيع منتجات ستاربكس. لا تعمل في ستاربكس.",
-                    "alternatives1": ["Caffe Nero", "Local independent cafes", "Local Arab cafes"]
-                },
-                {
-                    "name": "Coca-Cola",
-                    "reason1": "تمتلك كوكا كولا مصنعًا للتعبئة في منطقة آتاروت الصناعية، وهي مستوطنة إسرائيلية غير قانونية في القدس الشرقية المحتلة. تستمر الشركة في دعم الاقتصاد الإسرائيلي رغم الانتهاكات الممنهجة لحقوق الإنسان.",
-                    "action1": "قاطع جميع منتجات كوكا كولا، بما في ذلك سبرايت، فانتا، والعلامات التجارية المرتبطة.",
-                    "alternatives1": ["Local beverage brands", "Homemade sparkling water", "Natural juices"]
-                },
-                {
-                    "name": "McDonald's",
-                    "reason1": "قدمت ماكدونالدز إسرائيل آلاف الوجبات المجانية للجنود الإسرائيليين أثناء العمليات العسكرية في غزة. وقد دعمت الامتيازات الإسرائيلية علنًا الإجراءات العسكرية ضد الفلسطينيين.",
-                    "action1": "لا تأكل في ماكدونالدز.",
-                    "alternatives1": ["Local restaurants", "Local fast food chains"]
-                },
-                {
-                    "name": "Nestlé",
-                    "reason1": "تعمل نستله في إسرائيل منذ عام 1995 وتمتلك منشآت إنتاج في مناطق متنازع عليها. وتواجه الشركة انتقادات لاستغلالها موارد المياه الفلسطينية.",
-                    "action1": "تجنب منتجات نستله، بما في ذلك المياه المعبأة، والحبوب، ومنتجات الألبان.",
-                    "alternatives1": ["Local brands", "Artisanal products", "Filtered tap water"]
-                },
-                {
-                    "name": "PepsiCo",
-                    "reason1": "تعمل شركة بيبسيكو في إسرائيل وتمتلك منشآت في أراضٍ متنازع عليها. وتواصل الشركة أنشطتها رغم الدعوات إلى المقاطعة.",
-                    "action1": "تجنب جميع منتجات بيبسيكو، بما في ذلك رقائق ليز، دوريتوس، ومشروبات بيبسي.",
-                    "alternatives1": ["Local beverages", "Locally manufactured snacks"]
-                },
-                {
-                    "name": "Sabra Hummus",
-                    "reason1": "شركة سابرا مشروع مشترك بين شركة بيبسيكو ومجموعة شتراوس الإسرائيلية، التي تدعم وحدات النخبة في الجيش الإسرائيلي المتورطة في انتهاكات حقوق الإنسان.",
-                    "action1": "لا تشترِ حمص سابرا.",
-                    "alternatives1": ["Homemade hummus", "Local Arab hummus brands"]
-                }
-            ]
-        }
-    }
-
-    return boycott_data
+    return get_dataset("boycott_ar")
 
 
 
@@ -354,512 +141,36 @@ def get_boycott_data_AR():
 # Function to get educational resources about Palestine
 
 def get_educational_resources_AR():
-    resources = {
-        "History": [
-            {
-                "title": "The Nakba: Palestinian Exodus of 1948",
-                "description1": "النكبة (كارثة بالعربية) تشير إلى التهجير الجماعي وتجريد الفلسطينيين من ممتلكاتهم أثناء إنشاء دولة إسرائيل في عام 1948. أُجبر أكثر من 750,000 فلسطيني على مغادرة منازلهم، وتم تدمير أكثر من 500 قرية فلسطينية.",
-                "sources": [
-                    {"name": "Institute for Palestine Studies", "url": "https://www.palestine-studies.org/"},
-                    {"name": "UN Archives", "url": "https://archives.un.org/"},
-                    {"name": "Palestinian Journeys", "url": "https://www.paljourneys.org/en/timeline/highlight/165/nakba"},
-                    {"name": "Metras", "url": "https://metras.co"},
-                    {"name": "Anadolu Agency (Arabic)", "url": "https://www.aa.com.tr/ar"}
-                ],
-                "key_facts1": [
-                    "تم تهجير أكثر من 750,000 فلسطيني",
-                    "تم تدمير أكثر من 500 قرية فلسطينية",
-                    "مصادرة 78٪ من الأراضي الفلسطينية التاريخية",
-                    "إنشاء أطول أزمة لاجئين غير محلولة في العالم"
-                ]
-            },
-            {
-                "title": "The 1967 Occupation and Its Consequences",
-                "description1": "في يونيو 1967، احتلت إسرائيل الضفة الغربية، والقدس الشرقية، وقطاع غزة، ومرتفعات الجولان، وشبه جزيرة سيناء خلال حرب الأيام الستة. هذا الاحتلال، الذي لا يزال مستمرًا حتى اليوم (باستثناء سيناء)، أدى إلى توسع المستوطنات الإسرائيلية غير القانونية ونظام من السيطرة العسكرية على السكان الفلسطينيين.",
-                "sources": [
-                    {"name": "United Nations", "url": "https://www.un.org/unispal/"},
-                    {"name": "B'Tselem", "url": "https://www.btselem.org/"},
-                    {"name": "Human Rights Watch", "url": "https://www.hrw.org/middle-east/north-africa/israel/palestine"},
-                    {"name": "Metras", "url": "https://metras.co"},
-                    {"name": "Anadolu Agency (Arabic)", "url": "https://www.aa.com.tr/ar"}
-                ],
-                "key_facts1": [
-                    "أكثر من 600,000 مستوطن إسرائيلي يعيشون بشكل غير قانوني في الضفة الغربية والقدس الشرقية",
-                    "أكثر من 60٪ من الضفة الغربية تحت السيطرة الإسرائيلية الكاملة (المنطقة ج)",
-                    "أكثر من 700 كم من الجدار الفاصل، والذي اعتبرته محكمة العدل الدولية غير قانوني",
-                    "أكثر من 65 قرارًا من الأمم المتحدة تدين الاحتلال، وجميعها تم تجاهلها من قبل إسرائيل"
-                ]
-            }
-        ],
-        "Human_Rights": [
-            {
-                "title": "Israeli Military Detention of Palestinian Children",
-                "description1": "تستمر إسرائيل في احتجاز الأطفال الفلسطينيين في السجون العسكرية، حيث يتم محاكمتهم أمام محاكم عسكرية. كثير من هؤلاء الأطفال يتم اعتقالهم من منازلهم ليلاً وتعرضهم للاعتداءات الجسدية والنفسية أثناء الاعتقال.",
-                "sources": [
-                    {"name": "Defense for Children International - Palestine", "url": "https://www.dci-palestine.org/"},
-                    {"name": "Amnesty International", "url": "https://www.amnesty.org/en/countries/middle-east-and-north-africa/israel-and-occupied-palestinian-territories/"},
-                    {"name": "Metras", "url": "https://metras.co"},
-                    {"name": "Anadolu Agency (Arabic)", "url": "https://www.aa.com.tr/ar"}
-                ],
-                "key_facts1": [
-                    "تم احتجاز أكثر من 100,000 طفل فلسطيني منذ عام 1967",
-                    "تحكم المحاكم العسكرية الإسرائيلية على الأطفال بعقوبات قاسية قد تصل إلى السجن لعدة سنوات",
-                    "يتعرض الأطفال الفلسطينيون للتعذيب الجسدي والنفسي أثناء الاحتجاز"
-                ]
-            },
-            {
-                "title": "Israeli Settler Violence Against Palestinians",
-                "description1": "العنف من قبل المستوطنين الإسرائيليين ضد الفلسطينيين يشمل الهجمات على الأشخاص والممتلكات. تتصاعد هذه الهجمات في الأراضي الفلسطينية المحتلة دون محاسبة، حيث تشهد المنطقة انتهاكات لحقوق الإنسان يومية.",
-                "sources": [
-                    {"name": "Human Rights Watch", "url": "https://www.hrw.org/middle-east/north-africa/israel/palestine"},
-                    {"name": "B'Tselem", "url": "https://www.btselem.org/"},
-                    {"name": "Metras", "url": "https://metras.co"},
-                    {"name": "Anadolu Agency (Arabic)", "url": "https://www.aa.com.tr/ar"}
-                ],
-                "key_facts1": [
-                    "أكثر من 100 هجوم من قبل المستوطنين الإسرائيليين سنويًا ضد الفلسطينيين",
-                    "المستوطنات الإسرائيلية غير القانونية تُعتبر بؤرًا للعنف ضد الفلسطينيين",
-                    "غالبًا ما تمر الهجمات من قبل المستوطنين دون محاسبة من السلطات الإسرائيلية"
-                ]
-            }
-        ],
-        "Culture": [
-            {
-                "title": "Palestinian Cultural Heritage and Identity",
-                "description1": "تتميز الثقافة الفلسطينية بتاريخ طويل من الفنون، والموسيقى، والآداب، والحرف اليدوية. رغم كل محاولات الطمس الثقافي، ظل الفلسطينيون يتمسكون بهويتهم من خلال الاحتفاظ بتقاليدهم وأغانيهم ورقصاتهم.",
-                "sources": [
-                    {"name": "Palestinian Museum", "url": "https://www.palmuseum.org/"},
-                    {"name": "Palestinian Heritage Foundation", "url": "https://www.palestinianheritage.org/"},
-                    {"name": "Metras", "url": "https://metras.co"},
-                    {"name": "Anadolu Agency (Arabic)", "url": "https://www.aa.com.tr/ar"}
-                ],
-                "key_facts1": [
-                    "الرقص الفلسطيني (الدبكة) هو جزء أساسي من الثقافة الفلسطينية",
-                    "تمثل الموسيقى الفلسطينية جزءًا كبيرًا من الهوية الوطنية الفلسطينية",
-                    "تتضمن الحرف اليدوية الفلسطينية أدوات منزلية وزخارف تمثل الحياة اليومية الفلسطينية"
-                ]
-            },
-            {
-                "title": "Palestinian Literature and Poetry",
-                "description1": "الأدب الفلسطيني يزخر بالكثير من الأعمال التي تعكس معاناة الشعب الفلسطيني وتاريخه. من بين أبرز الكتاب والشعراء الفلسطينيين: محمود درويش وغسان كنفاني.",
-                "sources": [
-                    {"name": "Maqalati", "url": "https://www.maqalati.com/"},
-                    {"name": "Palestinian Writers Union", "url": "https://www.pwu.ps/"},
-                    {"name": "Metras", "url": "https://metras.co"},
-                    {"name": "Anadolu Agency (Arabic)", "url": "https://www.aa.com.tr/ar"}
-                ],
-                "key_facts1": [
-                    "محمود درويش هو أحد أبرز الشعراء الفلسطينيين",
-                    "غسان كنفاني كان من أبرز الكتاب الفلسطينيين الذين ناضلوا من خلال الأدب",
-                    "تُعد قصيدة 'على هذه الأرض' لمحمود درويش واحدة من أشهر القصائد الفلسطينية"
-                ]
-            }
-        ],
-        "Resistance": [
-            {
-                "title": "The Palestinian Resistance Movement",
-                "description1": "تشكلت حركات المقاومة الفلسطينية منذ بداية الاحتلال الإسرائيلي، وهي تشمل العديد من الفصائل التي تسعى لاسترجاع حقوق الفلسطينيين وإنهاء الاحتلال.",
-                "sources": [
-                    {"name": "Palestinian Authority", "url": "https://www.palestine.gov/"},
-                    {"name": "Al-Qassam Brigades", "url": "https://www.qassam.ps/"},
-                    {"name": "Metras", "url": "https://metras.co"},
-                    {"name": "Anadolu Agency (Arabic)", "url": "https://www.aa.com.tr/ar"}
-                ],
-                "key_facts1": [
-                    "حركة حماس هي إحدى الفصائل الرئيسية في المقاومة الفلسطينية",
-                    "تأسست الجبهة الشعبية لتحرير فلسطين في عام 1967",
-                    "حركات المقاومة تواصل نضالها ضد الاحتلال الإسرائيلي من خلال العديد من الأنشطة السياسية والعسكرية"
-                ]
-            },
-            {
-                "title": "Non-Violent Resistance: Popular Struggle",
-                "description1": "يشمل النضال الشعبي الفلسطيني أساليب غير عنيفة مثل التظاهرات، والإضرابات، ووقفات الاحتجاج ضد الاحتلال الإسرائيلي والمستوطنات.",
-                "sources": [
-                    {"name": "Palestinian Center for Nonviolence", "url": "https://www.palestiniannonviolence.org/"},
-                    {"name": "International Solidarity Movement", "url": "https://palsolidarity.org/"},
-                    {"name": "Metras", "url": "https://metras.co"},
-                    {"name": "Anadolu Agency (Arabic)", "url": "https://www.aa.com.tr/ar"}
-                ],
-                "key_facts1": [
-                    "الاحتجاجات غير العنيفة هي جزء من استراتيجية النضال الفلسطيني",
-                    "العديد من الفلسطينيين يشاركون في مقاطعة المنتجات الإسرائيلية"
-                ]
-            }
-        ],
-        "Global_Recognition": [
-            {
-                "title": "International Recognition of Palestine",
-                "description1": "في عام 2012، حصلت فلسطين على صفة دولة غير عضو مراقب في الأمم المتحدة. منذ ذلك الحين، واصلت فلسطين حملات اعتراف من الدول الغربية والمنظمات الدولية.",
-                "key_facts": [
-                    "In 2012, Palestine obtained non-member observer state status at the UN",
-                    "Membership in various international organizations, including the International Criminal Court",
-                    "Recognition by more than 140 countries out of 193 UN member states",
-                    "Ongoing campaigns for recognition by Western countries"
-                ]
-            }
-        ]
-    }
-    return resources
+    return get_dataset("education_ar")
 
 def get_educational_resources_EN():
-    resources = {
-        "History": [
-            {
-                "title": "The Nakba: Palestinian Exodus of 1948",
-                "description": "The Nakba (catastrophe in Arabic) refers to the mass expulsion and dispossession of Palestinians during the creation of the State of Israel in 1948. Over 750,000 Palestinians were forced to leave their homes, and more than 500 Palestinian villages were destroyed.",
-                "sources": [
-                    {"name": "Institute for Palestine Studies", "url": "https://www.palestine-studies.org/"},
-                    {"name": "UN Archives", "url": "https://archives.un.org/"},
-                    {"name": "Palestinian Journeys", "url": "https://www.paljourneys.org/en/timeline/highlight/165/nakba"}
-                ],
-                "key_facts": [
-                    "Over 750,000 Palestinians displaced",
-                    "More than 500 Palestinian villages destroyed",
-                    "Confiscation of 78% of historical Palestinian lands",
-                    "Creation of the world's longest unresolved refugee crisis"
-                ]
-            },
-            {
-                "title": "The 1967 Occupation and Its Consequences",
-                "description": "In June 1967, Israel occupied the West Bank, East Jerusalem, the Gaza Strip, the Golan Heights, and the Sinai Peninsula during the Six-Day War. This occupation, which continues today (except for Sinai), has led to the expansion of illegal Israeli settlements and a system of military control over the Palestinian population.",
-                "sources": [
-                    {"name": "United Nations", "url": "https://www.un.org/unispal/"},
-                    {"name": "B'Tselem", "url": "https://www.btselem.org/"},
-                    {"name": "Human Rights Watch", "url": "https://www.hrw.org/middle-east/north-africa/israel/palestine"}
-                ],
-                "key_facts": [
-                    "Over 600,000 Israeli settlers live illegally in the West Bank and East Jerusalem",
-                    "More than 60% of the West Bank is under full Israeli control (Area C)",
-                    "Over 700 km of separation wall, declared illegal by the International Court of Justice",
-                    "More than 65 UN resolutions condemning the occupation, all ignored by Israel"
-                ]
-            },
-            {
-                "title": "The Oslo Accords and the Failure of the Peace Process",
-                "description": "The Oslo Accords, signed in 1993-1995, were supposed to lead to a two-state solution within a five-year timeframe. However, they failed due to continued Israeli settlement expansion, violations of the agreements, and lack of political will to resolve fundamental issues such as Jerusalem, refugees, and borders.",
-                "sources": [
-                    {"name": "Oslo Accords documents", "url": "https://peacemaker.un.org/israelopt-osloaccord93"},
-                    {"name": "United Nations", "url": "https://www.un.org/unispal/"},
-                    {"name": "Al Jazeera", "url": "https://www.aljazeera.com/features/2013/9/13/oslo-accords-the-road-to-nowhere"}
-                ],
-                "key_facts": [
-                    "Division of the West Bank into Areas A, B, and C with different levels of control",
-                    "Creation of the Palestinian Authority as an interim government",
-                    "Tripling of Israeli settler numbers since the Oslo Accords",
-                    "Territorial fragmentation making a viable Palestinian state increasingly impossible"
-                ]
-            },
-            {
-                "title": "The Gaza Blockade Since 2007",
-                "description": "Since 2007, the Gaza Strip has been under a land, air, and sea blockade imposed by Israel and Egypt. This blockade has created a catastrophic humanitarian crisis, limiting access to food, medicine, electricity, and clean water for more than 2 million Palestinians living in this coastal enclave.",
-                "sources": [
-                    {"name": "UNRWA", "url": "https://www.unrwa.org/where-we-work/gaza-strip"},
-                    {"name": "WHO", "url": "https://www.who.int/health-topics/occupied-palestinian-territory"},
-                    {"name": "OCHA", "url": "https://www.ochaopt.org/location/gaza-strip"},
-                    {"name": "Oxfam", "url": "https://www.oxfam.org/en/what-we-do/countries/occupied-palestinian-territory-and-israel"}
-                ],
-                "key_facts": [
-                    "Over 2 million people live in an area of 365 km²",
-                    "More than 95% of water is unfit for human consumption",
-                    "Unemployment rate exceeding 45%, one of the highest in the world",
-                    "Electricity available only 4-12 hours per day on average",
-                    "More than 80% of the population depends on humanitarian aid"
-                ]
-            }
-        ],
-        "Human Rights": [
-            {
-                "title": "The Apartheid System in Occupied Palestine",
-                "description": "Numerous human rights organizations, including Amnesty International, Human Rights Watch, and B'Tselem, have concluded that Israel practices apartheid against Palestinians. This system includes discriminatory laws, territorial segregation, movement restrictions, and unequal allocation of resources.",
-                "sources": [
-                    {"name": "Amnesty International", "url": "https://www.amnesty.org/en/latest/campaigns/2022/02/israels-system-of-apartheid/"},
-                    {"name": "Human Rights Watch", "url": "https://www.hrw.org/report/2021/04/27/threshold-crossed/israeli-authorities-and-crimes-apartheid-and-persecution"},
-                    {"name": "B'Tselem", "url": "https://www.btselem.org/publications/fulltext/202101_this_is_apartheid"},
-                    {"name": "Al-Haq", "url": "https://www.alhaq.org/"}
-                ],
-                "key_facts": [
-                    "Two separate legal systems in the West Bank: civil law for settlers, military law for Palestinians",
-                    "More than 65 discriminatory laws against Palestinian citizens of Israel",
-                    "Complex permit system limiting Palestinians' freedom of movement",
-                    "Unequal access to water: settlers receive 3-5 times more water than Palestinians"
-                ]
-            },
-            {
-                "title": "Administrative Detention and Political Prisoners",
-                "description": "Israel extensively uses administrative detention to imprison Palestinians without charge or trial, based on 'secret evidence.' Thousands of Palestinians, including children, are detained in conditions that often violate international law.",
-                "sources": [
-                    {"name": "Addameer", "url": "https://www.addameer.org/"},
-                    {"name": "International Committee of the Red Cross", "url": "https://www.icrc.org/en/where-we-work/middle-east/israel-and-occupied-territories"},
-                    {"name": "UNICEF", "url": "https://www.unicef.org/sop/"}
-                ],
-                "key_facts": [
-                    "More than 800,000 Palestinians detained since 1967",
-                    "Approximately 500-700 Palestinian children arrested each year",
-                    "99.7% conviction rate in Israeli military courts",
-                    "Systematic torture and mistreatment documented by human rights organizations"
-                ]
-            },
-            {
-                "title": "Restrictions on Freedom of Movement",
-                "description": "Palestinians face a complex system of movement restrictions including checkpoints, the separation wall, settler-only roads, and a permit system that severely limits their ability to move freely in their own territory.",
-                "sources": [
-                    {"name": "OCHA", "url": "https://www.ochaopt.org/theme/movement-and-access"},
-                    {"name": "B'Tselem", "url": "https://www.btselem.org/freedom_of_movement"},
-                    {"name": "Machsom Watch", "url": "https://machsomwatch.org/en"}
-                ],
-                "key_facts": [
-                    "More than 700 physical obstacles in the West Bank (checkpoints, roadblocks, etc.)",
-                    "The separation wall extends for 712 km, 85% of which is inside the West Bank",
-                    "Thousands of Palestinians separated from their agricultural lands by the wall",
-                    "Complex permit system required to enter East Jerusalem, travel between Gaza and the West Bank, or access 'seam zones'"
-                ]
-            },
-            {
-                "title": "Home Demolitions and Forced Displacement",
-                "description": "Israel regularly practices Palestinian home demolitions, either as punitive measures or under the pretext of lacking building permits (which are systematically denied to Palestinians). These practices constitute serious violations of international humanitarian law.",
-                "sources": [
-                    {"name": "OCHA", "url": "https://www.ochaopt.org/data/demolition"},
-                    {"name": "B'Tselem", "url": "https://www.btselem.org/topic/planning_and_building"},
-                    {"name": "Al-Haq", "url": "https://www.alhaq.org/"},
-                    {"name": "Norwegian Refugee Council", "url": "https://www.nrc.no/countries/middle-east/palestine/"}
-                ],
-                "key_facts": [
-                    "More than 55,000 Palestinian homes demolished since 1967",
-                    "Less than 2% of building permit applications approved for Palestinians in Area C",
-                    "East Jerusalem particularly targeted for demolitions and settlement expansion",
-                    "'Silent transfer' policy aimed at reducing Palestinian presence in strategic areas"
-                ]
-            }
-        ],
-        "Culture and Society": [
-            {
-                "title": "Palestinian Cultural Heritage",
-                "description": "Palestinian culture is rich and diverse, with traditions dating back thousands of years. It includes distinctive cuisine, traditional arts such as embroidery, pottery, and calligraphy, as well as a rich literary and musical tradition.",
-                "sources": [
-                    {"name": "Arab World Institute", "url": "https://www.imarabe.org/en"},
-                    {"name": "Palestinian Museum", "url": "https://www.palmuseum.org/"},
-                    {"name": "UNESCO", "url": "https://en.unesco.org/countries/palestine"}
-                ],
-                "key_facts": [
-                    "Palestinian embroidery (tatreez) is inscribed on UNESCO's Intangible Cultural Heritage list",
-                    "The olive tree is a central symbol of Palestinian identity and resistance",
-                    "Dabke is a traditional dance performed at celebrations",
-                    "Resistance poetry is an important form of cultural expression, with poets like Mahmoud Darwish"
-                ]
-            },
-            {
-                "title": "Palestinian Diaspora",
-                "description": "Following the 1948 Nakba and ongoing occupation, a significant Palestinian diaspora has formed worldwide. These communities maintain strong ties to their homeland and play a crucial role in preserving Palestinian identity and advocating for Palestinian rights.",
-                "sources": [
-                    {"name": "UNRWA", "url": "https://www.unrwa.org/"},
-                    {"name": "Institute for Palestine Studies", "url": "https://www.palestine-studies.org/"},
-                    {"name": "Badil", "url": "https://www.badil.org/"}
-                ],
-                "key_facts": [
-                    "More than 7 million Palestinian refugees and displaced persons worldwide",
-                    "Significant Palestinian communities in Jordan, Lebanon, Syria, Chile, and the United States",
-                    "The key (miftah) is a symbol of refugees' right of return",
-                    "Intergenerational transmission of Palestinian memory and identity"
-                ]
-            },
-            {
-                "title": "Cultural and Artistic Resistance",
-                "description": "In the face of occupation, Palestinians have developed various forms of cultural and artistic resistance. Palestinian art, music, literature, and cinema serve to preserve national identity, document the realities of occupation, and express aspirations for freedom and self-determination.",
-                "sources": [
-                    {"name": "Palestinian Film Festival", "url": "https://www.palestinefilminstitute.org/"},
-                    {"name": "Dar Yusuf Nasri Jacir for Art and Research", "url": "https://darjacir.com/"},
-                    {"name": "Edward Said Institute", "url": "https://www.edwardsaid.org/"}
-                ],
-                "key_facts": [
-                    "Emergence of internationally recognized Palestinian cinema (Elia Suleiman, Hany Abu-Assad)",
-                    "Street art and graffiti on the separation wall as a form of visual protest",
-                    "Development of cultural festivals such as Palest'In & Out and the Palestine Literature Festival",
-                    "Use of social media to document and share occupation realities"
-                ]
-            },
-            {
-                "title": "Education and Academic Resistance",
-                "description": "Despite obstacles imposed by the occupation, Palestinians place high value on education. Palestinian universities are centers of knowledge production and intellectual resistance, although they are often targeted by Israeli forces.",
-                "sources": [
-                    {"name": "Birzeit University", "url": "https://www.birzeit.edu/en"},
-                    {"name": "Right to Education Campaign", "url": "https://right2edu.birzeit.edu/"},
-                    {"name": "PACBI", "url": "https://bdsmovement.net/pacbi"}
-                ],
-                "key_facts": [
-                    "Literacy rates among the highest in the Arab world despite occupation",
-                    "Palestinian universities regularly subjected to raids, closures, and restrictions",
-                    "Development of Palestine Studies as an academic discipline",
-                    "Academic boycott movement against institutions complicit in the occupation"
-                ]
-            }
-        ],
-        "Resistance and Solidarity": [
-            {
-                "title": "The BDS Movement (Boycott, Divestment, Sanctions)",
-                "description": "Launched in 2005 by Palestinian civil society, the BDS movement calls for non-violent measures to pressure Israel to comply with international law and Palestinian rights. Inspired by the South African anti-apartheid movement, it has gained significant global support.",
-                "sources": [
-                    {"name": "BDS National Committee", "url": "https://bdsmovement.net/"},
-                    {"name": "Palestinian Campaign for the Academic and Cultural Boycott of Israel (PACBI)", "url": "https://bdsmovement.net/pacbi"}
-                ],
-                "key_facts": [
-                    "Three main demands: end of occupation, equality for Palestinian citizens of Israel, right of return for refugees",
-                    "Notable successes including divestment by pension funds and universities",
-                    "Supported by unions, churches, social movements, and personalities worldwide",
-                    "Targets institutions complicit in the occupation, not individuals"
-                ]
-            },
-            {
-                "title": "Non-violent Popular Resistance",
-                "description": "Palestinians have a long tradition of non-violent popular resistance against occupation, including peaceful demonstrations, sit-ins, and non-violent direct actions. These movements are often violently suppressed by Israeli forces.",
-                "sources": [
-                    {"name": "Popular Struggle Coordination Committee", "url": "https://popularstruggle.org/"},
-                    {"name": "Stop the Wall Campaign", "url": "https://www.stopthewall.org/"},
-                    {"name": "Al-Haq", "url": "https://www.alhaq.org/"}
-                ],
-                "key_facts": [
-                    "Villages like Bil'in, Ni'lin, and Nabi Saleh known for their weekly demonstrations against the wall",
-                    "Use of video documentation and social media to expose violations",
-                    "International participation through movements like the International Solidarity Movement",
-                    "Systematic repression including arrests, detentions, and sometimes live fire against unarmed protesters"
-                ]
-            },
-            {
-                "title": "International Solidarity",
-                "description": "The solidarity movement with Palestine has developed globally, involving civil society organizations, unions, religious groups, students, and human rights activists who support the Palestinian struggle for justice and self-determination.",
-                "sources": [
-                    {"name": "Palestine Solidarity Campaign", "url": "https://www.palestinecampaign.org/"},
-                    {"name": "Jewish Voice for Peace", "url": "https://jewishvoiceforpeace.org/"},
-                    {"name": "BDS Movement", "url": "https://bdsmovement.net/"}
-                ],
-                "key_facts": [
-                    "International Day of Solidarity with the Palestinian People celebrated on November 29",
-                    "Divestment campaigns in universities and religious institutions",
-                    "Gaza flotillas attempting to break the maritime blockade",
-                    "Solidarity movements including progressive Jews opposed to Israeli policies"
-                ]
-            },
-            {
-                "title": "International Recognition of the State of Palestine",
-                "description": "The diplomatic struggle for recognition of the State of Palestine is an important form of political resistance. To date, more than 140 countries have recognized the State of Palestine, although most Western powers have not yet done so.",
-                "sources": [
-                    {"name": "United Nations", "url": "https://www.un.org/unispal/"},
-                    {"name": "Palestine Liberation Organization", "url": "https://www.nad.ps/en"},
-                    {"name": "Palestinian Ministry of Foreign Affairs", "url": "http://www.mofa.pna.ps/en/"}
-                ],
-                "key_facts": [
-                    "In 2012, Palestine obtained non-member observer state status at the UN",
-                    "Membership in various international organizations, including the International Criminal Court",
-                    "Recognition by more than 140 countries out of 193 UN member states",
-                    "Ongoing campaigns for recognition by Western countries"
-                ]
-            }
-        ]
-    }
-    return resources
+    return get_dataset("education_en")
 
 # Function to get companies that support Israel (for boycott section) with alternatives
 def get_boycott_companies():
-    companies = {
-        "Technology": {
-            "Companies": [
-                "Google", "Apple", "Microsoft", "Meta (Facebook)", "Amazon", "Intel", "HP", "IBM", "Oracle", "Cisco",
-                "Dell", "Nvidia", "PayPal", "Wix", "Fiverr", "Monday.com", "Check Point", "Mobileye", "Waze", "Zoom"
-            ],
-            "Alternatives": [
-                "DuckDuckGo instead of Google Search", 
-                "Huawei/Samsung instead of Apple", 
-                "Linux/Ubuntu instead of Windows", 
-                "Telegram/Signal instead of WhatsApp", 
-                "AliExpress/eBay instead of Amazon", 
-                "AMD instead of Intel", 
-                "Lenovo/Acer instead of HP", 
-                "LibreOffice instead of Microsoft Office",
-                "ProtonMail instead of Gmail",
-                "Firefox/Brave instead of Chrome"
-            ]
-        },
-        "Food & Beverage": {
-            "Companies": [
-                "McDonald's", "Coca-Cola", "PepsiCo", "Nestlé", "Starbucks", "Burger King", "Domino's Pizza",
-                "KFC", "Pizza Hut", "Subway", "Heinz", "Danone", "Mars", "Mondelez (Oreo)", "Kellogg's", 
-                "Häagen-Dazs", "Sabra Hummus", "Strauss Group"
-            ],
-            "Alternatives": [
-                "Local burger restaurants instead of McDonald's/Burger King", 
-                "Local coffee shops instead of Starbucks", 
-                "Local water or juice instead of Coca-Cola/Pepsi", 
-                "Local bakeries instead of chain restaurants",
-                "Local dairy products instead of Danone/Nestlé",
-                "Local chocolate and snacks instead of Mars/Mondelez"
-            ]
-        },
-        "Fashion & Retail": {
-            "Companies": [
-                "H&M", "Zara", "Puma", "Nike", "Adidas", "Victoria's Secret", "Calvin Klein", "Tommy Hilfiger",
-                "Marks & Spencer", "ASOS", "Skechers", "The North Face", "Timberland", "Levi's", "Gap", "Old Navy",
-                "Ralph Lauren", "Lacoste", "Hugo Boss", "Uniqlo"
-            ],
-            "Alternatives": [
-                "Local clothing brands", 
-                "Ethical fashion brands", 
-                "Second-hand/thrift shopping", 
-                "Li-Ning/Anta Sports instead of Nike/Adidas",
-                "Decathlon for sports equipment",
-                "Local shoe manufacturers"
-            ]
-        },
-        "Entertainment & Media": {
-            "Companies": [
-                "Disney", "Warner Bros", "Netflix", "Spotify", "Universal Music Group",
-                "Fox", "Paramount", "Sony Pictures", "MGM", "DreamWorks", "NBC Universal",
-                "CNN", "BBC", "New York Times", "The Washington Post", "The Guardian"
-            ],
-            "Alternatives": [
-                "Independent streaming services", 
-                "Local film productions", 
-                "YouTube for independent content creators",
-                "Anghami instead of Spotify in Arab regions",
-                "Independent news sources and journalists",
-                "Al Jazeera, TRT World for news"
-            ]
-        },
-        "Sports": {
-            "Companies": [
-                "Puma", "Nike", "Adidas", "Under Armour", "New Balance", "Reebok",
-                "Wilson", "Spalding", "Gatorade", "Fitbit", "Garmin"
-            ],
-            "Alternatives": [
-                "Li-Ning", "Anta Sports", "Asics", "Fila", "Mizuno",
-                "Local sports equipment manufacturers",
-                "Independent fitness apps instead of corporate ones"
-            ]
-        },
-        "Cosmetics & Personal Care": {
-            "Companies": [
-                "L'Oréal", "Estée Lauder", "Clinique", "MAC Cosmetics", "Revlon", "Maybelline",
-                "Garnier", "Dove", "Nivea", "Johnson & Johnson", "Colgate-Palmolive", "Procter & Gamble"
-            ],
-            "Alternatives": [
-                "Local natural cosmetics brands", 
-                "Halal cosmetics brands", 
-                "Ethical and cruelty-free alternatives",
-                "Handmade soaps and natural products"
-            ]
-        },
-        "Travel & Hospitality": {
-            "Companies": [
-                "Airbnb", "Booking.com", "Expedia", "TripAdvisor", "Marriott", "Hilton",
-                "InterContinental", "Hyatt", "Delta Airlines", "American Airlines", "United Airlines"
-            ],
-            "Alternatives": [
-                "Direct hotel bookings", 
-                "Local travel agencies", 
-                "Alternative accommodation platforms",
-                "Local airlines when possible"
-            ]
-        }
-    }
-    return companies
+    return get_dataset("boycott_companies")
+
+# Function to display one company of the English boycott list
+def show_boycott_company_EN(company, label=None, expanded=False):
+    with st.expander(label or f"{company['name']}", expanded=expanded):
+        st.markdown(f"""
+        <div style="font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;">
+            <p style="margin-bottom: 10px;"><strong style="color: #d62728; font-weight: 600;">Reason for boycott:</strong> {company['reason']}</p>
+            <p style="margin-bottom: 10px;"><strong style="color: #2ca02c; font-weight: 600;">Recommended action:</strong> {company['action']}</p>
+            <p><strong style="color: #1f77b4; font-weight: 600;">Alternatives:</strong> {', '.join(company['alternatives'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+# Function to display one company of the Arabic boycott list
+def show_boycott_company_AR(company, label=None, expanded=False):
+    with st.expander(label or f"{company['name']}", expanded=expanded):
+        st.markdown(f"""
+        <div dir="rtl" style="font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;">
+            <p style="margin-bottom: 10px;"><strong style="color: #d62728; font-weight: 600;">سبب المقاطعة:</strong> {company['reason1']}</p>
+            <p style="margin-bottom: 10px;"><strong style="color: #2ca02c; font-weight: 600;">الإجراء الموصى به:</strong> {company['action1']}</p>
+            <p><strong style="color: #1f77b4; font-weight: 600;">البدائل:</strong> {', '.join(company['alternatives1'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
 
 # App UI with enhanced professional features
 def main():
@@ -876,6 +187,9 @@ def main():
         }
     )
 
+    # Build the shared Gemini models and open the API connection before the first question
+    warm_up_models()
+
     # Create session state variables if they don't exist
     if 'show_chat' not in st.session_state:
         st.session_state.show_chat = True
@@ -1092,15 +406,27 @@ def main():
             # Check if the question is related to Palestine
             is_palestine = is_palestine_related(user_question)
             
-            with st.spinner("Generating comprehensive answer..." if st.session_state.language == 'english' else "Generating comprehensive answer..."):
-                answer = ask_about_palestine(user_question)
-                
-                # Create a container with better styling for the answer
+            if not is_palestine:
+                # Off-topic questions are turned away locally instead of spending a Gemini call
+                if st.session_state.language == 'english':
+                    st.warning("Sorry! I'm trained just about Palestine Issue. Please ask a question related to Palestine, its history, culture, or current situation.")
+                else:
+                    st.warning("عذراً! أنا مدرب فقط على القضية الفلسطينية. يرجى طرح سؤال يتعلق بفلسطين أو تاريخها أو ثقافتها أو وضعها الحالي.")
+            elif STREAM_ANSWERS:
+                # Render chunks as Gemini produces them, no simulated typing delay
                 answer_container = st.container()
                 with answer_container:
-                    # Typing effect for response
-                    with st.empty():  # Create an empty placeholder to display the typing effect
-                        typing_effect(answer)
+                    st.write_stream(ask_about_palestine_stream(user_question))
+            else:
+                with st.spinner("Generating comprehensive answer..." if st.session_state.language == 'english' else "Generating comprehensive answer..."):
+                    answer = ask_about_palestine(user_question)
+                    
+                    # Create a container with better styling for the answer
+                    answer_container = st.container()
+                    with answer_container:
+                        # Typing effect for response
+                        with st.empty():  # Create an empty placeholder to display the typing effect
+                            typing_effect(answer)
     
     elif st.session_state.show_boycott:
         if st.session_state.language == 'english':
@@ -1116,25 +442,48 @@ def main():
             # Get boycott data
             boycott_data = get_boycott_data_EN()
             
-            # Create tabs for different categories
-            boycott_tabs = st.tabs(list(boycott_data.keys()))
-            
-            # Display detailed boycott information for each category
-            for i, (category, tab) in enumerate(zip(boycott_data.keys(), boycott_tabs)):
-                with tab:
-                    st.markdown(f"""
-                    <h3 style="font-weight: 700; color: #1f77b4; margin-bottom: 15px;">{category}</h3>
-                    """, unsafe_allow_html=True)
-                    
-                    for company in boycott_data[category]["companies"]:
-                        with st.expander(f"{company['name']}", expanded=False):
-                            st.markdown(f"""
-                            <div style="font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;">
-                                <p style="margin-bottom: 10px;"><strong style="color: #d62728; font-weight: 600;">Reason for boycott:</strong> {company['reason']}</p>
-                                <p style="margin-bottom: 10px;"><strong style="color: #2ca02c; font-weight: 600;">Recommended action:</strong> {company['action']}</p>
-                                <p><strong style="color: #1f77b4; font-weight: 600;">Alternatives:</strong> {', '.join(company['alternatives'])}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+            # Search by company or brand name; only the matches are rendered while a query is entered
+            company_query = st.text_input("Search for a company or brand", key="boycott_search_en", placeholder="e.g. Nestlé, Coca-Cola, Zara")
+            
+            if company_query.strip():
+                matches = search_companies("boycott_en", company_query)
+                # A brand of a boycotted company (Sprite, Garnier) is explained with its ownership path
+                ownership = lookup_brand("boycott_en", company_query)
+                if ownership and len(ownership["path"]) > 1:
+                    st.warning(f"{ownership['brand']} belongs to {' → '.join(ownership['path'][1:])}, which is on the boycott list.")
+                if not matches:
+                    st.info(f"No company on this list matches \"{company_query}\".")
+                for category, company in matches:
+                    show_boycott_company_EN(company, label=f"{company['name']} ({category})", expanded=len(matches) == 1)
+            else:
+                # Only the selected category is sent to the browser, as one prerendered HTML block
+                category = lazy_tabs(boycott_data.keys(), key="boycott_category_en")
+                st.markdown(boycott_category_html("boycott_en", category, "english"), unsafe_allow_html=True)
+            
+            # Check a whole shopping list or product CSV (names or barcodes) in one pass
+            with st.expander("Check a shopping list or product file", expanded=False):
+                st.markdown("Upload a text file with one product per line, or a CSV of product names or barcodes, or paste your list below.")
+                list_file = st.file_uploader("Shopping list or product CSV", type=["txt", "csv"], key="boycott_list_file")
+                list_text = st.text_area("Or paste your list (one item per line)", key="boycott_list_text", height=150)
+                
+                if st.button("Check list", key="boycott_list_check"):
+                    text = list_file.getvalue().decode("utf-8-sig", errors="replace") if list_file is not None else list_text
+                    if not text.strip():
+                        st.warning("Please upload a file or paste a list first.")
+                    else:
+                        rows = check_shopping_list("boycott_en", text)
+                        flagged = [row for row in rows if row["Status"] != STATUS_NOT_LISTED]
+                        st.markdown(f"**{len(flagged)}** of **{len(rows)}** items are on the boycott list or carry an Israeli barcode.")
+                        if flagged:
+                            # Only the flagged rows are sent to the browser; the full table is in the download
+                            st.dataframe(flagged[:1000], use_container_width=True, hide_index=True)
+                        st.download_button(
+                            label="Download results (CSV)",
+                            data=results_to_csv(rows),
+                            file_name="boycott_check.csv",
+                            mime="text/csv",
+                            key="boycott_list_download"
+                        )
             
             st.markdown("""
             <h3 style="font-weight: 700; color: #1f77b4; margin: 20px 0 15px 0;">How to Support Gaza</h3>
@@ -1186,27 +535,23 @@ def main():
             # Get boycott data
             boycott_data = get_boycott_data_AR()
             
-            # Create tabs for different categories
-            boycott_tabs = st.tabs(list(boycott_data.keys()))
-            
-            # Display detailed boycott information for each category
-            for i, (category, tab) in enumerate(zip(boycott_data.keys(), boycott_tabs)):
-                with tab:
-                    st.markdown(f"""
-                    <div dir="rtl" style="font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;">
-                        <h3 style="font-weight: 700; color: #1f77b4; margin-bottom: 15px;">{category}</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    for company in boycott_data[category]["companies"]:
-                        with st.expander(f"{company['name']}", expanded=False):
-                            st.markdown(f"""
-                            <div dir="rtl" style="font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;">
-                                <p style="margin-bottom: 10px;"><strong style="color: #d62728; font-weight: 600;">سبب المقاطعة:</strong> {company['reason1']}</p>
-                                <p style="margin-bottom: 10px;"><strong style="color: #2ca02c; font-weight: 600;">الإجراء الموصى به:</strong> {company['action1']}</p>
-                                <p><strong style="color: #1f77b4; font-weight: 600;">البدائل:</strong> {', '.join(company['alternatives1'])}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+            # Search by company or brand name; only the matches are rendered while a query is entered
+            company_query = st.text_input("ابحث عن شركة أو علامة تجارية", key="boycott_search_ar", placeholder="مثال: نستله، كوكا كولا")
+            
+            if company_query.strip():
+                matches = search_companies("boycott_ar", company_query)
+                # A brand of a boycotted company (Sprite, Garnier) is explained with its ownership path
+                ownership = lookup_brand("boycott_ar", company_query)
+                if ownership and len(ownership["path"]) > 1:
+                    st.warning(f"{ownership['brand']} تابعة لـ {' ← '.join(ownership['path'][1:])}، وهي على قائمة المقاطعة.")
+                if not matches:
+                    st.info(f"لا توجد شركة في هذه القائمة تطابق «{company_query}».")
+                for category, company in matches:
+                    show_boycott_company_AR(company, label=f"{company['name']} ({category})", expanded=len(matches) == 1)
+            else:
+                # Only the selected category is sent to the browser, as one prerendered HTML block
+                category = lazy_tabs(boycott_data.keys(), key="boycott_category_ar")
+                st.markdown(boycott_category_html("boycott_ar", category, "arabic"), unsafe_allow_html=True)
             
             # Utiliser des composants Streamlit natifs pour la section "Comment soutenir Gaza" en arabe
             st.markdown("<h3 style='font-weight: 700; color: #1f77b4; margin: 20px 0 15px 0; text-align: right;'>كيفية دعم غزة</h3>", unsafe_allow_html=True)
@@ -1251,47 +596,9 @@ def main():
             # Get educational resources
             resources = get_educational_resources_EN()
             
-            # Create tabs for different categories
-            education_tabs = st.tabs(list(resources.keys()))
-            
-            # Display educational resources for each category
-            for i, (category, tab) in enumerate(zip(resources.keys(), education_tabs)):
-                with tab:
-                    st.markdown(f"""
-                    <h3 style="font-weight: 700; color: #1f77b4; margin-bottom: 15px;">{category}</h3>
-                    """, unsafe_allow_html=True)
-                    
-                    for resource in resources[category]:
-                        with st.expander(f"{resource['title']}", expanded=False):
-                            st.markdown(f"""
-                            <div style="font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;">
-                                <p style="font-size: 1.05em; text-align: justify; margin-bottom: 15px;">{resource['description']}</p>
-                                
-                                <h4 style="font-weight: 600; color: #2ca02c; margin: 15px 0 10px 0;">Key Facts:</h4>
-                                <ul style="padding-left: 20px; margin-bottom: 15px;">
-                            """, unsafe_allow_html=True)
-                            
-                            for fact in resource['key_facts']:
-                                st.markdown(f"""
-                                <li style="margin-bottom: 8px;">{fact}</li>
-                                """, unsafe_allow_html=True)
-                            
-                            st.markdown(f"""
-                                </ul>
-                                
-                                <h4 style="font-weight: 600; color: #2ca02c; margin: 15px 0 10px 0;">Sources:</h4>
-                                <ul style="padding-left: 20px;">
-                            """, unsafe_allow_html=True)
-                            
-                            for source in resource['sources']:
-                                st.markdown(f"""
-                                <li style="margin-bottom: 8px;"><a href="{source['url']}" style="color: #1f77b4; text-decoration: underline;">{source['name']}</a></li>
-                                """, unsafe_allow_html=True)
-                                
-                            st.markdown("""
-                                </ul>
-                            </div>
-                            """, unsafe_allow_html=True)
+            # Only the selected category is sent to the browser, as one prerendered HTML block
+            category = lazy_tabs(resources.keys(), key="education_category_en")
+            st.markdown(education_category_html("education_en", category, "english"), unsafe_allow_html=True)
             
             # Add recommended reading and viewing section
             st.markdown("""
@@ -1337,35 +644,9 @@ def main():
             # Get educational resources
             resources = get_educational_resources_AR()
             
-            # Create tabs for different categories
-            education_tabs = st.tabs(list(resources.keys()))
-            
-            # Display educational resources for each category
-            for i, (category, tab) in enumerate(zip(resources.keys(), education_tabs)):
-                with tab:
-                    st.markdown(f"""
-                    <div dir="rtl" style="font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;">
-                        <h3 style="font-weight: 700; color: #1f77b4; margin-bottom: 15px;">{category}</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    for resource in resources[category]:
-                        with st.expander(f"{resource['title']}", expanded=False):
-                            st.markdown(f"""
-                            <div dir="rtl" style="font-family: 'Arial', 'Helvetica', sans-serif; line-height: 1.6;">
-                                <p style="font-size: 1.05em; text-align: right; margin-bottom: 15px;">{resource['description']}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            st.markdown("<h4 style='font-weight: 600; color: #2ca02c; margin: 15px 0 10px 0; text-align: right;'>حقائق رئيسية:</h4>", unsafe_allow_html=True)
-                            
-                            for fact in resource['key_facts']:
-                                st.markdown(f"<p style='text-align: right; margin-bottom: 5px;'>• {fact}</p>", unsafe_allow_html=True)
-                            
-                            st.markdown("<h4 style='font-weight: 600; color: #2ca02c; margin: 15px 0 10px 0; text-align: right;'>المصادر:</h4>", unsafe_allow_html=True)
-                            
-                            for source in resource['sources']:
-                                st.markdown(f"<p style='text-align: right; margin-bottom: 5px;'>• <a href='{source['url']}' style='color: #1f77b4; text-decoration: underline;'>{source['name']}</a></p>", unsafe_allow_html=True)
+            # Only the selected category is sent to the browser, as one prerendered HTML block
+            category = lazy_tabs(resources.keys(), key="education_category_ar")
+            st.markdown(education_category_html("education_ar", category, "arabic"), unsafe_allow_html=True)
             
             # Add recommended reading and viewing section in Arabic
             # Recommended reading section with improved formatting for mobile
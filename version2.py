@@ -1,10 +1,23 @@
 import streamlit as st
 import requests
 import os
-import base64
+import hashlib
 from PIL import Image
 import io
+import html
 import google.generativeai as genai
+from topic_gate import is_palestine_related
+from models import get_text_model, get_image_model, warm_up_models
+from image_cache import get_image_cache
+from source_index import get_source_search
+from image_processing import get_dimensions, make_display_image, make_thumbnail, image_file_type
+from gallery_store import get_gallery_store
+from session_store import new_session_id
+from chat_store import ChatHistory
+from datasets import get_dataset
+from company_search import search_companies
+from brand_graph import lookup_brand
+from static_assets import stylesheet, static_html
 
 # Page configuration
 st.set_page_config(
@@ -14,50 +27,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Configure Gemini with your API key
+# Gemini API key (the client itself is configured once by the model registry)
 google_api_key = os.getenv("GOOGLE_API_KEY")
-if google_api_key:
-    genai.configure(api_key=google_api_key)
 
-# Function to check if query is related to Palestine
-def is_palestine_related(query):
-    # List of keywords related to Palestine
-    palestine_keywords = [
-        "palestine", "palestinian", "gaza", "west bank", "jerusalem", "al-quds", 
-        "israel", "israeli", "occupation", "intifada", "nakba", "hamas", "fatah", 
-        "plo", "bds", "boycott", "settlement", "settler", "zionism", "zionist",
-        "al-aqsa", "dome of rock", "hebron", "ramallah", "bethlehem", "nablus",
-        "jenin", "rafah", "khan younis", "unrwa", "refugee", "right of return",
-        "oslo", "two-state", "one-state", "apartheid", "wall", "barrier",
-        "checkpoint", "blockade", "olive", "resistance", "martyr", "shahid",
-        "idf", "arab", "middle east", "levant", "holy land", "balfour",
-        "1948", "1967", "intifada", "uprising", "protest", "demonstration",
-        "solidarity", "human rights", "international law", "un resolution",
-        "occupation", "colonization", "annexation", "displacement", "demolition",
-        "prisoner", "detention", "administrative detention", "hunger strike",
-        "flotilla", "aid", "humanitarian", "ceasefire", "peace process",
-        "negotiation", "mediation", "conflict", "war", "attack", "bombing",
-        "airstrike", "rocket", "tunnel", "border", "crossing", "siege",
-        "sanction", "embargo", "economy", "water", "electricity", "infrastructure",
-        "education", "health", "culture", "heritage", "identity", "diaspora",
-        "return", "citizenship", "stateless", "nationality", "flag", "keffiyeh",
-        "olive tree", "key", "map", "border", "1948", "1967", "partition",
-        "resolution", "un", "unesco", "icj", "icc", "amnesty", "hrw", "btselem",
-        "pchr", "al haq", "adalah", "badil", "passia", "miftah", "pngo",
-        "pflp", "dflp", "jihad", "islamic", "christian", "muslim", "jew",
-        "holy site", "temple mount", "haram al-sharif", "church of nativity",
-        "ibrahimi mosque", "cave of patriarchs", "rachel's tomb", "joseph's tomb",
-        "from the river to the sea", "free palestine", "save palestine"
-    ]
-    
-    query_lower = query.lower()
-    
-    # Check if any of the keywords are in the query
-    for keyword in palestine_keywords:
-        if keyword in query_lower:
-            return True
-    
-    return False
+# Build the shared Gemini models at startup so the first request does not pay for it
+if google_api_key:
+    warm_up_models()
 
 # Function to generate text response with Gemini
 def generate_text_response(prompt, is_palestine=True):
@@ -65,16 +40,8 @@ def generate_text_response(prompt, is_palestine=True):
         return "Error: Gemini API key not found. Please set the GOOGLE_API_KEY environment variable."
     
     try:
-        # Load Gemini model for text
-        model_text = genai.GenerativeModel(
-            model_name="gemini-2.0-flash-thinking-exp-01-21",
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.7,
-                top_p=0.95,
-                top_k=40,
-                max_output_tokens=4000  # Increased token limit for deeper, longer responses
-            )
-        )
+        # Shared Gemini model for text
+        model_text = get_text_model()
         
         if not is_palestine:
             return "Sorry, I'm trained only to answer questions about the Palestinian cause and related topics. Please ask a question related to Palestine, its history, culture, or current situation."
@@ -85,16 +52,24 @@ def generate_text_response(prompt, is_palestine=True):
     except Exception as e:
         return f"Error: {str(e)}"
 
+# Inverted index over the reliable source corpus, built once per process
+source_search = get_source_search()
+
+# Process-wide cache of generated images and on-disk store for saved gallery images
+image_cache = get_image_cache()
+gallery_store = get_gallery_store()
+
+# Number of thumbnails per gallery page
+GALLERY_PAGE_SIZE = 9
+
 # Function to generate image with Gemini
 def generate_image(prompt, style="realistic", theme="educational", size="medium"):
     if not google_api_key:
         return None, "Error: Gemini API key not found. Please set the GOOGLE_API_KEY environment variable."
     
     try:
-        # Load Gemini model for image generation
-        model_image = genai.GenerativeModel(
-            model_name="gemini-2.0-flash-exp-image-generation"
-        )
+        # Shared Gemini model for image generation
+        model_image = get_image_model()
         
         # Style descriptions
         style_prompts = {
@@ -121,14 +96,14 @@ def generate_image(prompt, style="realistic", theme="educational", size="medium"
         # Build complete prompt
         full_prompt = f"Generate {style_desc} about Palestine {theme_desc}: {prompt}"
         
-        # Define dimensions based on size
-        dimensions = {
-            "small": (512, 512),
-            "medium": (768, 768),
-            "large": (1024, 1024)
-        }
+        # Output dimensions based on size (applied when the image is prepared for display)
+        size_config = get_dimensions(size)
         
-        size_config = dimensions.get(size, dimensions["medium"])
+        # Serve repeated prompts from the shared image cache
+        cache_key = image_cache.make_key(full_prompt, size_config)
+        cached_image = image_cache.get(cache_key)
+        if cached_image is not None:
+            return cached_image, None
         
         # Generate image
         response = model_image.generate_content(
@@ -142,666 +117,56 @@ def generate_image(prompt, style="realistic", theme="educational", size="medium"
         if hasattr(response, 'candidates') and len(response.candidates) > 0:
             for part in response.candidates[0].content.parts:
                 if hasattr(part, 'inline_data') and part.inline_data:
+                    image_cache.put(cache_key, part.inline_data.data)
                     return part.inline_data.data, None
         
         return None, "Error generating image. Please try again."
     except Exception as e:
         return None, f"Error: {str(e)}"
 
-# Function to convert base64 image to downloadable link
-def get_image_download_link(img_str, filename, text):
-    b64 = img_str.split(",")[1] if "," in img_str else img_str
-    href = f'<a href="data:image/png;base64,{b64}" download="{filename}">{text}</a>'
-    return href
+# Function to offer the original image bytes as a download, sent once and without base64
+def image_download_button(image_data, filename, text, key=None):
+    mime_type, extension = image_file_type(image_data)
+    st.download_button(text, data=image_data, file_name=f"{filename}.{extension}", mime=mime_type, key=key)
 
-# Function to search reliable sources
-def search_reliable_sources(query):
-    # List of reliable domains
-    reliable_domains = [
-        "aljazeera.com", "middleeasteye.net", "metras.co",
-        "aa.com.tr", "palestinechronicle.com", "electronicintifada.net",
-        "btselem.org", "amnesty.org", "hrw.org", "un.org", "unrwa.org",
-        "ochaopt.org", "palestinestudies.org", "mondoweiss.net"
-    ]
-    
-    # Search query
-    search_query = f"Palestine {query} site:aljazeera.com OR site:middleeasteye.net OR site:aa.com.tr"
-    
-    # Sample sources for demonstration
-    sample_sources = [
-        {
-            "title": "The history of Palestine: A chronology of key events",
-            "url": "https://www.aljazeera.com/news/2023/5/15/the-history-of-palestine-a-chronology-of-key-events",
-            "snippet": "A look at the major events that have shaped Palestinian history...",
-            "source": "Al Jazeera"
-        },
-        {
-            "title": "Palestine and Israel: Mapping an annexation",
-            "url": "https://www.aljazeera.com/news/2020/7/2/palestine-and-israel-mapping-an-annexation",
-            "snippet": "Interactive map of Palestine showing the effects of Israel's annexation plans...",
-            "source": "Al Jazeera"
-        },
-        {
-            "title": "What's the history of the Israel-Palestinian conflict?",
-            "url": "https://www.middleeasteye.net/news/israel-palestine-conflict-history-explained",
-            "snippet": "The roots of the Israel-Palestinian conflict explained...",
-            "source": "Middle East Eye"
-        },
-        {
-            "title": "Timeline: Israel's attacks on Gaza and the Palestinian resistance",
-            "url": "https://www.aa.com.tr/en/middle-east/timeline-israels-attacks-on-gaza-and-the-palestinian-resistance/2866227",
-            "snippet": "A comprehensive timeline of the recent events in Gaza...",
-            "source": "Anadolu Agency"
-        }
-    ]
-    
-    # Filter sources based on query (simulation)
-    filtered_sources = []
-    query_terms = query.lower().split()
-    
-    for source in sample_sources:
-        relevance_score = 0
-        for term in query_terms:
-            if term in source["title"].lower() or term in source["snippet"].lower():
-                relevance_score += 1
-        
-        if relevance_score > 0:
-            filtered_sources.append(source)
-    
-    return filtered_sources
+# Function to search reliable sources, ranked with BM25 over the prebuilt source index
+def search_reliable_sources(query, limit=10):
+    return source_search.search(query, limit)
 
 # Function to get boycott data
 def get_boycott_data():
-    # Predefined boycott data based on research
-    boycott_data = {
-        "Food & Beverages": {
-            "companies": [
-                {
-                    "name": "Starbucks",
-                    "reason": "Howard Schultz is the largest private owner of Starbucks shares and is a staunch zionist who invests heavily in Israel's economy, including a recent $1.7 billion investment in cybersecurity startup Wiz.",
-                    "action": "Don't buy Starbucks. Don't sell Starbucks On the Go. Don't work for Starbucks.",
-                    "alternatives": ["Caffe Nero", "Local independent cafes"]
-                },
-                {
-                    "name": "Coca-Cola",
-                    "reason": "Coca-Cola has a bottling plant in the Atarot Industrial Zone, an illegal Israeli settlement in occupied East Jerusalem.",
-                    "action": "Boycott all Coca-Cola products, including Sprite, Fanta, and other associated brands.",
-                    "alternatives": ["Local beverage brands", "Homemade sparkling water"]
-                },
-                {
-                    "name": "McDonald's",
-                    "reason": "McDonald's Israel provided thousands of free meals to Israeli soldiers during military operations in Gaza.",
-                    "action": "Don't eat at McDonald's.",
-                    "alternatives": ["Local restaurants", "Local fast food chains"]
-                },
-                {
-                    "name": "Nestlé",
-                    "reason": "Nestlé has been operating in Israel since 1995 and has production facilities in contested areas.",
-                    "action": "Avoid Nestlé products, including bottled water, cereals, and dairy products.",
-                    "alternatives": ["Local brands", "Artisanal products"]
-                }
-            ]
-        },
-        "Technology": {
-            "companies": [
-                {
-                    "name": "HP (Hewlett-Packard)",
-                    "reason": "HP provides technologies used in Israel's control and surveillance system, including for military checkpoints.",
-                    "action": "Don't buy HP products, including computers, printers, and supplies.",
-                    "alternatives": ["Lenovo", "Brother", "Epson"]
-                },
-                {
-                    "name": "Microsoft",
-                    "reason": "Microsoft invested $1.5 billion in an Israeli AI company and has a major R&D center in Israel.",
-                    "action": "Use open source alternatives when possible.",
-                    "alternatives": ["Linux", "LibreOffice", "Open source alternatives"]
-                },
-                {
-                    "name": "Google",
-                    "reason": "Google signed a $1.2 billion cloud computing contract with the Israeli government (Project Nimbus).",
-                    "action": "Use alternative search engines and services.",
-                    "alternatives": ["DuckDuckGo", "ProtonMail", "Firefox"]
-                },
-                {
-                    "name": "Siemens",
-                    "reason": "Siemens provides technologies used in Israeli infrastructure, including in occupied territories.",
-                    "action": "Avoid Siemens products when alternatives are available.",
-                    "alternatives": ["Bosch", "Other appliance manufacturers"]
-                }
-            ]
-        },
-        "Fashion & Clothing": {
-            "companies": [
-                {
-                    "name": "Puma",
-                    "reason": "Puma sponsors the Israel Football Association, which includes teams in illegal settlements.",
-                    "action": "Don't buy Puma products.",
-                    "alternatives": ["Adidas", "New Balance", "Local brands"]
-                },
-                {
-                    "name": "Skechers",
-                    "reason": "Skechers has stores in illegal Israeli settlements and maintains business partnerships in Israel.",
-                    "action": "Boycott Skechers shoes and clothing.",
-                    "alternatives": ["Brooks", "ASICS", "Ethical brands"]
-                },
-                {
-                    "name": "H&M",
-                    "reason": "H&M operates stores in Israel, including in contested areas.",
-                    "action": "Don't shop at H&M.",
-                    "alternatives": ["Ethical fashion brands", "Second-hand clothing"]
-                },
-                {
-                    "name": "Zara",
-                    "reason": "Zara has stores in Israel and sources from Israeli suppliers.",
-                    "action": "Avoid shopping at Zara.",
-                    "alternatives": ["Local brands", "Independent boutiques"]
-                }
-            ]
-        },
-        "Cosmetics": {
-            "companies": [
-                {
-                    "name": "L'Oréal",
-                    "reason": "L'Oréal operates in Israel and has acquired Israeli cosmetics companies.",
-                    "action": "Boycott L'Oréal products and its associated brands.",
-                    "alternatives": ["The Body Shop", "Lush", "Natural brands"]
-                },
-                {
-                    "name": "Estée Lauder",
-                    "reason": "Estée Lauder chairman, Ronald Lauder, is a strong supporter of Israel and funds pro-Israel organizations.",
-                    "action": "Don't buy Estée Lauder products and its associated brands.",
-                    "alternatives": ["Ethical cosmetics brands", "Natural products"]
-                },
-                {
-                    "name": "Yves Saint Laurent Beauty / YSL Beauty",
-                    "reason": "YSL Beauty is owned by L'Oréal Group, which operates in Israel and has ties to Israeli companies.",
-                    "action": "Avoid YSL Beauty products.",
-                    "alternatives": ["Ethical cosmetics brands", "Natural products"]
-                }
-            ]
-        },
-        "Finance": {
-            "companies": [
-                {
-                    "name": "eToro",
-                    "reason": "eToro is an Israeli online trading company that supports Israel's economy.",
-                    "action": "Use other trading and investment platforms.",
-                    "alternatives": ["Alternative trading platforms", "Ethical banks"]
-                },
-                {
-                    "name": "PayPal",
-                    "reason": "PayPal operates in Israel but refuses to provide its services to Palestinians in the occupied territories.",
-                    "action": "Use alternatives to PayPal when possible.",
-                    "alternatives": ["Wise", "Local banking services"]
-                }
-            ]
-        },
-        "Other": {
-            "companies": [
-                {
-                    "name": "SodaStream",
-                    "reason": "SodaStream operated a factory in an illegal Israeli settlement in the occupied West Bank before relocating due to pressure.",
-                    "action": "Don't buy SodaStream products.",
-                    "alternatives": ["Bottled sparkling water", "Other carbonation systems"]
-                },
-                {
-                    "name": "Volvo Heavy Machinery",
-                    "reason": "Volvo heavy equipment is used for demolishing Palestinian homes and building illegal settlements.",
-                    "action": "Raise awareness about the use of Volvo equipment in occupied territories.",
-                    "alternatives": ["Other heavy equipment manufacturers"]
-                },
-                {
-                    "name": "Caterpillar",
-                    "reason": "Caterpillar bulldozers are used to demolish Palestinian homes and build the illegal separation wall.",
-                    "action": "Boycott Caterpillar products and raise awareness about their use.",
-                    "alternatives": ["Other construction equipment manufacturers"]
-                }
-            ]
-        }
-    }
-    
-    return boycott_data
+    return get_dataset("boycott_summary")
+
+# Function to build the card of one boycotted company, labelled with its category in search results
+def company_card(company, category=None):
+    category_label = f' <span style="font-weight: normal; color: #666;">({category})</span>' if category else ""
+    return f"""
+    <div class="company-card">
+        <div class="company-name">{company['name']}{category_label}</div>
+        <div class="company-reason"><strong>Boycott Reason:</strong> {company['reason']}</div>
+        <div class="company-action"><strong>Recommended Action:</strong> {company['action']}</div>
+        <div class="company-alternatives"><strong>Alternatives:</strong> {', '.join(company['alternatives'])}</div>
+    </div>
+    """
+
+# Avatars of the knowledge chat messages
+CHAT_AVATARS = {"user": "👤", "assistant": "🇵🇸"}
+
+# Function to display one message of the knowledge chat
+def show_chat_message(message):
+    with st.chat_message(message["role"], avatar=CHAT_AVATARS[message["role"]]):
+        st.markdown(message["content"])
+
+# Function to add a message to the chat history and show it at the end of the chat, in the current run
+def add_chat_message(chat_box, role, content):
+    message = {"role": role, "content": content}
+    st.session_state.chat_history.append(message)
+    with chat_box:
+        show_chat_message(message)
 
 # CSS styles for ChatGPT-like interface
 def apply_styles():
-    st.markdown("""
-    <style>
-        /* Global styles */
-        body {
-            font-family: 'Söhne', 'Segoe UI', sans-serif;
-            color: #1a1a1a;
-            background-color: #f7f7f8;
-        }
-        
-        /* Main container */
-        .main {
-            padding: 0 !important;
-            max-width: 100% !important;
-        }
-        
-        /* Header styles */
-        .main-header {
-            font-size: 2.5rem;
-            font-weight: bold;
-            text-align: center;
-            margin-bottom: 2rem;
-            color: #202123;
-        }
-        
-        /* Sidebar styles */
-        .css-1d391kg {
-            background-color: #202123;
-        }
-        
-        /* Chat container */
-        .chat-container {
-            display: flex;
-            flex-direction: column;
-            height: calc(100vh - 180px);
-            overflow-y: auto;
-            padding: 0 15%;
-            margin-bottom: 80px;
-        }
-        
-        /* Message styles */
-        .user-message {
-            background-color: #f7f7f8;
-            padding: 1rem 15%;
-            border-bottom: 1px solid rgba(0,0,0,0.1);
-            display: flex;
-            align-items: flex-start;
-        }
-        
-        .assistant-message {
-            background-color: #ffffff;
-            padding: 1rem 15%;
-            border-bottom: 1px solid rgba(0,0,0,0.1);
-            display: flex;
-            align-items: flex-start;
-        }
-        
-        .message-avatar {
-            width: 30px;
-            height: 30px;
-            border-radius: 50%;
-            margin-right: 15px;
-            flex-shrink: 0;
-        }
-        
-        .message-content {
-            flex-grow: 1;
-            overflow-wrap: break-word;
-        }
-        
-        /* Input area */
-        .input-container {
-            position: fixed;
-            bottom: 0;
-            left: 0;
-            right: 0;
-            padding: 1rem 15%;
-            background-color: #ffffff;
-            border-top: 1px solid rgba(0,0,0,0.1);
-            display: flex;
-            align-items: center;
-        }
-        
-        .input-box {
-            flex-grow: 1;
-            padding: 0.75rem 1rem;
-            border-radius: 0.5rem;
-            border: 1px solid rgba(0,0,0,0.1);
-            background-color: #ffffff;
-            font-size: 1rem;
-            line-height: 1.5;
-            max-height: 200px;
-            overflow-y: auto;
-        }
-        
-        .send-button {
-            margin-left: 0.5rem;
-            background-color: #10a37f;
-            color: white;
-            border: none;
-            border-radius: 0.25rem;
-            padding: 0.5rem 1rem;
-            cursor: pointer;
-        }
-        
-        /* Button styles */
-        .stButton button {
-            border-radius: 0.5rem;
-            padding: 0.75rem 1.5rem;
-            font-size: 1rem;
-            font-weight: 500;
-            transition: all 0.2s ease;
-            border: 1px solid rgba(0,0,0,0.1);
-            background-color: #ffffff;
-        }
-        
-        .stButton button:hover {
-            background-color: #f0f0f0;
-        }
-        
-        /* Quick action buttons */
-        .quick-actions {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-top: 20px;
-            margin-bottom: 20px;
-            justify-content: center;
-        }
-        
-        .action-button {
-            display: flex;
-            align-items: center;
-            padding: 12px 20px;
-            background-color: #ffffff;
-            border: 1px solid rgba(0,0,0,0.1);
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            text-decoration: none;
-            color: #202123;
-        }
-        
-        .action-button:hover {
-            background-color: #f0f0f0;
-            transform: translateY(-2px);
-        }
-        
-        .action-icon {
-            margin-right: 10px;
-            font-size: 1.2rem;
-        }
-        
-        /* Welcome screen */
-        .welcome-container {
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            height: calc(100vh - 100px);
-            text-align: center;
-            padding: 0 15%;
-        }
-        
-        .welcome-title {
-            font-size: 2.5rem;
-            font-weight: bold;
-            margin-bottom: 1rem;
-            color: #202123;
-        }
-        
-        .welcome-subtitle {
-            font-size: 1.2rem;
-            color: #6e6e80;
-            margin-bottom: 2rem;
-            max-width: 600px;
-        }
-        
-        /* Palestine cause description */
-        .cause-description {
-            background-color: rgba(16, 163, 127, 0.1);
-            padding: 1.5rem;
-            border-radius: 0.5rem;
-            margin-bottom: 2rem;
-            border-left: 4px solid #10a37f;
-        }
-        
-        /* Sidebar navigation */
-        .sidebar-nav {
-            padding: 1rem;
-        }
-        
-        .sidebar-nav-item {
-            display: flex;
-            align-items: center;
-            padding: 0.75rem 1rem;
-            border-radius: 0.25rem;
-            cursor: pointer;
-            transition: background-color 0.2s ease;
-            color: #ececf1;
-            text-decoration: none;
-            margin-bottom: 0.5rem;
-        }
-        
-        .sidebar-nav-item:hover {
-            background-color: rgba(255,255,255,0.1);
-        }
-        
-        .sidebar-nav-item.active {
-            background-color: rgba(255,255,255,0.2);
-        }
-        
-        .sidebar-icon {
-            margin-right: 0.75rem;
-            width: 16px;
-            text-align: center;
-        }
-        
-        /* Section styles */
-        .section-header {
-            font-size: 1.8rem;
-            font-weight: bold;
-            margin-top: 1rem;
-            margin-bottom: 1rem;
-            color: #202123;
-            border-bottom: 1px solid rgba(0,0,0,0.1);
-            padding-bottom: 0.5rem;
-        }
-        
-        .section-content {
-            margin-bottom: 2rem;
-        }
-        
-        /* Card styles */
-        .card {
-            background-color: #ffffff;
-            border-radius: 0.5rem;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            transition: all 0.2s ease;
-        }
-        
-        .card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        
-        .card-title {
-            font-size: 1.2rem;
-            font-weight: bold;
-            margin-bottom: 0.5rem;
-            color: #202123;
-        }
-        
-        .card-content {
-            color: #353740;
-        }
-        
-        /* Team member card */
-        .team-member {
-            display: flex;
-            align-items: center;
-            background-color: #ffffff;
-            border-radius: 0.5rem;
-            padding: 1rem;
-            margin-bottom: 1rem;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .team-avatar {
-            width: 60px;
-            height: 60px;
-            border-radius: 50%;
-            margin-right: 1rem;
-        }
-        
-        .team-info {
-            flex-grow: 1;
-        }
-        
-        .team-name {
-            font-weight: bold;
-            margin-bottom: 0.25rem;
-        }
-        
-        .team-role {
-            color: #6e6e80;
-            font-size: 0.9rem;
-        }
-        
-        /* Contact form */
-        .contact-form {
-            background-color: #ffffff;
-            border-radius: 0.5rem;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .form-group {
-            margin-bottom: 1rem;
-        }
-        
-        .form-label {
-            display: block;
-            margin-bottom: 0.5rem;
-            font-weight: 500;
-        }
-        
-        .form-input {
-            width: 100%;
-            padding: 0.75rem;
-            border-radius: 0.25rem;
-            border: 1px solid rgba(0,0,0,0.1);
-            font-size: 1rem;
-        }
-        
-        .form-textarea {
-            width: 100%;
-            padding: 0.75rem;
-            border-radius: 0.25rem;
-            border: 1px solid rgba(0,0,0,0.1);
-            font-size: 1rem;
-            min-height: 150px;
-            resize: vertical;
-        }
-        
-        .form-submit {
-            background-color: #10a37f;
-            color: white;
-            border: none;
-            border-radius: 0.25rem;
-            padding: 0.75rem 1.5rem;
-            font-size: 1rem;
-            cursor: pointer;
-            transition: background-color 0.2s ease;
-        }
-        
-        .form-submit:hover {
-            background-color: #0d8c6d;
-        }
-        
-        /* Help section */
-        .help-item {
-            background-color: #ffffff;
-            border-radius: 0.5rem;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .help-question {
-            font-weight: bold;
-            margin-bottom: 0.5rem;
-            color: #202123;
-            cursor: pointer;
-        }
-        
-        .help-answer {
-            color: #353740;
-            padding-top: 0.5rem;
-        }
-        
-        /* Boycott section */
-        .company-card {
-            border: 1px solid rgba(0,0,0,0.1);
-            border-radius: 0.5rem;
-            padding: 1rem;
-            margin-bottom: 1rem;
-            background-color: #FFFFFF;
-            transition: all 0.3s ease;
-        }
-        
-        .company-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        
-        .company-name {
-            font-size: 1.2rem;
-            font-weight: bold;
-            margin-bottom: 0.5rem;
-            color: #202123;
-        }
-        
-        .company-reason {
-            margin-bottom: 0.5rem;
-        }
-        
-        .company-action {
-            font-weight: bold;
-            margin-bottom: 0.5rem;
-        }
-        
-        .company-alternatives {
-            font-style: italic;
-        }
-        
-        .category-title {
-            font-size: 1.5rem;
-            font-weight: bold;
-            margin-top: 1rem;
-            margin-bottom: 1rem;
-            color: #202123;
-            border-bottom: 1px solid rgba(0,0,0,0.1);
-            padding-bottom: 0.5rem;
-        }
-        
-        /* Footer */
-        .footer {
-            text-align: center;
-            padding: 1rem;
-            color: #6e6e80;
-            font-size: 0.9rem;
-            border-top: 1px solid rgba(0,0,0,0.1);
-            margin-top: 2rem;
-        }
-        
-        /* Responsive adjustments */
-        @media (max-width: 768px) {
-            .chat-container, .input-container {
-                padding: 1rem 5%;
-            }
-            
-            .user-message, .assistant-message {
-                padding: 1rem 5%;
-            }
-            
-            .welcome-container {
-                padding: 0 5%;
-            }
-            
-            .welcome-title {
-                font-size: 2rem;
-            }
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(stylesheet("version2.css"), unsafe_allow_html=True)
 
 # Initialize session state
 if 'page' not in st.session_state:
@@ -813,8 +178,14 @@ if 'sources' not in st.session_state:
 if 'gallery' not in st.session_state:
     st.session_state.gallery = []
 
+if 'gallery_session_id' not in st.session_state:
+    st.session_state.gallery_session_id = new_session_id()
+
 if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
+    st.session_state.chat_history = ChatHistory(new_session_id())
+
+if 'chat_pages_shown' not in st.session_state:
+    st.session_state.chat_pages_shown = 0
 
 # Apply styles
 apply_styles()
@@ -862,21 +233,8 @@ with st.sidebar:
 
 # Main content based on selected page
 if st.session_state.page == 'home':
-    # Welcome screen
-    st.markdown('<div class="welcome-container">', unsafe_allow_html=True)
-    st.markdown('<div class="welcome-title">Here Us! From the River To the Sea</div>', unsafe_allow_html=True)
-    st.markdown('<div class="welcome-subtitle">An AI-powered platform for education, awareness, and support of the Palestinian cause</div>', unsafe_allow_html=True)
-    
-    # Palestine cause description
-    st.markdown('<div class="cause-description">', unsafe_allow_html=True)
-    st.markdown("""
-    <p><strong>The Palestinian Cause</strong> is a struggle for justice, freedom, and self-determination. It represents the Palestinian people's ongoing effort to secure their fundamental rights, including the right to return to their homeland, freedom from occupation, and the establishment of an independent state.</p>
-    
-    <p>For decades, Palestinians have faced displacement, occupation, and systematic violations of their human rights. This platform aims to provide accurate information, raise awareness, and offer ways to support the Palestinian people in their pursuit of justice and dignity.</p>
-    
-    <p>From the river to the sea, Palestine will be free.</p>
-    """, unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Welcome screen and cause description, one static block
+    st.markdown(static_html("version2_hero.html"), unsafe_allow_html=True)
     
     # Quick action buttons
     st.markdown('<div class="quick-actions">', unsafe_allow_html=True)
@@ -900,7 +258,6 @@ if st.session_state.page == 'home':
             st.session_state.page = 'boycott'
     
     st.markdown('</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
 
 # Section 1: Knowledge Question / Analysis
 elif st.session_state.page == 'knowledge':
@@ -915,27 +272,21 @@ elif st.session_state.page == 'knowledge':
         st.markdown("1. Set the environment variable GOOGLE_API_KEY with your Gemini API key")
         st.markdown("2. Restart the application")
     else:
-        # ChatGPT-like interface
-        st.markdown('<div class="chat-container">', unsafe_allow_html=True)
-        
-        # Display chat history
-        for message in st.session_state.chat_history:
-            if message["role"] == "user":
-                st.markdown(f"""
-                <div class="user-message">
-                    <div class="message-avatar" style="background-color: #5436DA;">👤</div>
-                    <div class="message-content">{message["content"]}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div class="assistant-message">
-                    <div class="message-avatar" style="background-color: #10a37f;">🇵🇸</div>
-                    <div class="message-content">{message["content"]}</div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        # ChatGPT-like interface; new messages are added to this container in place, without a rerun
+        chat_box = st.container()
+        
+        # Display the recent messages kept in memory, preceded by the earlier pages the user loaded from disk
+        chat_history = st.session_state.chat_history
+        with chat_box:
+            hidden_pages = max(0, chat_history.spilled_pages - st.session_state.chat_pages_shown)
+            if hidden_pages and st.button("Load earlier messages", key="chat_load_earlier"):
+                st.session_state.chat_pages_shown += 1
+                hidden_pages -= 1
+            for number in range(hidden_pages, chat_history.spilled_pages):
+                for message in chat_history.load_page(number):
+                    show_chat_message(message)
+            for message in chat_history.messages:
+                show_chat_message(message)
         
         # Input area
         question = st.text_input("Ask about Palestine:", placeholder="Example: What is the history of Palestine?", key="knowledge_input")
@@ -943,7 +294,7 @@ elif st.session_state.page == 'knowledge':
         if st.button("Send", key="knowledge_send"):
             if question:
                 # Add user message to chat history
-                st.session_state.chat_history.append({"role": "user", "content": question})
+                add_chat_message(chat_box, "user", question)
                 
                 # Check if question is related to Palestine
                 is_palestine = is_palestine_related(question)
@@ -970,10 +321,7 @@ elif st.session_state.page == 'knowledge':
                     response = generate_text_response(prompt, is_palestine)
                     
                     # Add assistant response to chat history
-                    st.session_state.chat_history.append({"role": "assistant", "content": response})
-                
-                # Rerun to update the chat display
-                st.experimental_rerun()
+                    add_chat_message(chat_box, "assistant", response)
         
         # Search sources button
         if st.button("Search Sources", key="search_sources"):
@@ -990,21 +338,18 @@ elif st.session_state.page == 'knowledge':
                         if sources:
                             sources_text = "### Reliable Sources\n\n"
                             for source in sources:
-                                sources_text += f"**{source['title']}**\n"
-                                sources_text += f"{source['snippet']}\n"
-                                sources_text += f"*{source['source']}* - [View Source]({source['url']})\n\n"
+                                sources_text += f"**{html.escape(source['title'])}**\n"
+                                sources_text += f"{html.escape(source['snippet'])}\n"
+                                sources_text += f"*{html.escape(source['source'])}*{' (' + html.escape(source['date']) + ')' if source.get('date') else ''} - [View Source]({html.escape(source['url'])})\n\n"
                             
                             # Add assistant response to chat history
-                            st.session_state.chat_history.append({"role": "assistant", "content": sources_text})
+                            add_chat_message(chat_box, "assistant", sources_text)
                         else:
                             # Add assistant response to chat history
-                            st.session_state.chat_history.append({"role": "assistant", "content": "No sources found. Try rephrasing your question."})
+                            add_chat_message(chat_box, "assistant", "No sources found. Try rephrasing your question.")
                 else:
                     # Add assistant response to chat history
-                    st.session_state.chat_history.append({"role": "assistant", "content": "Sorry, I'm trained only to answer questions about the Palestinian cause and related topics. Please ask a question related to Palestine, its history, culture, or current situation."})
-                
-                # Rerun to update the chat display
-                st.experimental_rerun()
+                    add_chat_message(chat_box, "assistant", "Sorry, I'm trained only to answer questions about the Palestinian cause and related topics. Please ask a question related to Palestine, its history, culture, or current situation.")
 
 # Section 2: Generate Awareness Image
 elif st.session_state.page == 'image':
@@ -1073,24 +418,14 @@ elif st.session_state.page == 'image':
                     with st.spinner("Generating image..."):
                         image_data, error = generate_image(image_prompt, style, theme, size)
                         if image_data:
-                            st.image(image_data, caption=image_prompt, use_column_width=True)
-                            
-                            # Add button to save image to gallery
-                            if st.button("Save to Gallery"):
-                                # Add image to gallery
-                                st.session_state.gallery.append({
-                                    "image": image_data,
-                                    "prompt": image_prompt,
-                                    "style": style,
-                                    "theme": theme
-                                })
-                                st.success("Image saved to gallery!")
-                                
-                            # Add download link
-                            st.markdown(
-                                get_image_download_link(image_data, f"palestine_image_{len(st.session_state.gallery)}.png", "Download Image"),
-                                unsafe_allow_html=True
-                            )
+                            # Keep only the digest; the bytes stay in the shared image cache
+                            st.session_state.last_image = {
+                                "digest": hashlib.sha256(image_data).hexdigest(),
+                                "prompt": image_prompt,
+                                "style": style,
+                                "theme": theme,
+                                "size": size
+                            }
                         else:
                             st.error(error or "Please enter a description to generate an image.")
                 else:
@@ -1098,21 +433,78 @@ elif st.session_state.page == 'image':
             else:
                 st.warning("Please enter a description to generate an image.")
         
+        # Show the latest generated image until a new one replaces it
+        last_image = st.session_state.get("last_image")
+        image_data = image_cache.load(last_image["digest"]) if last_image else None
+        if image_data:
+            # Downscaled JPEG for display; the original is kept for the download
+            st.image(make_display_image(image_data, last_image["size"]), caption=last_image["prompt"], use_column_width=True)
+            
+            # Add button to save image to gallery
+            if st.button("Save to Gallery"):
+                # Full image goes to the on-disk gallery store, session state keeps the id and a thumbnail
+                image_id, removed_ids = gallery_store.add(st.session_state.gallery_session_id, image_data)
+                if image_id is None:
+                    st.error("The gallery is unavailable right now, use Download Image to keep this image.")
+                else:
+                    st.session_state.gallery = [
+                        item for item in st.session_state.gallery
+                        if item["id"] not in removed_ids and item["id"] != image_id
+                    ]
+                    st.session_state.gallery.append({
+                        "id": image_id,
+                        "thumbnail": make_thumbnail(image_data),
+                        "prompt": last_image["prompt"],
+                        "style": last_image["style"],
+                        "theme": last_image["theme"]
+                    })
+                    st.success("Image saved to gallery!")
+                    if removed_ids:
+                        st.info(f"Gallery limit reached: {len(removed_ids)} older image(s) removed.")
+                
+            # Add download button
+            image_download_button(image_data, f"palestine_image_{len(st.session_state.gallery)}", "Download Image")
+        
         # Display image gallery
         if st.session_state.gallery:
             st.markdown("### Image Gallery")
             st.markdown("Here are some examples of previously generated images:")
             
+            # Button to clear gallery
+            if st.button("Clear Gallery"):
+                gallery_store.clear(st.session_state.gallery_session_id)
+                st.session_state.gallery = []
+                st.session_state.gallery_selected = None
+        
+        if st.session_state.gallery:
+            # Page through thumbnails, newest first; full images are read from disk only on request
+            gallery_items = list(reversed(st.session_state.gallery))
+            page_count = (len(gallery_items) + GALLERY_PAGE_SIZE - 1) // GALLERY_PAGE_SIZE
+            page = 1
+            if page_count > 1:
+                page = st.number_input("Gallery page", min_value=1, max_value=page_count, value=1, step=1)
+            page_items = gallery_items[(page - 1) * GALLERY_PAGE_SIZE:page * GALLERY_PAGE_SIZE]
+            
             # Display images in grid
             cols = st.columns(3)
-            for i, img_data in enumerate(st.session_state.gallery):
+            for i, item in enumerate(page_items):
                 with cols[i % 3]:
-                    st.image(img_data["image"], caption=img_data["prompt"], use_column_width=True)
+                    if item["thumbnail"]:
+                        st.image(item["thumbnail"], caption=item["prompt"], use_column_width=True)
+                    else:
+                        st.markdown(f"*{item['prompt']}*")
+                    if st.button("View full size", key=f"gallery_view_{item['id']}"):
+                        st.session_state.gallery_selected = item["id"]
             
-            # Button to clear gallery
-            if st.button("Clear Gallery"):
-                st.session_state.gallery = []
-                st.experimental_rerun()
+            selected_id = st.session_state.get("gallery_selected")
+            if selected_id:
+                full_image = gallery_store.load(st.session_state.gallery_session_id, selected_id)
+                if full_image:
+                    selected = next((item for item in st.session_state.gallery if item["id"] == selected_id), None)
+                    st.image(make_display_image(full_image, "large"), caption=selected["prompt"] if selected else None, use_column_width=True)
+                    image_download_button(full_image, f"palestine_image_{selected_id[:8]}", "Download Image", key="gallery_download")
+                else:
+                    st.warning("This image is no longer available.")
 
 # Section 3: How to Support the Palestinian Cause
 elif st.session_state.page == 'support':
@@ -1275,29 +667,36 @@ elif st.session_state.page == 'boycott':
     # Get boycott data
     boycott_data = get_boycott_data()
     
-    # Boycott categories
-    st.markdown("### Boycott Categories")
-    
-    # Category selection
-    category_options = list(boycott_data.keys())
-    category = st.selectbox(
-        "Select a category:",
-        options=category_options
-    )
-    
-    if category and category in boycott_data:
-        # Display companies in selected category
-        st.markdown(f'<div class="category-title">{category}</div>', unsafe_allow_html=True)
+    # Search by company or brand name; only the matches are rendered while a query is entered
+    company_query = st.text_input("Search for a company or brand:", placeholder="e.g. Nestlé, Coca-Cola, Zara")
+    
+    if company_query.strip():
+        matches = search_companies("boycott_summary", company_query)
+        # A brand of a boycotted company (Sprite, Garnier) is explained with its ownership path
+        ownership = lookup_brand("boycott_summary", company_query)
+        if ownership and len(ownership["path"]) > 1:
+            st.warning(f"{ownership['brand']} belongs to {' → '.join(ownership['path'][1:])}, which is on the boycott list.")
+        if not matches:
+            st.info(f"No company on this list matches \"{company_query}\".")
+        for category, company in matches:
+            st.markdown(company_card(company, category), unsafe_allow_html=True)
+    else:
+        # Boycott categories
+        st.markdown("### Boycott Categories")
+        
+        # Category selection
+        category_options = list(boycott_data.keys())
+        category = st.selectbox(
+            "Select a category:",
+            options=category_options
+        )
         
-        for company in boycott_data[category]["companies"]:
-            st.markdown(f"""
-            <div class="company-card">
-                <div class="company-name">{company['name']}</div>
-                <div class="company-reason"><strong>Boycott Reason:</strong> {company['reason']}</div>
-                <div class="company-action"><strong>Recommended Action:</strong> {company['action']}</div>
-                <div class="company-alternatives"><strong>Alternatives:</strong> {', '.join(company['alternatives'])}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        if category and category in boycott_data:
+            # Display companies in selected category
+            st.markdown(f'<div class="category-title">{category}</div>', unsafe_allow_html=True)
+            
+            for company in boycott_data[category]["companies"]:
+                st.markdown(company_card(company), unsafe_allow_html=True)
     
     st.markdown("---")
     st.markdown("""
@@ -1420,51 +819,7 @@ elif st.session_state.page == 'team':
     st.markdown("Meet the dedicated individuals behind Here Us! From the River To the Sea.")
     
     # Team members
-    team_members = [
-        {
-            "name": "Oussama Sebrou",
-            "role": "Founder & Lead Developer",
-            "bio": "Oussama is a passionate advocate for Palestinian rights and a skilled developer who created this platform to make information about Palestine more accessible.",
-            "image": "https://t4.ftcdn.net/jpg/02/15/84/43/360_F_215844325_ttX9YiIIyeaR7Ne6EaLLjMAmy4GvPC69.jpg"
-        },
-        {
-            "name": "Sarah Al-Najjar",
-            "role": "Content Director",
-            "bio": "Sarah is a Palestinian journalist and educator who oversees the content on our platform, ensuring its accuracy and educational value.",
-            "image": "https://t4.ftcdn.net/jpg/02/15/84/43/360_F_215844325_ttX9YiIIyeaR7Ne6EaLLjMAmy4GvPC69.jpg"
-        },
-        {
-            "name": "Ahmed Khalidi",
-            "role": "Research Coordinator",
-            "bio": "Ahmed is a historian specializing in Palestinian history who leads our research efforts and ensures the historical accuracy of our content.",
-            "image": "https://t4.ftcdn.net/jpg/02/15/84/43/360_F_215844325_ttX9YiIIyeaR7Ne6EaLLjMAmy4GvPC69.jpg"
-        },
-        {
-            "name": "Leila Hammad",
-            "role": "Outreach Coordinator",
-            "bio": "Leila is an activist and community organizer who manages our outreach efforts and builds partnerships with other organizations.",
-            "image": "https://t4.ftcdn.net/jpg/02/15/84/43/360_F_215844325_ttX9YiIIyeaR7Ne6EaLLjMAmy4GvPC69.jpg"
-        },
-        {
-            "name": "Karim Nasser",
-            "role": "Technical Advisor",
-            "bio": "Karim is a software engineer who provides technical guidance and helps maintain and improve our platform.",
-            "image": "https://t4.ftcdn.net/jpg/02/15/84/43/360_F_215844325_ttX9YiIIyeaR7Ne6EaLLjMAmy4GvPC69.jpg"
-        }
-    ]
-    
-    # Display team members
-    for member in team_members:
-        st.markdown(f"""
-        <div class="team-member">
-            <img src="{member['image']}" class="team-avatar" alt="{member['name']}">
-            <div class="team-info">
-                <div class="team-name">{member['name']}</div>
-                <div class="team-role">{member['role']}</div>
-                <div>{member['bio']}</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(static_html("version2_team.html"), unsafe_allow_html=True)
     
     # Join the team
     st.markdown("### Join Our Team")